@@ -29,6 +29,8 @@ It does the following steps:
 
         The POC orchestrator gets the path queue for the output and then sends a "copy" of the message to each of it's sub threaded poc generation algorthims. 
 
+    - Runs until the work has drained: each detector ends its stream with an end-of-stream marker once its threads finish, the queue adapters pass it on, and the path orchestrator ends the path stream once every detector stream has ended and its searches are done. Each stage logs a "done" line with its timing.
+
 </spec>
 """
 
@@ -41,12 +43,16 @@ from typing import Optional
 import signal
 import queue
 import threading
+import time
 
 from Graphs.CodeQL import CodeQL
+from Graphs.Snapshot import EDGE_KINDS
 from Detectors.Sources import SourcesDetector
 from Detectors.Sinks import SinksDetector
 from Detectors.Sanitizers import SanitizersDetector
+from Detectors import EndOfStream
 from Paths.Orchestrator import Orchestrator
+from Paths.StrategyRegistry import STRATEGIES, StrategyConfig
 
 
 class SyncToAsyncQueueAdapter:
@@ -65,20 +71,40 @@ class SyncToAsyncQueueAdapter:
         self.thread.start()
     
     def _run(self):
-        """Transfer items from sync queue to async queue"""
+        """Transfer items from sync queue to async queue, until the end-of-stream marker has been passed on"""
+        started_at = time.monotonic()
+        forwarded = 0
         while self.running:
             try:
                 item = self.sync_queue.get(timeout=0.1)
-                # Use asyncio.run_coroutine_threadsafe to put into async queue
-                future = asyncio.run_coroutine_threadsafe(
-                    self.async_queue.put(item),
-                    self.loop
-                )
-                future.result()  # Wait for it to complete
             except queue.Empty:
                 continue
-            except Exception as e:
-                logger.debug(f"Adapter error: {e}")
+            
+            if not isinstance(item, EndOfStream):
+                if self._forward(item):
+                    forwarded += 1
+                continue
+            
+            # The orchestrator waits for the marker, so it is retried until it is through or the adapter is stopped
+            while not self._forward(item) and self.running:
+                time.sleep(0.1)
+            logger.info(f"{item.stage.capitalize()} adapter done: {forwarded} items forwarded in "
+                        f"{time.monotonic() - started_at:.2f}s")
+            self.running = False
+    
+    def _forward(self, item) -> bool:
+        """Put an item into the async queue from this thread, returning whether it got there"""
+        try:
+            # Use asyncio.run_coroutine_threadsafe to put into async queue
+            future = asyncio.run_coroutine_threadsafe(
+                self.async_queue.put(item),
+                self.loop
+            )
+            future.result()  # Wait for it to complete
+            return True
+        except Exception as e:
+            logger.debug(f"Adapter error: {e}")
+            return False
     
     def stop(self):
         """Stop the adapter"""
@@ -93,6 +119,14 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def strategy_argument(spec: str) -> StrategyConfig:
+    """Parse a --search value such as 'dfs' or 'dfs:time=2,paths=10'"""
+    try:
+        return StrategyConfig.parse(spec)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(
@@ -106,6 +140,61 @@ def parse_arguments():
         '--build-command',
         help='Build command for compiled languages (e.g., "make", "cmake . && make")'
     )
+    parser.add_argument(
+        '--search',
+        nargs='+',
+        type=strategy_argument,
+        metavar='STRATEGY[:BUDGETS]',
+        help=f'Path search strategies to run for each source/sink pair, one of {", ".join(STRATEGIES)}, '
+             'optionally with their own budgets, e.g. "dfs:time=2,paths=10" (default: dfs)'
+    )
+    parser.add_argument(
+        '--race',
+        action='store_true',
+        help='Cancel the other strategies of a pair once one finds a witness or proves there is no path'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=8,
+        help='Maximum number of source/sink pair searches running at the same time (default: 8)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=0,
+        help='Run path searches in this many worker processes (default: 0, on the event loop)'
+    )
+    parser.add_argument(
+        '--unsanitized-only',
+        action='store_true',
+        help='Treat sanitizers as barriers and only report paths that do not go through one'
+    )
+    parser.add_argument(
+        '--edge-kinds',
+        nargs='+',
+        choices=EDGE_KINDS,
+        help='Only follow graph edges of these kinds, e.g. "data call return" for taint questions (default: every edge)'
+    )
+    parser.add_argument(
+        '--compact-chains',
+        action='store_true',
+        help='Collapse chains of single-in/single-out nodes before searching; reported paths keep every node'
+    )
+    parser.add_argument(
+        '--prefilter',
+        action='store_true',
+        help='Skip source/sink pairs that are not connected, checked for many sources at once (requires NumPy)'
+    )
+    parser.add_argument(
+        '--function-summaries',
+        action='store_true',
+        help='Step over function bodies with per-function summaries; faster, but routes through a body are reported once'
+    )
+    parser.add_argument(
+        '--summary-cache',
+        help='File to keep function summaries in, so unchanged functions are not summarized again on the next run'
+    )
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -132,6 +221,7 @@ async def main():
         logging.getLogger().setLevel(logging.DEBUG)
     
     logger.info(f"Starting AI7 Security Analysis Pipeline on: {args.repo}")
+    started_at = time.monotonic()
     
     # Create queues - sync for detectors, async for others
     sources_queue = queue.Queue()  # Sync queue for detector threads
@@ -175,9 +265,9 @@ async def main():
         
         # Start detector threads
         logger.info("Starting detector threads...")
-        sources_detector.start_threads()
-        sinks_detector.start_threads()
-        sanitizers_detector.start_threads()
+        sources_detector.start_threads(end_of_stream=True)
+        sinks_detector.start_threads(end_of_stream=True)
+        sanitizers_detector.start_threads(end_of_stream=True)
         
         # Step 3: Create async queues for orchestrator
         sources_async_queue = asyncio.Queue()
@@ -202,7 +292,16 @@ async def main():
             sink_queue=sinks_async_queue,
             sanitizer_queue=sanitizers_async_queue,
             graph=codeql,
-            path_analysis_queue=paths_queue
+            path_analysis_queue=paths_queue,
+            strategies=args.search,
+            max_concurrent_searches=args.concurrency,
+            workers=args.workers,
+            search_options={"unsanitized_only": args.unsanitized_only, "edge_kinds": args.edge_kinds},
+            function_summaries=args.function_summaries,
+            summary_cache=args.summary_cache,
+            compact_chains=args.compact_chains,
+            prefilter=args.prefilter,
+            race=args.race
         )
         
         orchestrator_task = asyncio.create_task(orchestrator.start())
@@ -211,15 +310,13 @@ async def main():
         # Step 4: Monitor paths queue for results
         logger.info("Monitoring for vulnerability paths...")
         monitor_task = asyncio.create_task(monitor_paths(paths_queue))
+        # Cancelled with the others if the orchestrator fails and never ends the path stream
+        tasks.append(monitor_task)
         
-        # Run for a limited time for testing
-        await asyncio.sleep(10)
-        logger.info("Stopping monitoring after 10 seconds...")
-        monitor_task.cancel()
-        try:
-            await monitor_task
-        except asyncio.CancelledError:
-            pass
+        # The detectors end their streams when they finish, the orchestrator ends the path stream once its searches drain
+        await orchestrator_task
+        path_count = await monitor_task
+        logger.info(f"Pipeline done: {path_count} paths in {time.monotonic() - started_at:.2f}s")
         
     except KeyboardInterrupt:
         logger.info("Received interrupt signal, shutting down...")
@@ -253,58 +350,67 @@ async def main():
 
 
 async def monitor_paths(paths_queue):
-    """Monitor the paths queue and display results"""
+    """Monitor the paths queue and display results until the end of the path stream, returning the number of paths"""
     path_count = 0
     
     try:
         while True:
-            try:
-                # Wait for path results with timeout
-                path_result = await asyncio.wait_for(paths_queue.get(), timeout=1.0)
-                
-                path_count += 1
-                logger.info(f"\n{'='*60}")
-                logger.info(f"VULNERABILITY PATH #{path_count}")
-                logger.info(f"{'='*60}")
-                
-                # Display source information
-                source = path_result.get('source', {})
-                logger.info(f"SOURCE:")
-                logger.info(f"  File: {source.get('file', 'Unknown')}")
-                logger.info(f"  Line: {source.get('line_number', 'Unknown')}")
-                logger.info(f"  Type: {source.get('pattern', 'Unknown')}")
-                logger.info(f"  Match: {source.get('match', 'Unknown')}")
-                
-                # Display sink information
-                sink = path_result.get('sink', {})
-                logger.info(f"\nSINK:")
-                logger.info(f"  File: {sink.get('file', 'Unknown')}")
-                logger.info(f"  Line: {sink.get('line_number', 'Unknown')}")
-                logger.info(f"  Type: {sink.get('pattern', 'Unknown')}")
-                logger.info(f"  Match: {sink.get('match', 'Unknown')}")
-                
-                # Display path information
-                if 'path' in path_result:
-                    logger.info(f"\nPATH LENGTH: {len(path_result['path'])} nodes")
-                
-                # Display sanitizers if any
-                if 'sanitizers' in path_result and path_result['sanitizers']:
-                    logger.info(f"\nSANITIZERS FOUND: {len(path_result['sanitizers'])}")
-                    for san in path_result['sanitizers']:
-                        logger.info(f"  - {san.get('file', 'Unknown')}:{san.get('line_number', 'Unknown')}")
-                
-                # Display confidence/severity if available
-                if 'confidence' in path_result:
-                    logger.info(f"\nCONFIDENCE: {path_result['confidence']}")
-                if 'severity' in path_result:
-                    logger.info(f"SEVERITY: {path_result['severity']}")
-                
-                logger.info(f"{'='*60}\n")
-                
-            except asyncio.TimeoutError:
-                # No new paths, continue monitoring
+            path_result = await paths_queue.get()
+            
+            # Nothing follows the end-of-stream marker, every search has finished
+            if isinstance(path_result, EndOfStream):
+                logger.info(f"Path monitoring done: {path_count} paths, path search ran {path_result.elapsed:.2f}s")
+                return path_count
+            
+            # Sanitizer discovered after the path was reported
+            if path_result.get('update'):
+                logger.info(f"SANITIZER UPDATE for path {path_result.get('fingerprint', 'Unknown')}: "
+                            f"now crosses {len(path_result.get('sanitizers_crossed', []))} sanitizer(s)")
                 continue
-                
+            
+            path_count += 1
+            logger.info(f"\n{'='*60}")
+            logger.info(f"VULNERABILITY PATH #{path_count}")
+            logger.info(f"{'='*60}")
+            
+            # Display source information
+            source = path_result.get('source', {})
+            logger.info(f"SOURCE:")
+            logger.info(f"  File: {source.get('file', 'Unknown')}")
+            logger.info(f"  Line: {source.get('line_number', 'Unknown')}")
+            logger.info(f"  Type: {source.get('pattern', 'Unknown')}")
+            logger.info(f"  Match: {source.get('match', 'Unknown')}")
+            
+            # Display sink information
+            sink = path_result.get('sink', {})
+            logger.info(f"\nSINK:")
+            logger.info(f"  File: {sink.get('file', 'Unknown')}")
+            logger.info(f"  Line: {sink.get('line_number', 'Unknown')}")
+            logger.info(f"  Type: {sink.get('pattern', 'Unknown')}")
+            logger.info(f"  Match: {sink.get('match', 'Unknown')}")
+            
+            # Display path information
+            if 'path' in path_result:
+                logger.info(f"\nPATH LENGTH: {len(path_result['path'])} nodes")
+            if 'chop' in path_result:
+                chop = path_result['chop']
+                logger.info(f"CHOP: {len(chop['nodes'])} nodes, {len(chop['edges'])} edges, "
+                            f"{len(chop['sanitizers'])} sanitizer(s)")
+            
+            # Display sanitizers if any
+            if 'sanitizers' in path_result and path_result['sanitizers']:
+                logger.info(f"\nSANITIZERS FOUND: {len(path_result['sanitizers'])}")
+                for san in path_result['sanitizers']:
+                    logger.info(f"  - {san.get('file', 'Unknown')}:{san.get('line_number', 'Unknown')}")
+            
+            # Display confidence/severity if available
+            if 'confidence' in path_result:
+                logger.info(f"\nCONFIDENCE: {path_result['confidence']}")
+            if 'severity' in path_result:
+                logger.info(f"SEVERITY: {path_result['severity']}")
+            
+            logger.info(f"{'='*60}\n")
+    
     except asyncio.CancelledError:
         logger.info(f"Path monitoring stopped. Total paths found: {path_count}")
         raise
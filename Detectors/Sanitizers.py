@@ -19,6 +19,7 @@ from DetectorTools.RegexDetector import RegexDetector
 
 class SanitizersDetector(Detector):
     """Detector for identifying sanitizers in code"""
+    stage = "sanitizers"
     
     def __init__(self, queue, repo):
         super().__init__(queue, repo)
@@ -19,6 +19,7 @@ from DetectorTools.RegexDetector import RegexDetector
 
 class SinksDetector(Detector):
     """Detector for identifying sinks in code"""
+    stage = "sinks"
     
     def __init__(self, queue, repo):
         super().__init__(queue, repo)
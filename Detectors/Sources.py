@@ -19,6 +19,7 @@ from DetectorTools.RegexDetector import RegexDetector
 
 class SourcesDetector(Detector):
     """Detector for identifying sources in code"""
+    stage = "sources"
     
     def __init__(self, queue, repo):
         super().__init__(queue, repo)
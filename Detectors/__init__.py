@@ -9,39 +9,103 @@ The goal is to have all common logic in the parent class, this way each child cl
 The class is initialized with an async queue item and a path to the repo being scanned.
 
 As results come in this class will be parsed and then sent over the async queue with whatever meta data that makes sense.
+
+When asked to (start_threads(end_of_stream=True)), the detector puts an EndOfStream marker on the queue once all of its threads have finished, so whatever reads the queue knows nothing more is coming instead of waiting on a timeout. The marker carries the stage name and how long the detector ran, and is the last item the detector puts on the queue.
 </spec>
 """
 
 import os
 import threading
+import time
+import logging
 from abc import ABC, abstractmethod
 
+logger = logging.getLogger(__name__)
+
+
+class EndOfStream:
+    """
+    Marker put on a queue after the last item of a stream
+    """
+    def __init__(self, stage, elapsed, items=None):
+        """
+        Initialize an end-of-stream marker
+        
+        Args:
+            stage: Name of the stage that produced the stream (sources, sinks, sanitizers, paths)
+            elapsed: Seconds the stage ran for
+            items: Number of items the stage produced, if it knows
+        """
+        self.stage = stage
+        self.elapsed = elapsed
+        self.items = items
+
+    def __repr__(self):
+        return f"EndOfStream({self.stage!r}, elapsed={self.elapsed:.2f}, items={self.items})"
+
 
 class Detector(ABC):
     """
     Abstract class for detectors
     """
+    # Name of the stream the detector produces, used in its end-of-stream marker
+    stage = "detections"
+
     def __init__(self, queue, repo):
         self.queue = queue
         self.repo = repo
+        self._started_at = None
+        self._running_threads = 0
+        self._lock = threading.Lock()
 
     def _thread_regex(self):
         """create and use the DetectorTools/RegexDetector tool here against self.repo"""
         pass
 
-    def start_threads(self):
-        """Goes through each '_thread_' method and starts that thread"""
+    def start_threads(self, end_of_stream=False):
+        """
+        Goes through each '_thread_' method and starts that thread
+        
+        Args:
+            end_of_stream: Put an EndOfStream marker on the queue once every thread has finished
+        """
         threads = []
+        methods = [
+            getattr(self, attr_name) for attr_name in dir(self)
+            if attr_name.startswith('_thread_') and callable(getattr(self, attr_name))
+        ]
         
-        for attr_name in dir(self):
-            if attr_name.startswith('_thread_'):
-                method = getattr(self, attr_name)
-                if callable(method):
-                    thread = threading.Thread(target=method)
-                    thread.start()
-                    threads.append(thread)
+        self._started_at = time.monotonic()
+        self._running_threads = len(methods)
+        if end_of_stream and not methods:
+            self._end_stream()
+        
+        for method in methods:
+            if end_of_stream:
+                thread = threading.Thread(target=self._run_thread, args=(method,))
+            else:
+                thread = threading.Thread(target=method)
+            thread.start()
+            threads.append(thread)
         
         return threads
+
+    def _run_thread(self, method):
+        """Run a thread method, ending the stream after the last thread finishes (even if it failed)"""
+        try:
+            method()
+        finally:
+            with self._lock:
+                self._running_threads -= 1
+                last = self._running_threads == 0
+            if last:
+                self._end_stream()
+
+    def _end_stream(self):
+        """Put the end-of-stream marker on the queue"""
+        elapsed = time.monotonic() - self._started_at
+        logger.info(f"{self.stage.capitalize()} detector done in {elapsed:.2f}s")
+        self.queue.put(EndOfStream(self.stage, elapsed))
     
     def _get_all_files(self, extensions=None):
         """Helper method to get all files in the repo"""
@@ -0,0 +1,263 @@
+"""
+<spec>
+A view of a code graph with its linear chains collapsed into single edges.
+
+Data-flow graphs are full of nodes with exactly one edge in and one edge out (assignments, copies, casts). They add depth to every path without adding any branching. Such nodes are chain nodes: the view steps over them, so `get_neighbors(node)` returns the first node past each chain and every chain becomes one super-edge. The nodes a super-edge stands for are kept per (from, to) pair, and `expand` puts them back so reported paths hold the original node IDs.
+
+Chains are only collapsed over edges of the same kind, and never over call or return edges with a call site label, so edge kind filtering and call/return matching keep working on the view. A super-edge must say which way was taken, so chains that end at the same node as another edge of their start node are not collapsed; they are walked node by node.
+
+Sources, sinks and sanitizers must stay visible: a search has to stop at them and check them. Nodes are protected with `protect` (searches protect their source and sink, the orchestrator every sanitizer as it arrives); protecting a chain node splits its chain, and the collapsed adjacency is rebuilt lazily. Super-edges already handed out stay valid, so paths found before the split still expand correctly. Every split bumps `version` and is recorded in `splits`, so anything built from the view (such as a reachability table, which would not list the newly visible node) can tell it is out of date. Only what was built from the start of the split chain (see `chain_start`) stepped over the node, so the rest can be kept.
+
+The view offers the same `nodes` / `get_neighbors` / `get_predecessors` interface as the graph, so searches run on it unchanged. Chain nodes that are stepped over are not listed as predecessors.
+
+# Input
+ - graph object (CodeQL, or anything with `nodes` and `get_neighbors`)
+ - nodes that must stay visible (via protect)
+
+# Output
+ - collapsed neighbor and predecessor lookups
+ - paths with the collapsed chains put back (via expand)
+ - statistics: chain nodes, super-edges, protected nodes
+</spec>
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+
+class ChainCompaction:
+    def __init__(self, graph: Any):
+        """
+        Initialize the collapsed view of a graph
+        
+        Args:
+            graph: Graph object with nodes and edges
+        """
+        self.graph = graph
+        self.nodes = graph.nodes
+        self.protected: Set[Any] = set()
+        
+        # Nodes with one edge in and one edge out of the same kind, found on first use
+        self._chain_nodes: Optional[Set[Any]] = None
+        self._successor: Dict[Any, Any] = {}
+        self._previous: Dict[Any, Any] = {}
+        
+        # (from, to) -> nodes stepped over, and the kind of the edges along the chain
+        self.chains: Dict[Tuple[Any, Any], List[Any]] = {}
+        self._kinds: Dict[Tuple[Any, Any], Optional[str]] = {}
+        
+        # Collapsed adjacency, rebuilt after a chain node is protected
+        self._neighbors: Dict[Any, List[Any]] = {}
+        self._predecessors: Optional[Dict[Any, List[Any]]] = None
+        
+        # Bumped whenever protecting a node changes the view, with the chain nodes that were split in that order
+        self.version = 0
+        self.splits: List[Any] = []
+    
+    def get_neighbors(self, node_id: Any, kinds: Optional[Iterable[str]] = None) -> List[Any]:
+        """
+        Return the nodes node_id has an edge or a super-edge to
+        
+        Args:
+            node_id: Node ID
+            kinds: Only follow edges of these kinds, plus untyped edges (None for every edge)
+        """
+        neighbors = self._neighbors.get(node_id)
+        if neighbors is None:
+            neighbors = self._collapse(node_id)
+            self._neighbors[node_id] = neighbors
+        if kinds is None:
+            return neighbors
+        return self._filter(node_id, neighbors, frozenset(kinds))
+    
+    def get_predecessors(self, node_id: Any, kinds: Optional[Iterable[str]] = None) -> List[Any]:
+        """
+        Return the visible nodes with an edge or a super-edge to node_id
+        
+        Args:
+            node_id: Node ID
+            kinds: Only follow edges of these kinds, plus untyped edges (None for every edge)
+        """
+        if self._predecessors is None:
+            self._build_predecessors()
+        predecessors = self._predecessors.get(node_id, [])
+        if kinds is None:
+            return predecessors
+        selected = frozenset(kinds)
+        return [p for p in predecessors if node_id in self._filter(p, [node_id], selected)]
+    
+    def get_edge_kind(self, node_id: Any, neighbor_id: Any) -> Optional[str]:
+        """Return the kind of the edge or super-edge from node_id to neighbor_id, or None if it is untyped"""
+        key = (node_id, neighbor_id)
+        if key in self._kinds:
+            return self._kinds[key]
+        return self._edge_kind(node_id, neighbor_id)
+    
+    def get_edge_label(self, node_id: Any, neighbor_id: Any) -> Optional[Tuple[str, Any]]:
+        """Return the call/return label of an edge; super-edges never carry one"""
+        if (node_id, neighbor_id) in self.chains:
+            return None
+        return self._edge_label(node_id, neighbor_id)
+    
+    def expand(self, path: List[Any]) -> List[Any]:
+        """
+        Put the collapsed chains back into a path
+        
+        Args:
+            path: Path over the collapsed view
+        
+        Returns:
+            The same path over the original graph
+        """
+        if not path:
+            return path
+        
+        expanded = [path[0]]
+        for node, following in zip(path, path[1:]):
+            chain = self.chains.get((node, following))
+            if chain:
+                expanded.extend(chain)
+            expanded.append(following)
+        return expanded
+    
+    def protect(self, node_id: Any):
+        """
+        Keep a node visible: chains are split at it and it is never stepped over
+        
+        Args:
+            node_id: Node ID (None is ignored)
+        """
+        if node_id is None or node_id in self.protected:
+            return
+        self.protected.add(node_id)
+        
+        if self._chain_nodes is not None and node_id in self._chain_nodes:
+            self._neighbors.clear()
+            self._predecessors = None
+            self.splits.append(node_id)
+            self.version += 1
+    
+    def chain_start(self, node_id: Any) -> Any:
+        """
+        Return the node a chain running through node_id is entered from
+        
+        A chain node has one edge in, so a walk can only step over it after expanding the visible node its chain
+        starts at; nothing that did not expand that node has stepped over node_id.
+        
+        Args:
+            node_id: Chain node ID
+        
+        Returns:
+            The first node before node_id that is not stepped over (node_id itself if it is not a chain node)
+        """
+        if self._chain_nodes is None:
+            self._index()
+        
+        current = node_id
+        while current in self._chain_nodes:
+            current = self._previous[current]
+            if current not in self._chain_nodes or current in self.protected or current == node_id:
+                break
+        return current
+    
+    def stats(self) -> Dict[str, int]:
+        """Return how much of the graph is collapsed"""
+        return {
+            "chain_nodes": len(self._chain_nodes) if self._chain_nodes is not None else 0,
+            "super_edges": len(self.chains),
+            "protected": len(self.protected)
+        }
+    
+    def _index(self):
+        """Find the chain nodes: one edge in, one edge out, both of the same kind and without a call site label"""
+        in_degree: Dict[Any, int] = {}
+        predecessor: Dict[Any, Any] = {}
+        for node_id in self.nodes:
+            for neighbor in self.graph.get_neighbors(node_id):
+                in_degree[neighbor] = in_degree.get(neighbor, 0) + 1
+                predecessor[neighbor] = node_id
+        
+        self._chain_nodes = set()
+        for node_id in self.nodes:
+            neighbors = self.graph.get_neighbors(node_id)
+            if in_degree.get(node_id) != 1 or len(neighbors) != 1 or neighbors[0] == node_id:
+                continue
+            
+            previous, following = predecessor[node_id], neighbors[0]
+            if self._edge_label(previous, node_id) or self._edge_label(node_id, following):
+                continue
+            if self._edge_kind(previous, node_id) != self._edge_kind(node_id, following):
+                continue
+            
+            self._chain_nodes.add(node_id)
+            self._successor[node_id] = following
+            self._previous[node_id] = previous
+    
+    def _collapse(self, node_id: Any) -> List[Any]:
+        """Return node_id's neighbors with every chain after them stepped over"""
+        if self._chain_nodes is None:
+            self._index()
+        
+        walks = []
+        for first in self.graph.get_neighbors(node_id):
+            # A chain can only be entered at its first node, so the walk ends before coming back around
+            chain = []
+            current = first
+            while current in self._chain_nodes and current not in self.protected and current != node_id:
+                chain.append(current)
+                current = self._successor[current]
+            walks.append((first, chain, current))
+        
+        ends: Dict[Any, int] = {}
+        for _, _, end in walks:
+            ends[end] = ends.get(end, 0) + 1
+        
+        neighbors = []
+        for first, chain, end in walks:
+            key = (node_id, end)
+            if not chain or ends[end] > 1 or self.chains.get(key, chain) != chain:
+                # Nothing to step over, or the super-edge would not say which way was taken
+                neighbors.append(first)
+                continue
+            
+            self.chains[key] = chain
+            self._kinds[key] = self._edge_kind(node_id, first)
+            neighbors.append(end)
+        return neighbors
+    
+    def _build_predecessors(self):
+        """Index the predecessors of the visible nodes from the collapsed adjacency"""
+        if self._chain_nodes is None:
+            self._index()
+        
+        self._predecessors = {}
+        pending = [node_id for node_id in self.nodes if node_id not in self._chain_nodes or node_id in self.protected]
+        seen = set(pending)
+        while pending:
+            node_id = pending.pop()
+            for neighbor in self.get_neighbors(node_id):
+                self._predecessors.setdefault(neighbor, []).append(node_id)
+                # A chain node that was not stepped over is visible after all
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    pending.append(neighbor)
+    
+    def _filter(self, node_id: Any, neighbors: List[Any], kinds: FrozenSet[str]) -> List[Any]:
+        """Keep the neighbors reached over an edge of one of the kinds, or an untyped edge"""
+        selected = []
+        for neighbor in neighbors:
+            kind = self.get_edge_kind(node_id, neighbor)
+            if kind is None or kind in kinds:
+                selected.append(neighbor)
+        return selected
+    
+    def _edge_kind(self, node_id: Any, neighbor_id: Any) -> Optional[str]:
+        """Return the kind the graph reports for an edge, or None if it reports none"""
+        get_edge_kind = getattr(self.graph, 'get_edge_kind', None)
+        kind = get_edge_kind(node_id, neighbor_id) if get_edge_kind is not None else None
+        return kind if isinstance(kind, str) else None
+    
+    def _edge_label(self, node_id: Any, neighbor_id: Any) -> Optional[Tuple[str, Any]]:
+        """Return the call/return label the graph reports for an edge, or None if it has none"""
+        get_edge_label = getattr(self.graph, 'get_edge_label', None)
+        label = get_edge_label(node_id, neighbor_id) if get_edge_label is not None else None
+        return label if isinstance(label, tuple) else None
@@ -0,0 +1,270 @@
+"""
+<spec>
+A read-only, compact copy of a code graph that can be shared between processes.
+
+Any graph object exposing `nodes` (node ID -> node data) and `get_neighbors(node_id)` can be materialized into a snapshot. The edges are stored in compressed sparse row (CSR) form: node i's neighbors are `targets[offsets[i]:offsets[i + 1]]`, with nodes referred to by integer index. The snapshot itself offers the same `nodes` / `get_neighbors` interface, so the path searches run on it unchanged.
+
+Every edge also carries a kind: data-flow, control-flow, call or return. Graphs that know the kind of their edges expose `get_edge_kind(node_id, neighbor_id)`, and graphs that label call and return edges with their call site expose `get_edge_label(node_id, neighbor_id)` (see Paths/ContextSensitiveSearch.py); edges of graphs without either are stored untyped. Kinds are one byte per edge next to `targets`, so neighbor and predecessor lookups can be restricted to some kinds without touching the other edges. Untyped edges are never filtered out, since nothing rules them out.
+
+Snapshots are written to a single file and loaded back with `mmap`. Worker processes map the same file, so the operating system shares one copy of the graph between all of them and nothing is pickled per task.
+
+# File layout
+ - header: node count, edge count, metadata length (3 x int64)
+ - offsets: (node count + 1) x int64
+ - targets: edge count x int64
+ - kinds: edge count x int8 (0 for untyped, else 1 + index in EDGE_KINDS)
+ - metadata: JSON with the node IDs and node data, in index order, and the call site of each labelled edge
+</spec>
+"""
+
+import json
+import mmap
+import struct
+from array import array
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+HEADER = struct.Struct('<qqq')
+ITEM_SIZE = 8
+
+# Edge kinds a graph may report, stored as 1 + their index (0 is untyped)
+EDGE_KINDS = ("data", "control", "call", "return")
+KIND_CODES = {kind: i + 1 for i, kind in enumerate(EDGE_KINDS)}
+
+
+class GraphSnapshot:
+    def __init__(self, node_ids: List[Any], node_data: List[Dict[str, Any]],
+                 offsets: Any, targets: Any, kinds: Optional[Any] = None,
+                 sites: Optional[Dict[int, Any]] = None):
+        """
+        Initialize a snapshot from CSR arrays
+        
+        Args:
+            node_ids: Node ID of each node index
+            node_data: Node data of each node index
+            offsets: Sequence of node count + 1 integers into targets
+            targets: Sequence of neighbor node indexes
+            kinds: Kind code of each edge, parallel to targets (None for all untyped)
+            sites: Edge position in targets -> call site, for labelled call and return edges
+        """
+        self.node_ids = node_ids
+        self.offsets = offsets
+        self.targets = targets
+        self.kinds = kinds if kinds is not None else array('b', bytes(len(targets)))
+        self.sites: Dict[int, Any] = sites or {}
+        self.index: Dict[Any, int] = {node_id: i for i, node_id in enumerate(node_ids)}
+        self.nodes: Dict[Any, Dict[str, Any]] = dict(zip(node_ids, node_data))
+        
+        # Reverse CSR with the kind of each reversed edge, only built if something asks for predecessors
+        self._reverse_offsets: Optional[array] = None
+        self._reverse_targets: Optional[array] = None
+        self._reverse_kinds: Optional[array] = None
+        
+        self._mmap: Optional[mmap.mmap] = None
+        self._file = None
+    
+    @classmethod
+    def from_graph(cls, graph: Any) -> 'GraphSnapshot':
+        """
+        Materialize any graph object into a snapshot
+        
+        Args:
+            graph: Graph object with nodes and get_neighbors
+        
+        Returns:
+            GraphSnapshot holding the same nodes and edges
+        """
+        node_ids = list(graph.nodes.keys())
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        get_edge_kind = getattr(graph, 'get_edge_kind', None)
+        get_edge_label = getattr(graph, 'get_edge_label', None)
+        
+        offsets = array('q', [0])
+        targets = array('q')
+        kinds = array('b')
+        sites: Dict[int, Any] = {}
+        for node_id in node_ids:
+            for neighbor in graph.get_neighbors(node_id):
+                # Edges to nodes the graph does not list are dropped
+                if neighbor not in index:
+                    continue
+                
+                kind = get_edge_kind(node_id, neighbor) if get_edge_kind is not None else None
+                label = get_edge_label(node_id, neighbor) if get_edge_label is not None else None
+                if isinstance(label, tuple):
+                    kind = label[0]
+                    sites[len(targets)] = label[1]
+                
+                targets.append(index[neighbor])
+                kinds.append(KIND_CODES.get(kind, 0) if isinstance(kind, str) else 0)
+            offsets.append(len(targets))
+        
+        return cls(node_ids, [graph.nodes[node_id] for node_id in node_ids], offsets, targets, kinds, sites)
+    
+    def save(self, path: str):
+        """
+        Write the snapshot to a file that can be memory mapped by load()
+        
+        Args:
+            path: File to write
+        """
+        metadata = json.dumps({
+            'node_ids': self.node_ids,
+            'node_data': [self.nodes[node_id] for node_id in self.node_ids],
+            'sites': [[position, site] for position, site in self.sites.items()]
+        }, default=str).encode('utf-8')
+        
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(len(self.node_ids), len(self.targets), len(metadata)))
+            f.write(array('q', self.offsets).tobytes())
+            f.write(array('q', self.targets).tobytes())
+            f.write(array('b', self.kinds).tobytes())
+            f.write(metadata)
+    
+    @classmethod
+    def load(cls, path: str) -> 'GraphSnapshot':
+        """
+        Memory map a snapshot written by save()
+        
+        Args:
+            path: Snapshot file
+        
+        Returns:
+            GraphSnapshot whose edge arrays are views into the mapped file
+        """
+        f = open(path, 'rb')
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        node_count, edge_count, metadata_length = HEADER.unpack_from(mapped, 0)
+        
+        view = memoryview(mapped)
+        start = HEADER.size
+        offsets = view[start:start + (node_count + 1) * ITEM_SIZE].cast('q')
+        start += (node_count + 1) * ITEM_SIZE
+        targets = view[start:start + edge_count * ITEM_SIZE].cast('q')
+        start += edge_count * ITEM_SIZE
+        kinds = view[start:start + edge_count].cast('b')
+        start += edge_count
+        metadata = json.loads(bytes(view[start:start + metadata_length]).decode('utf-8'))
+        
+        sites = {position: site for position, site in metadata['sites']}
+        snapshot = cls(metadata['node_ids'], metadata['node_data'], offsets, targets, kinds, sites)
+        snapshot._mmap = mapped
+        snapshot._file = f
+        return snapshot
+    
+    def close(self):
+        """Release the memory mapping of a loaded snapshot"""
+        if self._mmap is None:
+            return
+        if isinstance(self.offsets, memoryview):
+            self.offsets.release()
+            self.targets.release()
+            self.kinds.release()
+        self._mmap.close()
+        self._file.close()
+        self._mmap = None
+        self._file = None
+    
+    def get_neighbors(self, node_id: Any, kinds: Optional[Iterable[str]] = None) -> List[Any]:
+        """
+        Return the IDs of the nodes node_id has an edge to
+        
+        Args:
+            node_id: Node ID
+            kinds: Only follow edges of these kinds, plus untyped edges (None for every edge)
+        """
+        i = self.index.get(node_id)
+        if i is None:
+            return []
+        begin, end = self.offsets[i], self.offsets[i + 1]
+        if kinds is None:
+            return [self.node_ids[t] for t in self.targets[begin:end]]
+        
+        codes = _kind_codes(kinds)
+        return [
+            self.node_ids[t]
+            for t, code in zip(self.targets[begin:end], self.kinds[begin:end])
+            if code in codes
+        ]
+    
+    def get_predecessors(self, node_id: Any, kinds: Optional[Iterable[str]] = None) -> List[Any]:
+        """
+        Return the IDs of the nodes with an edge to node_id
+        
+        Args:
+            node_id: Node ID
+            kinds: Only follow edges of these kinds, plus untyped edges (None for every edge)
+        """
+        i = self.index.get(node_id)
+        if i is None:
+            return []
+        if self._reverse_offsets is None:
+            self._build_reverse()
+        begin, end = self._reverse_offsets[i], self._reverse_offsets[i + 1]
+        if kinds is None:
+            return [self.node_ids[s] for s in self._reverse_targets[begin:end]]
+        
+        codes = _kind_codes(kinds)
+        return [
+            self.node_ids[s]
+            for s, code in zip(self._reverse_targets[begin:end], self._reverse_kinds[begin:end])
+            if code in codes
+        ]
+    
+    def get_edge_kind(self, node_id: Any, neighbor_id: Any) -> Optional[str]:
+        """Return the kind of the edge from node_id to neighbor_id, or None if it is untyped or missing"""
+        position = self._edge_position(node_id, neighbor_id)
+        if position is None or not self.kinds[position]:
+            return None
+        return EDGE_KINDS[self.kinds[position] - 1]
+    
+    def get_edge_label(self, node_id: Any, neighbor_id: Any) -> Optional[Tuple[str, Any]]:
+        """Return (kind, call site) for a labelled call or return edge, or None for any other edge"""
+        position = self._edge_position(node_id, neighbor_id)
+        if position is None or position not in self.sites:
+            return None
+        return EDGE_KINDS[self.kinds[position] - 1], self.sites[position]
+    
+    def _edge_position(self, node_id: Any, neighbor_id: Any) -> Optional[int]:
+        """Return the position of the edge from node_id to neighbor_id in targets, or None if there is none"""
+        i = self.index.get(node_id)
+        j = self.index.get(neighbor_id)
+        if i is None or j is None:
+            return None
+        for position in range(self.offsets[i], self.offsets[i + 1]):
+            if self.targets[position] == j:
+                return position
+        return None
+    
+    def _build_reverse(self):
+        """Build the reverse CSR arrays with a counting sort over the edge targets"""
+        node_count = len(self.node_ids)
+        counts = [0] * (node_count + 1)
+        for t in self.targets:
+            counts[t + 1] += 1
+        for i in range(node_count):
+            counts[i + 1] += counts[i]
+        
+        reverse_offsets = array('q', counts)
+        reverse_targets = array('q', bytes(ITEM_SIZE * len(self.targets)))
+        reverse_kinds = array('b', bytes(len(self.targets)))
+        position = list(counts[:-1])
+        for s in range(node_count):
+            for edge in range(self.offsets[s], self.offsets[s + 1]):
+                t = self.targets[edge]
+                reverse_targets[position[t]] = s
+                reverse_kinds[position[t]] = self.kinds[edge]
+                position[t] += 1
+        
+        self._reverse_offsets = reverse_offsets
+        self._reverse_targets = reverse_targets
+        self._reverse_kinds = reverse_kinds
+
+
+def _kind_codes(kinds: Iterable[str]) -> FrozenSet[int]:
+    """Return the codes of the given edge kinds, plus the code of untyped edges"""
+    codes = {0}
+    for kind in kinds:
+        if kind not in KIND_CODES:
+            raise ValueError(f"Unknown edge kind: {kind}. Must be one of {', '.join(EDGE_KINDS)}")
+        codes.add(KIND_CODES[kind])
+    return frozenset(codes)
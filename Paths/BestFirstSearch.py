@@ -0,0 +1,177 @@
+"""
+<spec>
+#Input
+ - source
+ - sink
+ - list of all the sanitizers
+ - Graph object (CodeQL)
+ - path analysis async queue
+ - optional limits: maximum depth, maximum number of paths, wall-clock budget
+ - optional unsanitized only mode (sanitizers are barriers)
+ - optional edge kinds to follow (e.g. data-flow and call edges only)
+ - shared function index, for call-graph distances (optional)
+
+#Output
+ - (via queue) Code path information, paths through code close to the sink first
+
+#Algorthim
+Depth first search dives into whatever branch comes first, however far from the sink it leads. This search keeps its partial paths in a priority queue and always extends the most promising one, ordered by its length plus a code locality estimate of how far its last node is from the sink:
+
+ - call-graph distance: the number of function boundaries between the node's function and the sink's function (from the shared function index, when nodes carry a 'function' key)
+ - whether the node is in the sink's file
+ - the line distance to the sink within the same file
+
+The estimate is a guide, not a bound, so paths do not come out strictly shortest first; short witnesses near the sink come out early, which is what a time-boxed search needs. Given enough time every simple path is still found, as with depth first search.
+
+Partial paths are records with a parent pointer, as in breadth first search. Partial paths ending at a node the shared reachability memo knows cannot reach the sink are dropped, and the nodes of every path found are added to the memo.
+
+</spec>
+"""
+
+import asyncio
+import heapq
+from typing import Dict, List, Any, Optional, Iterator, Tuple, Union
+
+from Paths.BreadthFirstSearch import BreadthFirstSearch
+from Paths.FunctionSummaries import FunctionSummaries, FUNCTION_KEY
+from Paths.SanitizerLog import SanitizerView
+
+
+class BestFirstSearch(BreadthFirstSearch):
+    name = "BEST"
+    
+    # Resources the orchestrator shares between every search of this kind
+    shared_resources = ("reach_memo", "summaries", "functions")
+    
+    # Estimate weights, in edges: crossing one function boundary, leaving the sink's file, and the largest line distance
+    call_weight = 4.0
+    file_weight = 2.0
+    line_weight = 1.0
+    
+    # Line distance at which the line term reaches line_weight
+    line_scale = 100
+    
+    def __init__(self, source: Dict[str, Any], sink: Dict[str, Any],
+                 sanitizers: Union[List[Dict[str, Any]], SanitizerView], graph: Any,
+                 path_analysis_queue: asyncio.Queue,
+                 functions: Optional[FunctionSummaries] = None,
+                 **options):
+        """
+        Initialize best-first path finder
+        
+        Args:
+            source: Source node information with 'line_number' key
+            sink: Sink node information with 'line_number' key
+            sanitizers: List of sanitizer nodes with 'line_number' keys, or a view of the sanitizer log
+            graph: Graph object with nodes and edges
+            path_analysis_queue: Async queue to put found paths
+            functions: Shared function index the call-graph distances come from
+            **options: Search limits, time slicing settings and shared resources, see PathSearch
+        """
+        super().__init__(source, sink, sanitizers, graph, path_analysis_queue, **options)
+        
+        # Distances only order the queue, so they are used even when the search may not step over function bodies
+        self.functions = functions
+        self._estimates: Dict[str, float] = {}
+        self._call_distances: Dict[Any, int] = {}
+        self._unreachable_distance = 1
+    
+    def _search(self, start: str, target: str) -> Iterator[Optional[List[str]]]:
+        """
+        Best-first search yielding every simple path from start to target, most promising first
+        
+        Args:
+            start: Node ID to start from
+            target: Node ID to reach
+        
+        Yields:
+            Paths (lists of node IDs), or None at checkpoints
+        """
+        if start == target:
+            yield [start]
+            return
+        
+        target_data = self.graph.nodes.get(target, {})
+        target_function = target_data.get(FUNCTION_KEY)
+        if target_function is not None and self.functions is not None:
+            self._call_distances = self.functions.distances_to(target_function)
+            # Functions that cannot flow into the sink's function count as further than any that can
+            self._unreachable_distance = max(self._call_distances.values()) + 1
+        
+        # Partial path records: node, index of the parent record (-1 for the root) and depth in edges
+        nodes: List[str] = [start]
+        parents: List[int] = [-1]
+        depths: List[int] = [0]
+        
+        # (priority, record) - records are numbered in creation order, which breaks ties stably
+        queue: List[Tuple[float, int]] = [(self._estimate(start, target_data), 0)]
+        
+        while queue:
+            if self._out_of_time():
+                return
+            
+            _, record = heapq.heappop(queue)
+            current = nodes[record]
+            
+            if self._tick():
+                yield None
+            
+            if self.max_depth is not None and depths[record] >= self.max_depth:
+                self.truncated = True
+                continue
+            
+            for neighbor in self._next_nodes(current):
+                if self._on_path(neighbor, record, nodes, parents):
+                    continue
+                
+                if neighbor == target:
+                    path = self._rebuild_path(record, nodes, parents) + [neighbor]
+                    if self.reach_memo is not None:
+                        for node in path:
+                            self.reach_memo.record(node, target, True)
+                    yield path
+                    continue
+                
+                # Another search already showed nothing below this node reaches the target
+                if self._known_dead_end(neighbor, target):
+                    continue
+                
+                nodes.append(neighbor)
+                parents.append(record)
+                depths.append(depths[record] + 1)
+                priority = depths[-1] + self._estimate(neighbor, target_data)
+                heapq.heappush(queue, (priority, len(nodes) - 1))
+    
+    def _estimate(self, node: str, target_data: Dict[str, Any]) -> float:
+        """
+        Estimate how far node is from the sink from where the two sit in the code
+        
+        Args:
+            node: Node ID
+            target_data: Node data of the sink
+        
+        Returns:
+            Estimated distance in edges (0 for a node next to the sink in the same function)
+        """
+        estimate = self._estimates.get(node)
+        if estimate is not None:
+            return estimate
+        
+        data = self.graph.nodes.get(node, {})
+        estimate = 0.0
+        
+        target_function = target_data.get(FUNCTION_KEY)
+        function = data.get(FUNCTION_KEY)
+        if target_function is not None and function != target_function:
+            distance = self._call_distances.get(function, self._unreachable_distance)
+            estimate += self.call_weight * distance
+        
+        if data.get('file') != target_data.get('file'):
+            estimate += self.file_weight
+        else:
+            line, target_line = data.get('line'), target_data.get('line')
+            if isinstance(line, int) and isinstance(target_line, int):
+                estimate += self.line_weight * min(abs(line - target_line), self.line_scale) / self.line_scale
+        
+        self._estimates[node] = estimate
+        return estimate
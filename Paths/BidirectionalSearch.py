@@ -0,0 +1,136 @@
+"""
+<spec>
+#Input
+ - source
+ - sink
+ - list of all the sanitizers
+ - Graph object (CodeQL)
+ - path analysis async queue
+ - optional limits: maximum depth, wall-clock budget
+ - optional unsanitized only mode (sanitizers are barriers)
+ - optional edge kinds to follow (e.g. data-flow and call edges only)
+
+#Output
+ - (via queue) A single shortest witness path, if the sink is reachable
+
+#Algorthim
+Two breadth first searches run towards each other: one forward from the source following edges, one backward from the sink following predecessor lookups. They take turns expanding a whole level, always growing the smaller frontier, until a node is reached by both. The witness is rebuilt from the forward parent pointers (source to meeting node) and the backward parent pointers (meeting node to sink).
+
+Each side only needs to go about half the depth, so the explored space grows like branching^(depth/2) instead of branching^depth.
+
+</spec>
+"""
+
+from typing import Dict, List, Optional, Iterator, Callable, Iterable, Generator, Tuple
+
+from Paths import PathSearch
+
+
+class BidirectionalSearch(PathSearch):
+    name = "BIDI"
+    
+    # Resources the orchestrator shares between every search of this kind
+    shared_resources = ("predecessors",)
+    
+    def _search(self, start: str, target: str) -> Iterator[Optional[List[str]]]:
+        """
+        Meet-in-the-middle search yielding one shortest path from start to target
+        
+        Args:
+            start: Node ID to start from
+            target: Node ID to reach
+        
+        Yields:
+            The shortest path (list of node IDs) if one exists, or None at checkpoints
+        """
+        if start == target:
+            yield [start]
+            return
+        
+        if not (yield from self._index_predecessors()):
+            return
+        
+        # Parent pointers: forward towards the start, backward towards the target
+        forward: Dict[str, Optional[str]] = {start: None}
+        backward: Dict[str, Optional[str]] = {target: None}
+        forward_distance: Dict[str, int] = {start: 0}
+        backward_distance: Dict[str, int] = {target: 0}
+        forward_frontier = [start]
+        backward_frontier = [target]
+        depth = 0
+        
+        while forward_frontier and backward_frontier:
+            if self._out_of_time():
+                return
+            
+            if self.max_depth is not None and depth >= self.max_depth:
+                self.truncated = True
+                return
+            
+            if len(forward_frontier) <= len(backward_frontier):
+                forward_frontier, meeting = yield from self._expand_level(
+                    forward_frontier, forward, forward_distance, backward_distance,
+                    self._next_nodes)
+            else:
+                backward_frontier, meeting = yield from self._expand_level(
+                    backward_frontier, backward, backward_distance, forward_distance,
+                    self._previous_nodes)
+            depth += 1
+            
+            if meeting is not None:
+                yield self._join(meeting, forward, backward)
+                return
+    
+    def _expand_level(self, frontier: List[str], parents: Dict[str, Optional[str]],
+                      distance: Dict[str, int], other_distance: Dict[str, int],
+                      next_nodes: Callable[[str], Iterable[str]]
+                      ) -> Generator[None, None, Tuple[List[str], Optional[str]]]:
+        """
+        Expand one whole level of one side of the search, yielding None at checkpoints
+        
+        Args:
+            frontier: Nodes at the current level of this side
+            parents: Parent pointers of this side, updated in place
+            distance: Distances from this side's root, updated in place
+            other_distance: Distances from the opposite side's root
+            next_nodes: Neighbor lookup for this side's direction
+        
+        Returns:
+            Tuple of the next frontier and the meeting node (None if the sides have not met)
+        """
+        next_frontier = []
+        meeting = None
+        
+        for current in frontier:
+            if self._tick():
+                yield None
+            
+            for neighbor in next_nodes(current):
+                if neighbor in distance:
+                    continue
+                parents[neighbor] = current
+                distance[neighbor] = distance[current] + 1
+                next_frontier.append(neighbor)
+                
+                # Everything found in this level is equally far from this side, so keep the meeting closest to the other
+                if neighbor in other_distance:
+                    if meeting is None or other_distance[neighbor] < other_distance[meeting]:
+                        meeting = neighbor
+        
+        return next_frontier, meeting
+    
+    def _join(self, meeting: str, forward: Dict[str, Optional[str]],
+              backward: Dict[str, Optional[str]]) -> List[str]:
+        """Rebuild the witness through the meeting node from both sets of parent pointers"""
+        path = []
+        node: Optional[str] = meeting
+        while node is not None:
+            path.append(node)
+            node = forward[node]
+        path.reverse()
+        
+        node = backward[meeting]
+        while node is not None:
+            path.append(node)
+            node = backward[node]
+        return path
@@ -0,0 +1,230 @@
+"""
+<spec>
+Bit-parallel reachability for many sources at once, used to skip source/sink pairs that cannot be connected.
+
+Every path search of a pair walks the graph node by node in Python. On a full-repository scan most pairs are not connected at all, and finding that out is what caps throughput. This engine answers "does source s reach sink t" for whole batches of sources in a few vectorized sweeps with NumPy:
+
+ - the graph is taken as CSR arrays (see Graphs/Snapshot.py), with every edge's source and target in two flat arrays sorted by target
+ - each node holds a bitset with one bit per source of the batch (64 sources per uint64 word, `batch_size` sources per batch)
+ - a sweep ORs the frontier bitsets of every edge's source into its target with one `bitwise_or.reduceat`; the bits that are new become the next frontier
+ - the propagation stops once no bit changes, after about as many sweeps as the longest shortest path from a source
+
+A source is reachable-to-sink exactly when the sink's bitset has the source's bit, so a sources × sinks reachability matrix is a lookup after one propagation. Reachability ignores sanitizers, context and function summaries, so it never rules out a pair that a search could connect; only edge kinds can be selected.
+
+Sources are queued as they are detected and propagated together, so a stream of sources still gets batched. Sources arriving one at a time would otherwise make every batch a single source, so the owner decides when the queue is flushed (`propagate`): the orchestrator waits until a full batch is queued, a short time has passed or the source stream has ended. A lookup for a source that is still queued propagates the queue itself; a lookup for a source already propagated never does. The result costs one bit per node per source.
+
+NumPy is an optional dependency: without it the engine cannot be created (ImportError) and the orchestrator runs every pair.
+
+# Input
+ - graph object (CodeQL, or a graph snapshot)
+ - optional edge kinds to follow
+ - sources to batch (via add_source), pairs to answer (via reaches / matrix)
+
+# Output
+ - True / False for source/sink pairs, or a boolean sources × sinks matrix
+ - statistics: sources, batches, sweeps
+</spec>
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from Graphs.Snapshot import GraphSnapshot, KIND_CODES, EDGE_KINDS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Sources per bitset word
+WORD_BITS = 64
+
+
+class BitsetReachability:
+    def __init__(self, graph: Any, edge_kinds: Optional[Iterable[str]] = None, batch_size: int = 256):
+        """
+        Initialize the engine over a graph
+        
+        Args:
+            graph: Graph object with nodes and edges, or a GraphSnapshot
+            edge_kinds: Only follow edges of these kinds, plus untyped edges (None for every edge)
+            batch_size: Maximum number of sources propagated together
+        """
+        if np is None:
+            raise ImportError("BitsetReachability requires NumPy (pip install numpy)")
+        if batch_size < 1:
+            raise ValueError(f"Invalid batch_size: {batch_size}. Must be at least 1")
+        
+        self.snapshot = graph if isinstance(graph, GraphSnapshot) else GraphSnapshot.from_graph(graph)
+        self.batch_size = batch_size
+        self.node_count = len(self.snapshot.node_ids)
+        
+        offsets = np.asarray(self.snapshot.offsets, dtype=np.int64)
+        targets = np.asarray(self.snapshot.targets, dtype=np.int64)
+        sources = np.repeat(np.arange(self.node_count, dtype=np.int64), np.diff(offsets))
+        
+        if edge_kinds:
+            unknown = [kind for kind in edge_kinds if kind not in KIND_CODES]
+            if unknown:
+                raise ValueError(f"Unknown edge kind: {unknown[0]}. Must be one of {', '.join(EDGE_KINDS)}")
+            codes = [0] + [KIND_CODES[kind] for kind in edge_kinds]
+            keep = np.isin(np.asarray(self.snapshot.kinds, dtype=np.int8), codes)
+            sources, targets = sources[keep], targets[keep]
+        
+        # Edges sorted by target, so the bits flowing into each node are one contiguous run
+        order = np.argsort(targets, kind='stable')
+        self._edge_sources = sources[order]
+        self._edge_targets = targets[order]
+        
+        # Source node -> (batch, word, bit) of its bits, and the reached bitsets of every batch
+        self._rows: Dict[Any, Tuple[int, int, int]] = {}
+        self._batches: List[Any] = []
+        self._pending: List[Any] = []
+        self._queued = set()
+        
+        # Statistics
+        self.sweeps = 0
+    
+    def add_source(self, node_id: Any):
+        """
+        Queue a source for the next propagation
+        
+        Args:
+            node_id: Source node ID (ignored if None or not in the graph)
+        """
+        if node_id is None or node_id in self._rows or node_id in self._queued:
+            return
+        if node_id not in self.snapshot.index:
+            return
+        self._pending.append(node_id)
+        self._queued.add(node_id)
+    
+    @property
+    def pending(self) -> int:
+        """Number of sources queued for the next propagation"""
+        return len(self._pending)
+    
+    def propagated(self, node_id: Any) -> bool:
+        """Check whether a source has been propagated, so lookups for it are answered without propagating"""
+        return node_id in self._rows
+    
+    def propagate(self):
+        """Propagate every queued source now"""
+        if self._pending:
+            self._propagate_pending()
+    
+    def reaches(self, source_node: Any, sink_node: Any) -> bool:
+        """
+        Check whether sink_node is reachable from source_node, propagating queued sources first if needed
+        
+        Args:
+            source_node: Source node ID
+            sink_node: Sink node ID
+        
+        Returns:
+            True if a path exists; False if not, or if either node is not in the graph
+        """
+        j = self.snapshot.index.get(sink_node)
+        if j is None:
+            return False
+        
+        # Queued sources are left to batch up unless this one is among them
+        if source_node not in self._rows:
+            self.add_source(source_node)
+            self.propagate()
+        
+        row = self._rows.get(source_node)
+        if row is None:
+            return False
+        batch, word, bit = row
+        return bool((int(self._batches[batch][j, word]) >> bit) & 1)
+    
+    def matrix(self, source_nodes: Sequence[Any], sink_nodes: Sequence[Any]) -> Any:
+        """
+        Compute the reachability of every source/sink combination
+        
+        Args:
+            source_nodes: Source node IDs (rows)
+            sink_nodes: Sink node IDs (columns)
+        
+        Returns:
+            Boolean NumPy array of shape (sources, sinks); nodes not in the graph reach nothing
+        """
+        for node_id in source_nodes:
+            self.add_source(node_id)
+        if self._pending:
+            self._propagate_pending()
+        
+        result = np.zeros((len(source_nodes), len(sink_nodes)), dtype=bool)
+        columns = [k for k, node_id in enumerate(sink_nodes) if node_id in self.snapshot.index]
+        if not columns:
+            return result
+        sink_indexes = np.asarray([self.snapshot.index[sink_nodes[k]] for k in columns], dtype=np.int64)
+        
+        for i, node_id in enumerate(source_nodes):
+            row = self._rows.get(node_id)
+            if row is None:
+                continue
+            batch, word, bit = row
+            words = self._batches[batch][sink_indexes, word]
+            result[i, columns] = ((words >> np.uint64(bit)) & np.uint64(1)) != 0
+        return result
+    
+    def stats(self) -> Dict[str, int]:
+        """Return how many sources were propagated, in how many batches and sweeps"""
+        return {
+            "sources": len(self._rows),
+            "batches": len(self._batches),
+            "sweeps": self.sweeps
+        }
+    
+    def _propagate_pending(self):
+        """Propagate every queued source, batch_size sources at a time"""
+        pending, self._pending = self._pending, []
+        self._queued.clear()
+        
+        for start in range(0, len(pending), self.batch_size):
+            chunk = pending[start:start + self.batch_size]
+            reached = self._propagate([self.snapshot.index[node_id] for node_id in chunk])
+            
+            batch = len(self._batches)
+            self._batches.append(reached)
+            for position, node_id in enumerate(chunk):
+                self._rows[node_id] = (batch, position // WORD_BITS, position % WORD_BITS)
+    
+    def _propagate(self, source_indexes: List[int]) -> Any:
+        """
+        Propagate one batch of sources to a fixed point
+        
+        Args:
+            source_indexes: Node indexes of the sources, bit i of the result belongs to source_indexes[i]
+        
+        Returns:
+            uint64 array of shape (nodes, words) with the bits of the sources reaching each node
+        """
+        words = (len(source_indexes) + WORD_BITS - 1) // WORD_BITS
+        reached = np.zeros((self.node_count, words), dtype=np.uint64)
+        
+        positions = np.arange(len(source_indexes))
+        bits = np.left_shift(np.uint64(1), (positions % WORD_BITS).astype(np.uint64))
+        np.bitwise_or.at(reached, (np.asarray(source_indexes, dtype=np.int64), positions // WORD_BITS), bits)
+        
+        frontier = reached.copy()
+        while True:
+            # Only edges leaving a node with new bits can change anything
+            active = frontier.any(axis=1)[self._edge_sources]
+            if not active.any():
+                break
+            
+            targets = self._edge_targets[active]
+            starts = np.flatnonzero(np.concatenate(([True], targets[1:] != targets[:-1])))
+            incoming = np.bitwise_or.reduceat(frontier[self._edge_sources[active]], starts, axis=0)
+            
+            receivers = targets[starts]
+            new_bits = incoming & ~reached[receivers]
+            reached[receivers] |= new_bits
+            
+            frontier = np.zeros_like(reached)
+            frontier[receivers] = new_bits
+            self.sweeps += 1
+        
+        return reached
@@ -0,0 +1,105 @@
+"""
+<spec>
+#Input
+ - source
+ - sink
+ - list of all the sanitizers
+ - Graph object (CodeQL)
+ - path analysis async queue
+ - optional limits: maximum depth, maximum number of paths, wall-clock budget
+ - optional unsanitized only mode (sanitizers are barriers)
+ - optional edge kinds to follow (e.g. data-flow and call edges only)
+
+#Output
+ - (via queue) Code path information, shortest paths first
+
+#Algorthim
+Breadth first search starting at the source and expanding one level at a time until the sink is reached, noting if it goes through an sanitizers
+
+Partial paths are kept as records with a parent pointer to the record they were extended from, so the queue holds one small record per partial path and the full path is only rebuilt (by walking the parent pointers) when the sink is reached. Because the search goes level by level, paths come out in order of length: the first one emitted is a shortest witness.
+
+Partial paths ending at a node the shared reachability memo knows cannot reach the sink are dropped.
+
+</spec>
+"""
+
+from collections import deque
+from typing import List, Optional, Iterator
+
+from Paths import PathSearch
+
+
+class BreadthFirstSearch(PathSearch):
+    name = "BFS"
+    
+    # Resources the orchestrator shares between every search of this kind
+    shared_resources = ("reach_memo", "summaries")
+    
+    def _search(self, start: str, target: str) -> Iterator[Optional[List[str]]]:
+        """
+        Level-order search yielding every simple path from start to target, shortest first
+        
+        Args:
+            start: Node ID to start from
+            target: Node ID to reach
+        
+        Yields:
+            Paths (lists of node IDs) in order of length, or None at checkpoints
+        """
+        if start == target:
+            yield [start]
+            return
+        
+        # Partial path records: node, index of the parent record (-1 for the root) and depth in edges
+        nodes: List[str] = [start]
+        parents: List[int] = [-1]
+        depths: List[int] = [0]
+        frontier = deque([0])
+        
+        while frontier:
+            if self._out_of_time():
+                return
+            
+            record = frontier.popleft()
+            current = nodes[record]
+            
+            if self._tick():
+                yield None
+            
+            if self.max_depth is not None and depths[record] >= self.max_depth:
+                self.truncated = True
+                continue
+            
+            for neighbor in self._next_nodes(current):
+                if self._on_path(neighbor, record, nodes, parents):
+                    continue
+                
+                if neighbor == target:
+                    yield self._rebuild_path(record, nodes, parents) + [neighbor]
+                    continue
+                
+                # Another search already showed nothing below this node reaches the target
+                if self._known_dead_end(neighbor, target):
+                    continue
+                
+                nodes.append(neighbor)
+                parents.append(record)
+                depths.append(depths[record] + 1)
+                frontier.append(len(nodes) - 1)
+    
+    def _on_path(self, node: str, record: int, nodes: List[str], parents: List[int]) -> bool:
+        """Check whether node already appears on the partial path ending at record"""
+        while record != -1:
+            if nodes[record] == node:
+                return True
+            record = parents[record]
+        return False
+    
+    def _rebuild_path(self, record: int, nodes: List[str], parents: List[int]) -> List[str]:
+        """Rebuild the partial path ending at record by following parent pointers"""
+        path = []
+        while record != -1:
+            path.append(nodes[record])
+            record = parents[record]
+        path.reverse()
+        return path
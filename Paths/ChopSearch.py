@@ -0,0 +1,115 @@
+"""
+<spec>
+#Input
+ - source
+ - sink
+ - list of all the sanitizers
+ - Graph object (CodeQL)
+ - path analysis async queue
+ - optional limits: maximum depth, wall-clock budget
+ - optional unsanitized only mode (sanitizers are barriers)
+ - optional edge kinds to follow (e.g. data-flow and call edges only)
+
+#Output
+ - (via queue) One chop record per pair, if the sink is reachable: the subgraph of every node and edge that lies on some path from the source to the sink
+ - The record's path is a shortest witness, so consumers that only read 'path' keep working; 'chop' holds the nodes, the edges and the sanitizers inside the subgraph
+
+#Algorthim
+The chop is forward-reachable(source) ∩ backward-reachable(sink). One breadth first traversal goes forward from the source; a second goes backward from the sink (following predecessor lookups) and only visits nodes the first one reached. Every source to sink path stays inside the chop and every chop edge is on one of them, so the record carries all path information in two linear traversals instead of an exponential enumeration.
+
+With a maximum depth only nodes with forward distance + backward distance within the limit are kept.
+
+The two traversals decide, for every node reachable from the source, whether it reaches the sink; those facts are added to the shared reachability memo for the other searches.
+
+</spec>
+"""
+
+from typing import Any, Dict, Iterator, List, Optional
+
+from Graphs.Compaction import ChainCompaction
+from Paths import PathSearch
+
+
+class ChopSearch(PathSearch):
+    name = "CHOP"
+    
+    # Resources the orchestrator shares between every search of this kind
+    shared_resources = ("reach_memo", "predecessors")
+    
+    # Subgraph attached to the witness, set once both traversals have finished
+    chop: Optional[Dict[str, Any]] = None
+    
+    def _search(self, start: str, target: str) -> Iterator[Optional[List[str]]]:
+        """
+        Compute the chop between start and target and yield a shortest witness through it
+        
+        Args:
+            start: Node ID to start from
+            target: Node ID to reach
+        
+        Yields:
+            A shortest path (list of node IDs) if one exists, or None at checkpoints
+        """
+        self.chop = None
+        
+        forward = yield from self._reach(start, self._next_nodes)
+        if forward is None or target not in forward:
+            return
+        
+        if not (yield from self._index_predecessors()):
+            return
+        
+        backward = yield from self._reach(target, self._previous_nodes, forward)
+        if backward is None:
+            return
+        
+        # Both traversals ran over the whole graph, so they settle every forward node for the target
+        if self.reach_memo is not None:
+            for node in forward:
+                self.reach_memo.record(node, target, node in backward)
+        
+        # Keep the forward traversal order so the record is stable
+        nodes = [node for node in forward if node in backward]
+        if self.max_depth is not None:
+            kept = [node for node in nodes if forward[node] + backward[node] <= self.max_depth]
+            if len(kept) < len(nodes):
+                self.truncated = True
+            nodes = kept
+            if target not in nodes:
+                return
+        
+        members = set(nodes)
+        edges = [
+            (node, neighbor)
+            for node in nodes
+            for neighbor in self._neighbors(node)
+            if neighbor in members
+        ]
+        
+        # On a collapsed graph, report the chains behind super-edges node by node
+        if isinstance(self.graph, ChainCompaction):
+            expanded = []
+            for edge in edges:
+                way = self.graph.expand(list(edge))
+                nodes.extend(way[1:-1])
+                expanded.extend(zip(way, way[1:]))
+            edges = expanded
+        
+        self.chop = {
+            "nodes": nodes,
+            "edges": edges,
+            "sanitizers": [node for node in nodes if node in self.sanitizer_nodes]
+        }
+        
+        # A shortest path only uses nodes with forward + backward distance equal to its length, so it lies in the chop
+        witness = yield from self._shortest_path(start, target, set(), set())
+        if witness is not None:
+            yield witness
+    
+    def _build_path_info(self, path: List[str]) -> Dict[str, Any]:
+        """Build the chop record around the witness path"""
+        path_info = super()._build_path_info(path)
+        if self.chop:
+            path_info["kind"] = "chop"
+            path_info["chop"] = self.chop
+        return path_info
@@ -0,0 +1,197 @@
+"""
+<spec>
+#Input
+ - source
+ - sink
+ - list of all the sanitizers
+ - Graph object (CodeQL), optionally labelling call and return edges
+ - path analysis async queue
+ - optional limits: maximum depth, maximum number of paths, wall-clock budget
+ - optional unsanitized only mode (sanitizers are barriers)
+ - optional edge kinds to follow (e.g. data-flow and call edges only)
+ - optional call-string depth (default 3)
+
+#Output
+ - (via queue) Code path information for every path whose returns match its calls, streamed as each path is found
+
+#Algorthim
+A plain depth first search follows edges blindly: a path can enter a function from one call site and return to a different caller. Those paths are infeasible, and in code with shared helpers they are most of the paths.
+
+This search is a depth first search over (node, call string) states, a bounded form of CFL-reachability. Graphs that know about calls expose `get_edge_label(node, neighbor)`, returning ("call", site) or ("return", site) for interprocedural edges and None otherwise. A call pushes its site on the call string; a return is only followed if its site is the one on top, and pops it. A return with an empty call string is always followed, since the source may sit inside a function called from anywhere.
+
+The call string keeps at most `call_depth` sites; deeper calls forget the oldest one, so past that depth returns are matched less precisely, never wrongly pruned. This bounds the number of states per node, which keeps the cost predictable. Graphs without edge labels are searched exactly like DFS.
+
+States known not to reach the sink are not expanded again within the search. Nodes the shared reachability memo knows cannot reach the sink at all are skipped; as context-sensitive dead ends say nothing about the whole graph, only nodes found on a path are added to the memo.
+
+</spec>
+"""
+
+import asyncio
+from typing import Dict, List, Set, Any, Optional, Iterator, Tuple, Union
+
+from Paths import PathSearch
+from Paths.SanitizerLog import SanitizerView
+
+# Edge labels returned by get_edge_label
+CALL = "call"
+RETURN = "return"
+
+
+class ContextSensitiveSearch(PathSearch):
+    name = "CONTEXT"
+    
+    # Resources the orchestrator shares between every search of this kind
+    shared_resources = ("reach_memo",)
+    
+    def __init__(self, source: Dict[str, Any], sink: Dict[str, Any],
+                 sanitizers: Union[List[Dict[str, Any]], SanitizerView], graph: Any,
+                 path_analysis_queue: asyncio.Queue,
+                 call_depth: int = 3,
+                 **options):
+        """
+        Initialize context-sensitive path finder
+        
+        Args:
+            source: Source node information with 'line_number' key
+            sink: Sink node information with 'line_number' key
+            sanitizers: List of sanitizer nodes with 'line_number' keys, or a view of the sanitizer log
+            graph: Graph object with nodes and edges
+            path_analysis_queue: Async queue to put found paths
+            call_depth: Maximum number of call sites kept in the call string (0 matches nothing)
+            **options: Search limits and time slicing settings, see PathSearch
+        """
+        if call_depth < 0:
+            raise ValueError(f"Invalid call_depth: {call_depth}. Must be at least 0")
+        
+        super().__init__(source, sink, sanitizers, graph, path_analysis_queue, **options)
+        self.call_depth = call_depth
+        
+        # Returns not followed because they did not match the call string
+        self.mismatched_returns = 0
+    
+    def _search_options(self) -> Dict[str, Any]:
+        """Return the constructor options needed to recreate this search elsewhere"""
+        options = super()._search_options()
+        options["call_depth"] = self.call_depth
+        return options
+    
+    def _step(self, context: Tuple[Any, ...], node: str, neighbor: str) -> Optional[Tuple[Any, ...]]:
+        """
+        Return the call string after following the edge from node to neighbor
+        
+        Args:
+            context: Call string at node, most recent call site last
+            node: Node the edge leaves
+            neighbor: Node the edge enters
+        
+        Returns:
+            Call string at neighbor, or None if the edge is a return that does not match
+        """
+        get_edge_label = getattr(self.graph, 'get_edge_label', None)
+        label = get_edge_label(node, neighbor) if get_edge_label is not None else None
+        if not label:
+            return context
+        
+        kind, site = label
+        if kind == CALL:
+            if self.call_depth == 0:
+                return context
+            return (context + (site,))[-self.call_depth:]
+        if kind == RETURN:
+            if not context:
+                return context
+            if context[-1] == site:
+                return context[:-1]
+            self.mismatched_returns += 1
+            return None
+        return context
+    
+    def _search(self, start: str, target: str) -> Iterator[Optional[List[str]]]:
+        """
+        Iterative DFS over (node, call string) states yielding every simple path whose returns match its calls
+        
+        Like DFS, a single path stack and on-path set are shared by the whole search.
+        A state whose subtree was explored in full without reaching the target
+        (no depth cut, no successor skipped for being on the path) is a dead end
+        for the rest of the search.
+        
+        Args:
+            start: Node ID to start from
+            target: Node ID to reach
+        
+        Yields:
+            Copy of the path (list of node IDs) each time the target is reached, or None at checkpoints
+        """
+        path: List[str] = [start]
+        on_path: Set[str] = {start}
+        
+        if start == target:
+            yield list(path)
+            return
+        
+        # Each frame holds the call string at the node at the same depth in `path`, the iterator
+        # over its neighbors, whether a path was found through it and whether it was explored in full
+        contexts: List[Tuple[Any, ...]] = [()]
+        stack = [iter(self._next_nodes(start))]
+        found = [False]
+        complete = [True]
+        dead: Set[Tuple[str, Tuple[Any, ...]]] = set()
+        memo = self.reach_memo
+        
+        while stack:
+            if self._out_of_time():
+                return
+            
+            # Taking another step would exceed the depth limit, so this node is a leaf
+            if self.max_depth is not None and len(path) > self.max_depth:
+                self.truncated = True
+                complete[-1] = False
+                neighbor = None
+            else:
+                neighbor = next(stack[-1], None)
+            
+            if neighbor is None:
+                # Node exhausted, backtrack
+                stack.pop()
+                node = path.pop()
+                on_path.discard(node)
+                context = contexts.pop()
+                node_found = found.pop()
+                node_complete = complete.pop()
+                
+                if node_found:
+                    if memo is not None:
+                        memo.record(node, target, True)
+                elif node_complete:
+                    dead.add((node, context))
+                if found:
+                    found[-1] = found[-1] or node_found
+                    complete[-1] = complete[-1] and node_complete
+                continue
+            
+            if neighbor in on_path:
+                # A path through an ancestor may exist, so this subtree no longer proves anything
+                complete[-1] = False
+                continue
+            
+            context = self._step(contexts[-1], path[-1], neighbor)
+            if context is None:
+                continue
+            
+            if neighbor == target:
+                found[-1] = True
+                yield path + [neighbor]
+                continue
+            
+            if (neighbor, context) in dead or self._known_dead_end(neighbor, target):
+                continue
+            
+            path.append(neighbor)
+            on_path.add(neighbor)
+            contexts.append(context)
+            stack.append(iter(self._next_nodes(neighbor)))
+            found.append(False)
+            complete.append(True)
+            
+            if self._tick():
+                yield None
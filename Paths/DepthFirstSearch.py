@@ -2,101 +2,221 @@
 <spec>
 #Input
  - source
- - sink 
+ - sink
  - list of all the sanitizers
  - Graph object (CodeQL)
  - path analysis async queue
+ - optional limits: maximum depth, maximum number of paths, wall-clock budget
+ - optional unsanitized only mode (sanitizers are barriers)
+ - optional edge kinds to follow (e.g. data-flow and call edges only)
+ - optional k for k-shortest-simple-paths mode
 
 #Output
- - (via queue) Code path information
+ - (via queue) Code path information, streamed as each path is found
 
 #Algorthim
 Depth first search starting at the source and trying to get to the sink, noting if it goes through an sanitizers
 
+Nodes the shared reachability memo knows cannot reach the sink are not expanded, and every node the search finishes with adds what it learned to the memo.
+
+In k-shortest mode Yen's algorithm is used instead, emitting the k shortest simple paths in order of length.
+
 </spec>
 """
 
 import asyncio
-from typing import Dict, List, Set, Any, Optional
+import heapq
+from typing import Dict, List, Set, Any, Optional, Iterator, Tuple, Union
 
+from Paths import PathSearch
+from Paths.SanitizerLog import SanitizerView
 
-class DepthFirstSearch:
-    def __init__(self, source: Dict[str, Any], sink: Dict[str, Any], 
-                 sanitizers: List[Dict[str, Any]], graph: Any, 
-                 path_analysis_queue: asyncio.Queue):
+
+class DepthFirstSearch(PathSearch):
+    name = "DFS"
+    
+    # Resources the orchestrator shares between every search of this kind
+    shared_resources = ("reach_memo", "summaries")
+    
+    def __init__(self, source: Dict[str, Any], sink: Dict[str, Any],
+                 sanitizers: Union[List[Dict[str, Any]], SanitizerView], graph: Any,
+                 path_analysis_queue: asyncio.Queue,
+                 k_shortest: Optional[int] = None,
+                 **options):
         """
         Initialize DFS path finder
         
         Args:
             source: Source node information with 'line_number' key
             sink: Sink node information with 'line_number' key
-            sanitizers: List of sanitizer nodes with 'line_number' keys
+            sanitizers: List of sanitizer nodes with 'line_number' keys, or a view of the sanitizer log
             graph: Graph object with nodes and edges
             path_analysis_queue: Async queue to put found paths
+            k_shortest: If set, emit the k shortest simple paths (Yen) instead of every path
+            **options: Search limits and time slicing settings, see PathSearch
         """
-        self.source = source
-        self.sink = sink
-        self.sanitizers = sanitizers
-        self.graph = graph
-        self.path_analysis_queue = path_analysis_queue
-        
-        # Identify nodes in graph
-        self.source_node = self._get_node_id(source['line_number'])
-        self.sink_node = self._get_node_id(sink['line_number'])
-        self.sanitizer_nodes = {
-            self._get_node_id(san['line_number']) 
-            for san in sanitizers
-            if self._get_node_id(san['line_number']) is not None
-        }
+        super().__init__(source, sink, sanitizers, graph, path_analysis_queue, **options)
+        self.k_shortest = k_shortest
     
-    def _get_node_id(self, line_number: int) -> Optional[str]:
-        """Find node ID in graph by line number"""
-        for node_id, node_data in self.graph.nodes.items():
-            if node_data.get('line') == line_number:
-                return node_id
-        return None
+    def _search_options(self) -> Dict[str, Any]:
+        """Return the constructor options needed to recreate this search elsewhere"""
+        options = super()._search_options()
+        options["k_shortest"] = self.k_shortest
+        return options
     
-    async def find_paths(self):
-        """Find all paths from source to sink using DFS"""
-        if not self.source_node or not self.sink_node:
-            return
+    def _search(self, start: str, target: str) -> Iterator[Optional[List[str]]]:
+        """Yield paths using plain DFS, or Yen's algorithm in k-shortest mode"""
+        if self.k_shortest is not None:
+            return self._k_shortest_paths(start, target, self.k_shortest)
+        return self._dfs(start, target)
+    
+    def _dfs(self, start: str, target: str) -> Iterator[Optional[List[str]]]:
+        """
+        Iterative DFS yielding every simple path from start to target
+        
+        A single path stack and on-path set are shared by the whole search and
+        backtracked as frames are popped, so each expansion is O(1) instead of
+        copying the path and visited set for every child.
+        
+        With a reachability memo, nodes known not to reach the target are not
+        expanded. When a node is backtracked its result is added to the memo:
+        it reaches the target if a path was found through it, and it does not
+        if its whole subtree was explored without being cut short by the depth
+        limit or by a successor already on the current path.
+        
+        Args:
+            start: Node ID to start from
+            target: Node ID to reach
+        
+        Yields:
+            Copy of the path (list of node IDs) each time the target is reached, or None at checkpoints
+        """
+        path: List[str] = [start]
+        on_path: Set[str] = {start}
         
-        # Track all paths found
-        all_paths = []
+        if start == target:
+            yield list(path)
+            return
         
-        # DFS with path tracking
-        await self._dfs(self.source_node, self.sink_node, [], set(), all_paths)
+        # Each frame holds the iterator over the neighbors of the node at the same depth in `path`,
+        # whether a path was found through it and whether its subtree was explored in full
+        stack = [iter(self._next_nodes(start))]
+        found = [False]
+        complete = [True]
+        memo = self.reach_memo
         
-        # Queue all found paths
-        for path in all_paths:
-            sanitizers_in_path = [node for node in path if node in self.sanitizer_nodes]
+        while stack:
+            if self._out_of_time():
+                return
             
-            path_info = {
-                "source": self.source,
-                "sink": self.sink,
-                "path": path,
-                "goes_through_sanitizer": len(sanitizers_in_path) > 0,
-                "sanitizers_crossed": sanitizers_in_path
-            }
+            # Taking another step would exceed the depth limit, so this node is a leaf
+            if self.max_depth is not None and len(path) > self.max_depth:
+                self.truncated = True
+                complete[-1] = False
+                neighbor = None
+            else:
+                neighbor = next(stack[-1], None)
             
-            await self.path_analysis_queue.put(path_info)
+            if neighbor is None:
+                # Node exhausted, backtrack
+                stack.pop()
+                node = path.pop()
+                on_path.discard(node)
+                node_found = found.pop()
+                node_complete = complete.pop()
+                
+                if memo is not None and (node_found or node_complete):
+                    memo.record(node, target, node_found)
+                if found:
+                    found[-1] = found[-1] or node_found
+                    complete[-1] = complete[-1] and node_complete
+                continue
+            
+            if neighbor in on_path:
+                # A path through an ancestor may exist, so this subtree no longer proves anything
+                complete[-1] = False
+                continue
+            
+            if neighbor == target:
+                found[-1] = True
+                yield path + [neighbor]
+                continue
+            
+            if self._known_dead_end(neighbor, target):
+                continue
+            
+            path.append(neighbor)
+            on_path.add(neighbor)
+            stack.append(iter(self._next_nodes(neighbor)))
+            found.append(False)
+            complete.append(True)
+            
+            if self._tick():
+                yield None
     
-    async def _dfs(self, current: str, target: str, path: List[str], 
-                   visited: Set[str], all_paths: List[List[str]]):
-        """Recursive DFS to find all paths"""
-        # Add current node to path
-        path = path + [current]
+    def _k_shortest_paths(self, start: str, target: str, k: int) -> Iterator[Optional[List[str]]]:
+        """
+        Yen's algorithm yielding up to k shortest simple paths in order of length
+        
+        Args:
+            start: Node ID to start from
+            target: Node ID to reach
+            k: Number of paths to produce
         
-        # If we reached the target, save the path
-        if current == target:
-            all_paths.append(path)
+        Yields:
+            Paths (lists of node IDs), shortest first, or None at checkpoints
+        """
+        first = yield from self._shortest_path(start, target, set(), set())
+        if first is None or k <= 0:
+            return
+        if self.max_depth is not None and len(first) - 1 > self.max_depth:
+            self.truncated = True
             return
         
-        # Mark as visited to avoid cycles in current path
-        visited.add(current)
+        accepted = [first]
+        yield first
         
-        # Explore neighbors
-        neighbors = self.graph.get_neighbors(current)
-        for neighbor in neighbors:
-            if neighbor not in visited:
-                await self._dfs(neighbor, target, path, visited.copy(), all_paths)
\ No newline at end of file
+        # Candidate heap ordered by length, then discovery order for stable output
+        candidates: List[Tuple[int, int, List[str]]] = []
+        seen = {tuple(first)}
+        counter = 0
+        
+        while len(accepted) < k:
+            previous = accepted[-1]
+            
+            for i in range(len(previous) - 1):
+                if self._out_of_time():
+                    return
+                
+                spur_node = previous[i]
+                root = previous[:i + 1]
+                
+                # Block the next edge of every accepted path sharing this root
+                blocked_edges = {
+                    (path[i], path[i + 1])
+                    for path in accepted
+                    if len(path) > i + 1 and path[:i + 1] == root
+                }
+                blocked_nodes = set(root[:-1])
+                
+                spur_path = yield from self._shortest_path(spur_node, target, blocked_nodes, blocked_edges)
+                if spur_path is None:
+                    continue
+                
+                candidate = root[:-1] + spur_path
+                key = tuple(candidate)
+                if key not in seen:
+                    seen.add(key)
+                    heapq.heappush(candidates, (len(candidate), counter, candidate))
+                    counter += 1
+            
+            if not candidates:
+                return
+            
+            _, _, best = heapq.heappop(candidates)
+            if self.max_depth is not None and len(best) - 1 > self.max_depth:
+                self.truncated = True
+                return
+            
+            accepted.append(best)
+            yield best
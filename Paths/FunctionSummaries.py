@@ -0,0 +1,333 @@
+"""
+<spec>
+Function-level flow summaries, shared by every search of an orchestrator and cached across runs.
+
+Graph nodes that carry a 'function' key in their node data belong to that function. Paths through a common utility function otherwise walk its whole body every time; instead, the first time a search reaches a node of a function, the function is summarized from that node: one breadth first search that stays inside the function finds every edge leaving it (a call out, or a return to a caller) together with the shortest way through the body to it. Searches then step straight from the node to the nodes outside the function, and the body is only spliced back into a path when the path is reported. If the shortest way through the body crosses a sanitizer, a way around the sanitizers inside the function is looked for first, so a summarized path is only reported as sanitized when the function leaves no choice.
+
+Summaries are opt-in (the orchestrator's function_summaries setting): a jump stands for every route through the body, but only one of them is spliced back, so routes that differ inside the body are reported once. Searches therefore never jump over a function with a known sanitizer in its body, where the routes could differ in the sanitizers they cross, and the orchestrator searches a pair again when a sanitizer turns up later in a body one of its paths went through.
+
+A function is never jumped over when the search target lies inside it. Paths are simple at the level of the nodes the search visited; the spliced body of a function entered twice may repeat nodes. A jump counts as one edge towards the maximum depth.
+
+The same function index also gives call-graph distances: `distances_to(function)` counts how many function boundaries separate every other function from it, following the edges that leave one function for another. Guided searches use it to prefer nodes close to the sink's function.
+
+Summaries are stored by content hash: a hash over the function's node data (with lines made relative to the function's first line) and the shape of its edges. When a cache file is given, summaries are loaded from it at start and written back on save, so unchanged functions are not summarized again on the next run. Summaries computed elsewhere (in worker processes, see Paths/ProcessPool.py) are handed over with `take_computed` and `merge`, so they are saved with the rest.
+
+# Input
+ - graph object (CodeQL)
+ - optional cache file
+
+# Output
+ - the nodes outside the function reachable from a node in one step (via exits)
+ - paths with the summarized bodies spliced back in (via expand)
+ - call-graph distances between functions (via distances_to)
+ - statistics: summaries computed, summaries reused from the cache, functions
+</spec>
+"""
+
+import hashlib
+import json
+import logging
+import os
+from collections import deque
+from typing import Any, Container, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Node data key naming the function a node belongs to
+FUNCTION_KEY = 'function'
+
+
+class FunctionSummaries:
+    def __init__(self, graph: Any, cache_path: Optional[str] = None):
+        """
+        Initialize the summaries
+        
+        Args:
+            graph: Graph object with nodes and edges
+            cache_path: JSON file summaries are loaded from and saved to (None to keep them in memory only)
+        """
+        self.graph = graph
+        self.cache_path = cache_path
+        
+        # Function -> member nodes, built on first use
+        self._members: Optional[Dict[Any, List[Any]]] = None
+        self._node_function: Dict[Any, Any] = {}
+        
+        # Per function: content hash, nodes in canonical order and node -> local index in that order
+        self._hashes: Dict[Any, str] = {}
+        self._order: Dict[Any, List[Any]] = {}
+        self._local: Dict[Any, Dict[Any, int]] = {}
+        
+        # Node -> {node outside the function -> way through the body, starting at node}
+        self.summaries: Dict[Any, Dict[Any, List[Any]]] = {}
+        
+        # Content hash -> {local index of node: [[local indexes of the way], neighbor ordinal of its last node]...}
+        self._cache: Dict[str, Dict[str, List[Tuple[List[int], int]]]] = {}
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path, 'r') as f:
+                self._cache = json.load(f)
+        
+        # Cache entries computed since the last take_computed
+        self._computed: Dict[str, Dict[str, List[Tuple[List[int], int]]]] = {}
+        
+        # Function -> functions with an edge into it, and distances to a function, built on first use
+        self._flows_into: Optional[Dict[Any, set]] = None
+        self._distances: Dict[Any, Dict[Any, int]] = {}
+        
+        # Statistics
+        self.computed = 0
+        self.reused = 0
+    
+    def function_of(self, node: Any) -> Optional[Any]:
+        """Return the function node belongs to, or None if it is not part of one"""
+        if self._members is None:
+            self._index()
+        return self._node_function.get(node)
+    
+    def members(self, function: Any) -> List[Any]:
+        """Return the nodes of a function"""
+        if self._members is None:
+            self._index()
+        return self._members.get(function, [])
+    
+    def exits(self, node: Any, target: Any) -> Optional[List[Any]]:
+        """
+        Return the nodes outside node's function reachable from node through the function body
+        
+        Args:
+            node: Node to step from
+            target: Node the search is looking for
+        
+        Returns:
+            Nodes outside the function, or None if node must be expanded normally
+            (it is not in a function, or the target is in the same function)
+        """
+        function = self.function_of(node)
+        if function is None or self._node_function.get(target) == function:
+            return None
+        return list(self._summary(node, function))
+    
+    def expand(self, path: List[Any], avoid: Optional[Container[Any]] = None) -> List[Any]:
+        """
+        Splice the summarized function bodies back into a path
+        
+        Args:
+            path: Path as visited by a search, possibly with jumps over function bodies
+            avoid: Sanitizer nodes to go around inside a function when possible
+        
+        Returns:
+            Path with every jump replaced by the way through the body
+        """
+        if not path:
+            return path
+        
+        expanded = [path[0]]
+        for node, following in zip(path, path[1:]):
+            summary = self.summaries.get(node)
+            if summary is not None and following in summary:
+                expanded.extend(self._way(node, following, avoid)[1:])
+            expanded.append(following)
+        return expanded
+    
+    def distances_to(self, function: Any) -> Dict[Any, int]:
+        """
+        Return the call-graph distance from every function that can flow into function
+        
+        Args:
+            function: Function to measure the distance to
+        
+        Returns:
+            Function -> number of function boundaries crossed to get to function (0 for function itself)
+        """
+        distances = self._distances.get(function)
+        if distances is not None:
+            return distances
+        
+        if self._flows_into is None:
+            self._index_calls()
+        
+        # Breadth first over the reversed function graph
+        distances = {function: 0}
+        frontier = deque([function])
+        while frontier:
+            current = frontier.popleft()
+            for caller in self._flows_into.get(current, ()):
+                if caller not in distances:
+                    distances[caller] = distances[current] + 1
+                    frontier.append(caller)
+        
+        self._distances[function] = distances
+        return distances
+    
+    def save(self):
+        """Write every summary computed so far to the cache file"""
+        if not self.cache_path:
+            return
+        with open(self.cache_path, 'w') as f:
+            json.dump(self._cache, f)
+        logger.info(f"Saved function summaries for {len(self._cache)} functions to {self.cache_path}")
+    
+    def take_computed(self) -> Dict[str, Dict[str, List[Tuple[List[int], int]]]]:
+        """Return the cache entries computed since the last call, in the form merge takes"""
+        computed, self._computed = self._computed, {}
+        return computed
+    
+    def merge(self, entries: Dict[str, Dict[str, List[Tuple[List[int], int]]]]):
+        """
+        Add cache entries computed by another instance over the same graph, so save writes them too
+        
+        Args:
+            entries: Cache entries as returned by take_computed
+        """
+        for content_hash, nodes in entries.items():
+            self._cache.setdefault(content_hash, {}).update(nodes)
+    
+    def stats(self) -> Dict[str, int]:
+        """Return how many summaries were computed and reused"""
+        return {
+            "functions": len(self._members) if self._members is not None else 0,
+            "computed": self.computed,
+            "reused": self.reused
+        }
+    
+    def _index(self):
+        """Group the graph's nodes by function"""
+        self._members = {}
+        for node_id, node_data in self.graph.nodes.items():
+            function = node_data.get(FUNCTION_KEY) if isinstance(node_data, dict) else None
+            if function is None:
+                continue
+            self._members.setdefault(function, []).append(node_id)
+            self._node_function[node_id] = function
+    
+    def _index_calls(self):
+        """Collect the function level edges: f -> g when a node of f has an edge to a node of g"""
+        if self._members is None:
+            self._index()
+        
+        self._flows_into = {}
+        for function, members in self._members.items():
+            for node in members:
+                for neighbor in self.graph.get_neighbors(node):
+                    other = self._node_function.get(neighbor)
+                    if other is not None and other != function:
+                        self._flows_into.setdefault(other, set()).add(function)
+    
+    def _summary(self, node: Any, function: Any) -> Dict[Any, List[Any]]:
+        """Return the summary of node, from memory, the cache, or by walking the function body"""
+        summary = self.summaries.get(node)
+        if summary is not None:
+            return summary
+        
+        content_hash = self._content_hash(function)
+        local = self._local[function]
+        members = self._order[function]
+        cached = self._cache.get(content_hash, {}).get(str(local[node]))
+        
+        if cached is not None:
+            summary = {}
+            for way_indexes, ordinal in cached:
+                way = [members[i] for i in way_indexes]
+                summary[self.graph.get_neighbors(way[-1])[ordinal]] = way
+            self.reused += 1
+        else:
+            summary, entries = self._walk(node, function)
+            self._cache.setdefault(content_hash, {})[str(local[node])] = entries
+            self._computed.setdefault(content_hash, {})[str(local[node])] = entries
+            self.computed += 1
+        
+        self.summaries[node] = summary
+        return summary
+    
+    def _walk(self, node: Any, function: Any) -> Tuple[Dict[Any, List[Any]], List[Tuple[List[int], int]]]:
+        """Breadth first search inside the function from node, collecting every edge that leaves it"""
+        local = self._local[function]
+        parents: Dict[Any, Optional[Any]] = {node: None}
+        frontier = deque([node])
+        summary: Dict[Any, List[Any]] = {}
+        entries: List[Tuple[List[int], int]] = []
+        
+        while frontier:
+            current = frontier.popleft()
+            for ordinal, neighbor in enumerate(self.graph.get_neighbors(current)):
+                if self._node_function.get(neighbor) != function:
+                    # Nodes are reached in order of distance, so the first way found is a shortest one
+                    if neighbor not in summary:
+                        way = self._rebuild(current, parents)
+                        summary[neighbor] = way
+                        entries.append(([local[n] for n in way], ordinal))
+                elif neighbor not in parents:
+                    parents[neighbor] = current
+                    frontier.append(neighbor)
+        
+        return summary, entries
+    
+    def _way(self, node: Any, following: Any, avoid: Optional[Container[Any]]) -> List[Any]:
+        """Return the way through the body from node to the edge into following, avoiding sanitizers if possible"""
+        way = self.summaries[node][following]
+        if avoid is None or not any(n in avoid for n in way) or node in avoid:
+            return way
+        
+        function = self._node_function[node]
+        parents: Dict[Any, Optional[Any]] = {node: None}
+        frontier = deque([node])
+        while frontier:
+            current = frontier.popleft()
+            for neighbor in self.graph.get_neighbors(current):
+                if neighbor == following:
+                    return self._rebuild(current, parents)
+                if neighbor in parents or neighbor in avoid or self._node_function.get(neighbor) != function:
+                    continue
+                parents[neighbor] = current
+                frontier.append(neighbor)
+        return way
+    
+    def _rebuild(self, node: Any, parents: Dict[Any, Optional[Any]]) -> List[Any]:
+        """Rebuild the way from the walk's start to node from parent pointers"""
+        way = []
+        while node is not None:
+            way.append(node)
+            node = parents[node]
+        way.reverse()
+        return way
+    
+    def _canonical_members(self, function: Any) -> List[Any]:
+        """Return the function's nodes in an order that only depends on its content"""
+        members = self._members[function]
+        first_line = min(self._line(n) for n in members)
+        return sorted(members, key=lambda n: (self._line(n) - first_line, self._describe(n, first_line), str(n)))
+    
+    def _content_hash(self, function: Any) -> str:
+        """Hash the function's node data and edge shape, so unchanged functions hash the same across runs"""
+        content_hash = self._hashes.get(function)
+        if content_hash is not None:
+            return content_hash
+        
+        members = self._canonical_members(function)
+        local = {node: i for i, node in enumerate(members)}
+        first_line = min(self._line(n) for n in members)
+        
+        digest = hashlib.blake2b(digest_size=16)
+        for node in members:
+            digest.update(self._describe(node, first_line).encode('utf-8'))
+            # Edges inside the function by local index, edges leaving it only by position
+            edges = [local.get(neighbor, -1) for neighbor in self.graph.get_neighbors(node)]
+            digest.update(json.dumps(edges).encode('utf-8'))
+            digest.update(b'\x1e')
+        
+        content_hash = digest.hexdigest()
+        self._hashes[function] = content_hash
+        self._order[function] = members
+        self._local[function] = local
+        return content_hash
+    
+    def _line(self, node: Any) -> int:
+        """Return the line of a node (0 if it has none)"""
+        line = self.graph.nodes[node].get('line')
+        return line if isinstance(line, int) else 0
+    
+    def _describe(self, node: Any, first_line: int) -> str:
+        """Describe a node's data with its line made relative to the function's first line"""
+        data = dict(self.graph.nodes[node])
+        data['line'] = self._line(node) - first_line
+        return json.dumps(data, sort_keys=True, default=str)
@@ -0,0 +1,174 @@
+"""
+<spec>
+#Input
+ - source
+ - sink
+ - list of all the sanitizers
+ - Graph object (CodeQL)
+ - path analysis async queue
+ - shared source reachability table (one per orchestrator)
+ - optional unsanitized only mode (sanitizers are barriers)
+ - optional edge kinds to follow (e.g. data-flow and call edges only)
+
+#Output
+ - (via queue) A single shortest witness path, if the sink is reachable
+
+#Algorthim
+The first time a source is seen, one breadth first traversal marks every node it can reach and records the parent each node was reached from. That traversal resolves the source against every sink at once: each later source/sink pair is just a lookup in the table, and the witness is rebuilt by following the parent pointers back from the sink.
+
+With S sources and K sinks this is S traversals instead of S x K.
+
+The table is shared by searches that know different sanitizers or follow different edge kinds, so it ignores both. In unsanitized only mode the table's witness is used when it avoids every sanitizer, and with selected edge kinds when it only uses those kinds; otherwise the pair falls back to its own breadth first search.
+
+On a graph with collapsed chains (see Graphs/Compaction.py) a table only lists the nodes visible when it was built. A sink protected later may have been stepped over, so when the view's version changes the tables that expanded the start of a split chain are dropped and their sources traversed again; tables that never entered a split chain are kept. The orchestrator protects sources and sinks as they arrive, so the view mostly settles before the pairs run.
+
+</spec>
+"""
+
+import asyncio
+from collections import deque
+from typing import Dict, List, Any, Optional, Iterator, Union
+
+from Paths import PathSearch
+from Paths.SanitizerLog import SanitizerView
+
+
+class SourceReachability:
+    """Table of per-source traversals shared by every search of an orchestrator"""
+    
+    def __init__(self, graph: Any):
+        """
+        Initialize an empty reachability table
+        
+        Args:
+            graph: Graph object with nodes and edges
+        """
+        self.graph = graph
+        
+        # Source node -> parent pointers of its traversal tree (the source maps to None)
+        self.tables: Dict[str, Dict[str, Optional[str]]] = {}
+        self.traversals = 0
+        
+        # Version of the collapsed view the tables were built on (plain graphs never change)
+        self.version = getattr(graph, "version", 0)
+    
+    def traverse(self, source_node: str) -> Dict[str, Optional[str]]:
+        """Return the parent pointers of every node reachable from source_node, traversing once"""
+        for _ in self.iter_traverse(source_node):
+            pass
+        return self.tables[source_node]
+    
+    def iter_traverse(self, source_node: str) -> Iterator[str]:
+        """
+        Traverse from source_node if it has not been traversed yet, yielding each node as it is expanded
+        
+        The table is only stored once the traversal completes, so a traversal that is
+        abandoned part way is simply redone the next time the source is needed.
+        """
+        self._drop_outdated()
+        if source_node in self.tables:
+            return
+        
+        version = self.version
+        table = {source_node: None}
+        frontier = deque([source_node])
+        
+        while frontier:
+            current = frontier.popleft()
+            yield current
+            
+            for neighbor in self.graph.get_neighbors(current):
+                if neighbor not in table:
+                    table[neighbor] = current
+                    frontier.append(neighbor)
+        
+        # A node protected part way through may have been stepped over; the next lookup traverses again
+        self._drop_outdated()
+        if not self._stepped_over_splits(table, version):
+            self.tables[source_node] = table
+        self.traversals += 1
+    
+    def _drop_outdated(self):
+        """Drop the tables that stepped over a node split out of its chain since they were built"""
+        version = getattr(self.graph, "version", 0)
+        if version == self.version:
+            return
+        
+        for source_node in [source for source, table in self.tables.items()
+                            if self._stepped_over_splits(table, self.version)]:
+            del self.tables[source_node]
+        self.version = version
+    
+    def _stepped_over_splits(self, table: Dict[str, Optional[str]], version: int) -> bool:
+        """Check whether a table built at version expanded the start of a chain split since then"""
+        splits = getattr(self.graph, "splits", [])[version:]
+        return any(self.graph.chain_start(node) in table for node in splits)
+    
+    def reaches(self, source_node: str, sink_node: str) -> bool:
+        """Check whether sink_node is reachable from source_node"""
+        return sink_node in self.traverse(source_node)
+    
+    def witness(self, source_node: str, sink_node: str) -> Optional[List[str]]:
+        """Rebuild the shortest path from source_node to sink_node, or None if unreachable"""
+        table = self.traverse(source_node)
+        if sink_node not in table:
+            return None
+        
+        path = []
+        node: Optional[str] = sink_node
+        while node is not None:
+            path.append(node)
+            node = table[node]
+        path.reverse()
+        return path
+
+
+class MultiSourceSearch(PathSearch):
+    name = "MULTI"
+    
+    # Resources the orchestrator shares between every search of this kind
+    shared_resources = ("reachability",)
+    
+    def __init__(self, source: Dict[str, Any], sink: Dict[str, Any],
+                 sanitizers: Union[List[Dict[str, Any]], SanitizerView], graph: Any,
+                 path_analysis_queue: asyncio.Queue,
+                 reachability: Optional[SourceReachability] = None,
+                 **options):
+        """
+        Initialize batched path finder
+        
+        Args:
+            source: Source node information with 'line_number' key
+            sink: Sink node information with 'line_number' key
+            sanitizers: List of sanitizer nodes with 'line_number' keys, or a view of the sanitizer log
+            graph: Graph object with nodes and edges
+            path_analysis_queue: Async queue to put found paths
+            reachability: Shared reachability table (a private one is made if not given)
+            **options: Search limits and time slicing settings, see PathSearch
+        """
+        super().__init__(source, sink, sanitizers, graph, path_analysis_queue, **options)
+        self.reachability = reachability or SourceReachability(graph)
+    
+    def _search(self, start: str, target: str) -> Iterator[Optional[List[str]]]:
+        """Look the pair up in the shared table, yielding the witness if the target is reachable"""
+        # Only the first pair of a source pays for the traversal, in time slices
+        for _ in self.reachability.iter_traverse(start):
+            if self._tick():
+                yield None
+        
+        path = self.reachability.witness(start, target)
+        if path is None:
+            return
+        
+        # The shared table ignores sanitizers and edge kinds; only search again when its witness crosses one or uses another kind
+        if ((self.unsanitized_only and any(node in self.sanitizer_nodes for node in path))
+                or (self.edge_kinds is not None and any(b not in self._neighbors(a) for a, b in zip(path, path[1:])))):
+            path = yield from self._shortest_path(start, target, set(), set())
+            if path is None:
+                return
+        
+        if self.max_depth is not None and len(path) - 1 > self.max_depth:
+            self.truncated = True
+            return
+        
+        yield path
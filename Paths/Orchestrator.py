@@ -2,11 +2,13 @@
 <spec>
 
 # Description
-The orchestrator receives streaming data from the sources/sink/santizer detectors and starts creating unique combinations of these for testing in various ways. Much like the detectors this creates threads for each search pattern. Right now we are just doing depth first search, but future iterations will include breath first search patterns.
+The orchestrator receives streaming data from the sources/sink/santizer detectors and starts creating unique combinations of these for testing in various ways. Much like the detectors this creates threads for each search pattern. Depth first search runs by default; breadth first, bidirectional and batched multi-source search, the dominator based sanitized/unsanitized verdict and the source/sink chop subgraph, can be run alongside it (or instead of it) by passing the search classes to use. Strategies can also be given as configurations from the strategy registry (see Paths/StrategyRegistry.py), each with its own time, path and depth budget on top of the options shared by every search. Searches that share work between pairs (such as the per-source reachability table, the memo of which nodes reach which targets, the reversed edges of the graph, or the function index) get those resources from the orchestrator. Jumping over function bodies with the function summaries is opt-in, since a jump reports one route through a body for all of them; when a sanitizer shows up inside a body that paths already went through, the pairs of those paths are searched again (duplicates are dropped by the path store), so routes that avoid it are still found.
 
-Each search pattern is it's own thread that is managed by the orchestrator.
+Each search pattern is it's own thread that is managed by the orchestrator. Searches are run by a scheduler with a bounded number of workers: new pairs wait in a priority queue ordered by the combined source/sink confidence and rule severity, so the most promising pairs are answered first and memory stays bounded. With worker processes enabled the searches themselves run in a process pool attached to a memory mapped snapshot of the graph (see Paths/ProcessPool.py), so path search scales with the number of cores.
 
-When a path is discovered, information is passed onto the analysis queue
+With racing enabled the searches of a pair run side by side until one of them settles it: the first to find a witness, or the first to run to the end without a limit cutting it short (a search that finds nothing that way has proved there is no path). The other searches of the pair are cancelled and the winner carries on, so adding engines makes a pair finish sooner instead of later. Searches running in worker processes can only be cancelled before they start; a search already running there finishes and its result is dropped.
+
+When a path is discovered, information is passed onto the analysis queue through a path store that fingerprints every path and drops the ones already sent, so the same path found by several search patterns only reaches the analysis queue once.
 
 # Input
  - 'source' async queue
@@ -14,28 +16,97 @@ When a path is discovered, information is passed onto the analysis queue
  - 'santitzer' async queue
  - graph object (CodeQL)
  - path analysis async queue
+ - search strategies to run for each pair, as search classes or strategy configurations with their own budgets (defaults to depth first search)
+ - optionally, race the strategies of a pair and cancel the rest once one settles it
+ - maximum number of searches running at the same time
+ - number of worker processes to run searches in (0 runs them on the event loop)
+ - options passed to every search (limits, unsanitized only mode, edge kinds to follow)
+ - optionally, step over function bodies with function summaries, and a summary cache file reused across runs
+ - optionally, search a view of the graph with its linear chains collapsed (see Graphs/Compaction.py)
+ - optionally, skip pairs that are not connected at all, found for batches of sources at once: a pair waits briefly for other sources to batch with (see Paths/BitsetReachability.py)
 
 # Output
  None, but the threads under this can return data over the path analysis queue
+ - (via queue) an end-of-stream marker once every detector stream has ended and the searches have drained
 
 # Algorthim
-The orchestrator will track the source/sink pairs that are tested for each of the search patterns so that things are not repeated. There will be a bit of a race condition as santitizers will not all be discovered yet, however in the final path analysis step it can block until all the santitzers are discovered for a final check.
+The orchestrator will track the source/sink pairs that are tested for each of the search patterns so that things are not repeated. Pairing is incremental and driven by the queue monitors: a new source is paired only with the sinks already known and a new sink only with the sources already known, so each pair is created exactly once and nothing is re-scanned while the queues are idle. Santitizers will not all be discovered yet when a search starts, so each new sanitizer is also handed to the path store, which sends a sanitizer update for every path already sent that goes through it. The sanitizer status of a path is therefore correct without waiting for the detectors to finish and without re-running any search.
+
+Each detector stream ends with an end-of-stream marker (see Detectors/__init__.py). Once the source, sink and sanitizer streams have all ended no new pair can come, so the orchestrator waits for the queued searches to drain, puts its own end-of-stream marker on the path analysis queue after the last path, and returns. Every stream that ends is logged with how long it took, and start() can still be ended early with stop().
  
  </spec>
 """
 
 import asyncio
-from typing import Set, List, Dict, Any, Tuple
+from typing import Set, List, Dict, Any, Tuple, Optional, Type, Union, Callable
+import functools
 import logging
+import time
+from Detectors import EndOfStream
+from Graphs.Compaction import ChainCompaction
+from Paths import PathSearch, detection_key, find_node_id
 from Paths.DepthFirstSearch import DepthFirstSearch
+from Paths.MultiSourceSearch import SourceReachability
+from Paths.Scheduler import SearchScheduler
+from Paths.ProcessPool import ProcessPoolBackend
+from Paths.PathStore import PathStore
+from Paths.SanitizerLog import SanitizerLog
+from Paths.ReachabilityMemo import ReachabilityMemo
+from Paths.SanitizerDominance import SanitizerDominance
+from Paths.FunctionSummaries import FunctionSummaries
+from Paths.PredecessorIndex import PredecessorIndex
+from Paths.BitsetReachability import BitsetReachability
+from Paths.StrategyRegistry import StrategyConfig
 
 logger = logging.getLogger(__name__)
 
+# Weight added to a pair's priority for the severity of its source and sink rules
+SEVERITY_WEIGHTS = {
+    'critical': 1.0,
+    'error': 1.0,
+    'high': 1.0,
+    'warning': 0.5,
+    'medium': 0.5,
+    'info': 0.0,
+    'low': 0.0
+}
+
+# Longest a pair waits for more sources to batch with before the prefilter propagates the queued ones
+PREFILTER_WAIT = 0.2
+
+# Confidence of a detection given as a level instead of a number
+CONFIDENCE_WEIGHTS = {
+    'certain': 1.0,
+    'high': 0.9,
+    'medium': 0.5,
+    'low': 0.2
+}
+
+
+class _RaceQueue:
+    """Path queue of one raced search: forwards its paths to the path store and reports that it found a witness"""
+    def __init__(self, path_store: PathStore, on_witness: Callable[[], None]):
+        self.path_store = path_store
+        self.on_witness = on_witness
+    
+    async def put(self, path_info: Dict[str, Any]):
+        await self.path_store.put(path_info)
+        self.on_witness()
+
 
 class Orchestrator:
     def __init__(self, source_queue: asyncio.Queue, sink_queue: asyncio.Queue,
                  sanitizer_queue: asyncio.Queue, graph: Any, 
-                 path_analysis_queue: asyncio.Queue):
+                 path_analysis_queue: asyncio.Queue,
+                 strategies: Optional[List[Union[Type[PathSearch], StrategyConfig]]] = None,
+                 max_concurrent_searches: int = 8,
+                 workers: int = 0,
+                 search_options: Optional[Dict[str, Any]] = None,
+                 function_summaries: bool = False,
+                 summary_cache: Optional[str] = None,
+                 compact_chains: bool = False,
+                 prefilter: bool = False,
+                 race: bool = False):
         """
         Initialize the orchestrator
         
@@ -45,120 +116,473 @@ class Orchestrator:
             sanitizer_queue: Queue receiving sanitizer detections
             graph: CodeQL graph object
             path_analysis_queue: Queue to send path analysis results
+            strategies: Search classes or strategy configurations to run for each source/sink pair (default: DepthFirstSearch)
+            max_concurrent_searches: Maximum number of pair searches running at the same time
+            workers: Number of worker processes to run searches in (0 runs them on the event loop)
+            search_options: Options passed to every search, such as limits, unsanitized_only or edge_kinds (see PathSearch)
+            function_summaries: Let searches that can step over function bodies do so (see Paths/FunctionSummaries.py)
+            summary_cache: File function summaries are loaded from and saved to across runs (None to not persist them)
+            compact_chains: Search a view of the graph with its linear chains collapsed (searches on the event loop only)
+            prefilter: Skip pairs whose sink is not reachable from the source, checked in bit-parallel batches (needs NumPy)
+            race: Cancel the other searches of a pair once one of them settles it
         """
         self.source_queue = source_queue
         self.sink_queue = sink_queue
         self.sanitizer_queue = sanitizer_queue
-        self.graph = graph
         self.path_analysis_queue = path_analysis_queue
+        self.strategies: List[StrategyConfig] = [
+            strategy if isinstance(strategy, StrategyConfig) else StrategyConfig(strategy)
+            for strategy in strategies or [DepthFirstSearch]
+        ]
+        self.search_options = search_options or {}
+        
+        # Worker processes search their own snapshot of the graph, so chains are only collapsed on the event loop
+        self.graph = ChainCompaction(graph) if compact_chains and workers <= 0 else graph
+        
+        # Deduplicates paths across strategies before they reach the path analysis queue
+        self.path_store = PathStore(path_analysis_queue)
+        
+        # Function index of the graph, also used for function summaries when they are enabled
+        self.functions = FunctionSummaries(graph, cache_path=summary_cache)
+        self.summaries = self.functions if function_summaries else None
+        
+        # Resources shared by every search task, handed to strategies that ask for them
+        self.shared_resources: Dict[str, Any] = {
+            "reachability": SourceReachability(self.graph),
+            "reach_memo": ReachabilityMemo(),
+            "predecessors": PredecessorIndex(self.graph),
+            "functions": self.functions,
+            "summaries": self.summaries
+        }
+        
+        # Optional vectorized reachability check run before the searches of a pair
+        self.prefilter: Optional[BitsetReachability] = None
+        self.skipped_pairs = 0
+        
+        # Pairs waiting for the queued sources to be propagated, and the timer that flushes them
+        self._prefilter_batch: Optional[asyncio.Future] = None
+        self._prefilter_timer: Optional[asyncio.TimerHandle] = None
+        if prefilter:
+            try:
+                self.prefilter = BitsetReachability(graph, edge_kinds=self.search_options.get("edge_kinds"))
+            except ImportError as e:
+                logger.warning(f"Reachability prefilter disabled: {e}")
+        
+        # Racing: which strategy settled each raced pair, and how many searches were cancelled
+        self.race = race
+        self.race_wins: Dict[str, int] = {}
+        self.cancelled_searches = 0
         
         # Track tested source/sink pairs to avoid duplicates
         self.tested_pairs: Set[Tuple[str, str]] = set()
         
-        # Track all sanitizers discovered
-        self.all_sanitizers: List[Dict[str, Any]] = []
+        # Track all sanitizers discovered, search tasks hold a view pinned at a version
+        self.sanitizer_log = SanitizerLog()
+        
+        # Pair key -> dominance checks queued or running for a stale verdict
+        self.verdict_rechecks: Dict[Tuple[str, str], int] = {}
         
-        # Control flag
+        # Control flag, and the task pairing detections and draining the searches while running
         self.running = False
+        self.started_at: Optional[float] = None
+        self._pipeline: Optional[asyncio.Task] = None
         
-        # Task tracking
-        self.tasks: List[asyncio.Task] = []
+        # Stream name -> items received and seconds until its end-of-stream marker arrived
+        self.completed_streams: Dict[str, Dict[str, Any]] = {}
+        
+        # Bounded, prioritized execution of the pair searches
+        self.scheduler = SearchScheduler(concurrency=max_concurrent_searches)
+        
+        # Optional process pool the searches are offloaded to
+        self.backend = ProcessPoolBackend(graph, max_workers=workers, function_summaries=function_summaries,
+                                          summaries=self.summaries) if workers > 0 else None
         
         # Track available sources and sinks
         self.sources_available: List[Dict[str, Any]] = []
         self.sinks_available: List[Dict[str, Any]] = []
+        self.source_keys: Set[str] = set()
+        self.sink_keys: Set[str] = set()
+        
+        # Detection key -> graph node, resolved once per detection instead of once per search
+        self.detection_nodes: Dict[str, Optional[Any]] = {}
     
     async def start(self):
-        """Start the orchestrator and begin monitoring queues"""
+        """Start the orchestrator and monitor the queues until every detector stream has ended and the searches drained, or stop() is called"""
         self.running = True
+        self.started_at = time.monotonic()
         
-        # Create tasks for monitoring each queue
-        monitor_tasks = [
-            asyncio.create_task(self._monitor_sources()),
-            asyncio.create_task(self._monitor_sinks()),
-            asyncio.create_task(self._monitor_sanitizers()),
-            asyncio.create_task(self._process_combinations())
-        ]
+        if self.backend:
+            self.backend.start()
+        self.scheduler.start()
         
+        self._pipeline = asyncio.create_task(self._run_pipeline())
         try:
-            await asyncio.gather(*monitor_tasks)
+            await self._pipeline
         except asyncio.CancelledError:
-            # Clean up tasks
-            for task in self.tasks:
-                if not task.done():
-                    task.cancel()
-            await asyncio.gather(*self.tasks, return_exceptions=True)
-            raise
+            # stop() cancels the pipeline, anything else cancelling start() is passed on
+            if self.running:
+                raise
+        finally:
+            # Clean up the search workers
+            await self.scheduler.stop()
+            if self.backend:
+                self.backend.close()
+            if self.summaries is not None:
+                self.summaries.save()
     
     def stop(self):
         """Stop the orchestrator"""
         self.running = False
+        if self._pipeline is not None:
+            self._pipeline.cancel()
+    
+    async def _run_pipeline(self):
+        """Pair detections as they stream in, then wait for the searches to drain and end the path stream"""
+        await asyncio.gather(self._monitor_sources(), self._monitor_sinks(), self._monitor_sanitizers())
+        
+        # Every detector stream has ended, so no new pair can come
+        await self.scheduler.join()
+        
+        elapsed = time.monotonic() - self.started_at
+        unique = self.path_store.stats()["unique"]
+        logger.info(f"Path search done: {len(self.tested_pairs)} pairs, {unique} paths in {elapsed:.2f}s")
+        await self.path_analysis_queue.put(EndOfStream("paths", elapsed, items=unique))
+    
+    @property
+    def all_sanitizers(self) -> List[Dict[str, Any]]:
+        """All sanitizer detections received so far, in arrival order"""
+        return self.sanitizer_log.entries
     
     async def _monitor_sources(self):
-        """Monitor source queue for new detections"""
-        while self.running:
-            try:
-                source = await asyncio.wait_for(self.source_queue.get(), timeout=0.1)
-                self.sources_available.append(source)
-                logger.debug(f"New source detected: {source}")
-            except asyncio.TimeoutError:
-                continue
+        """Monitor source queue for new detections until the source stream ends"""
+        while True:
+            source = await self.source_queue.get()
+            if self._stream_ended("sources", source, len(self.sources_available)):
+                # No source is left to batch with the queued ones
+                self._flush_prefilter()
+                return
+            self._add_source(source)
     
     async def _monitor_sinks(self):
-        """Monitor sink queue for new detections"""
-        while self.running:
-            try:
-                sink = await asyncio.wait_for(self.sink_queue.get(), timeout=0.1)
-                self.sinks_available.append(sink)
-                logger.debug(f"New sink detected: {sink}")
-            except asyncio.TimeoutError:
-                continue
+        """Monitor sink queue for new detections until the sink stream ends"""
+        while True:
+            sink = await self.sink_queue.get()
+            if self._stream_ended("sinks", sink, len(self.sinks_available)):
+                return
+            self._add_sink(sink)
     
     async def _monitor_sanitizers(self):
-        """Monitor sanitizer queue and track all sanitizers"""
-        while self.running:
+        """Monitor sanitizer queue and track all sanitizers until the sanitizer stream ends"""
+        while True:
+            sanitizer = await self.sanitizer_queue.get()
+            if self._stream_ended("sanitizers", sanitizer, len(self.sanitizer_log.entries)):
+                return
+            
+            node_id = find_node_id(self.graph, sanitizer.get('line_number'))
+            self.sanitizer_log.append(sanitizer, node_id)
+            if isinstance(self.graph, ChainCompaction):
+                self.graph.protect(node_id)
+            logger.debug(f"New sanitizer detected: {sanitizer}")
+            
+            # Correct the paths already sent instead of searching again
+            await self.path_store.add_sanitizer(node_id)
+            self._research_summarized_pairs(node_id)
+            self._recheck_stale_verdicts()
+    
+    def _research_summarized_pairs(self, node_id: Any):
+        """Search again the pairs with a path through the function body a late sanitizer is in, since a jump over it reported one route only"""
+        function = self.summaries.function_of(node_id) if self.summaries is not None and node_id is not None else None
+        if function is None:
+            return
+        
+        for source, sink in self.path_store.pairs_through(self.summaries.members(function)):
+            logger.debug(f"Searching {source} to {sink} again, sanitizer found in {function}")
+            self.scheduler.submit(self._get_pair_priority(source, sink), self._create_search_task, source, sink)
+    
+    def _recheck_stale_verdicts(self):
+        """Run the dominance check again for the pairs whose verdict a late sanitizer made stale"""
+        stale = self.path_store.take_stale_verdicts()
+        if not stale:
+            return
+        
+        # The check must replace the stale record, so it reports a pair that turned out sanitized even in unsanitized only mode
+        configs = [
+            StrategyConfig(config.strategy, **dict(config.options, unsanitized_only=False))
+            for config in self.strategies if issubclass(config.strategy, SanitizerDominance)
+        ] or [StrategyConfig(SanitizerDominance, unsanitized_only=False)]
+        for source, sink in stale:
+            logger.debug(f"Checking {source} to {sink} again, its sanitizer verdict is stale")
+            pair_key = self._get_pair_key(source, sink)
+            self.verdict_rechecks[pair_key] = self.verdict_rechecks.get(pair_key, 0) + 1
+            self.scheduler.submit(self._get_pair_priority(source, sink), self._recheck_verdict, source, sink, configs)
+    
+    async def _recheck_verdict(self, source: Dict[str, Any], sink: Dict[str, Any], configs: List[StrategyConfig]):
+        """Run the dominance check of a pair again, settling its verdict if no check replaced the stale one"""
+        await self._create_search_task(source, sink, configs)
+        
+        # A sanitizer found meanwhile may have queued another check, which settles the pair instead
+        pair_key = self._get_pair_key(source, sink)
+        self.verdict_rechecks[pair_key] -= 1
+        if self.verdict_rechecks[pair_key] == 0:
+            del self.verdict_rechecks[pair_key]
+            await self.path_store.settle_verdict(source, sink)
+    
+    def _stream_ended(self, stream: str, item: Any, items: int) -> bool:
+        """
+        Check whether an item from a detector queue is the stream's end-of-stream marker, recording when it arrived
+        
+        Args:
+            stream: Name of the stream (sources, sinks or sanitizers)
+            item: Item taken from the stream's queue
+            items: Number of detections received from the stream
+        
+        Returns:
+            True if the stream has ended
+        """
+        if not isinstance(item, EndOfStream):
+            return False
+        
+        elapsed = time.monotonic() - self.started_at
+        self.completed_streams[stream] = {"items": items, "elapsed": elapsed}
+        logger.info(f"{stream.capitalize()} stream done: {items} received in {elapsed:.2f}s "
+                    f"(detector ran {item.elapsed:.2f}s)")
+        return True
+    
+    def _add_source(self, source: Dict[str, Any]):
+        """Record a new source and pair it with every sink known so far"""
+        source_key = self._get_detection_key(source)
+        if source_key in self.source_keys:
+            return
+        
+        self.source_keys.add(source_key)
+        self.sources_available.append(source)
+        if isinstance(self.graph, ChainCompaction):
+            # Protected once here, so the view does not change under shared tables when the searches start
+            self.graph.protect(self._node_of(source))
+        if self.prefilter:
+            # Queued now so the sources seen before the first check are propagated together
+            self.prefilter.add_source(self._node_of(source))
+            if self.prefilter.pending >= self.prefilter.batch_size:
+                self._flush_prefilter()
+        logger.debug(f"New source detected: {source}")
+        
+        for sink in self.sinks_available:
+            self._start_pair(source, sink)
+    
+    def _add_sink(self, sink: Dict[str, Any]):
+        """Record a new sink and pair it with every source known so far"""
+        sink_key = self._get_detection_key(sink)
+        if sink_key in self.sink_keys:
+            return
+        
+        self.sink_keys.add(sink_key)
+        self.sinks_available.append(sink)
+        if isinstance(self.graph, ChainCompaction):
+            self.graph.protect(self._node_of(sink))
+        logger.debug(f"New sink detected: {sink}")
+        
+        for source in self.sources_available:
+            self._start_pair(source, sink)
+    
+    def _start_pair(self, source: Dict[str, Any], sink: Dict[str, Any]):
+        """Start the search task for a source/sink pair unless it was already tested"""
+        pair_key = self._get_pair_key(source, sink)
+        
+        if pair_key not in self.tested_pairs:
+            self.tested_pairs.add(pair_key)
+            
+            # Queue the search for this pair, highest priority first
+            priority = self._get_pair_priority(source, sink)
+            self.scheduler.submit(priority, self._create_search_task, source, sink)
+    
+    def _get_pair_priority(self, source: Dict[str, Any], sink: Dict[str, Any]) -> float:
+        """Score a pair by its combined confidence and rule severity, higher runs first"""
+        priority = 0.0
+        
+        for detection in (source, sink):
+            # Confidence levels are weighted, numbers (also as text) taken as is, and anything else counts as 0.5
+            confidence = detection.get('confidence', 0.5)
+            if isinstance(confidence, str):
+                confidence = CONFIDENCE_WEIGHTS.get(confidence.strip().lower(), confidence)
             try:
-                sanitizer = await asyncio.wait_for(self.sanitizer_queue.get(), timeout=0.1)
-                self.all_sanitizers.append(sanitizer)
-                logger.debug(f"New sanitizer detected: {sanitizer}")
-            except asyncio.TimeoutError:
-                continue
-    
-    async def _process_combinations(self):
-        """Process available source/sink combinations"""
-        while self.running:
-            # Check for new combinations
-            for source in self.sources_available:
-                for sink in self.sinks_available:
-                    pair_key = self._get_pair_key(source, sink)
-                    
-                    if pair_key not in self.tested_pairs:
-                        self.tested_pairs.add(pair_key)
-                        
-                        # Create search task for this pair
-                        task = asyncio.create_task(self._create_search_task(source, sink))
-                        self.tasks.append(task)
+                priority += float(confidence)
+            except (TypeError, ValueError):
+                priority += 0.5
             
-            await asyncio.sleep(0.05)  # Small delay to prevent tight loop
+            severity = detection.get('severity')
+            if isinstance(severity, (int, float)):
+                priority += float(severity)
+            elif isinstance(severity, str):
+                priority += SEVERITY_WEIGHTS.get(severity.lower(), 0.0)
+        
+        return priority
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Return pairing and search scheduling statistics"""
+        stats = self.scheduler.stats()
+        stats.update({
+            "sources": len(self.sources_available),
+            "sinks": len(self.sinks_available),
+            "pairs": len(self.tested_pairs),
+            "paths": self.path_store.stats(),
+            "reach_memo": self.shared_resources["reach_memo"].stats()
+        })
+        if self.summaries is not None:
+            stats["summaries"] = self.summaries.stats()
+        if isinstance(self.graph, ChainCompaction):
+            stats["compaction"] = self.graph.stats()
+        if self.completed_streams:
+            stats["streams"] = dict(self.completed_streams)
+        if self.race:
+            stats["race"] = {"wins": dict(self.race_wins), "cancelled": self.cancelled_searches}
+        if self.prefilter:
+            stats["prefilter"] = dict(self.prefilter.stats(), skipped_pairs=self.skipped_pairs)
+        return stats
+    
+    def _get_detection_key(self, detection: Dict[str, Any]) -> str:
+        """Generate unique key for a source or sink detection"""
+        return detection_key(detection)
+    
+    async def _prefilter_reaches(self, source_node: Any, sink_node: Any) -> bool:
+        """Check a pair with the prefilter, first letting its source batch up with others if it has not been propagated"""
+        if not self.prefilter.propagated(source_node) and "sources" not in self.completed_streams:
+            self.prefilter.add_source(source_node)
+            if self.prefilter.pending >= self.prefilter.batch_size:
+                self._flush_prefilter()
+            else:
+                if self._prefilter_batch is None:
+                    loop = asyncio.get_running_loop()
+                    self._prefilter_batch = loop.create_future()
+                    self._prefilter_timer = loop.call_later(PREFILTER_WAIT, self._flush_prefilter)
+                # Shielded so a cancelled pair does not cancel the batch for the others
+                await asyncio.shield(self._prefilter_batch)
+        
+        return self.prefilter.reaches(source_node, sink_node)
+    
+    def _flush_prefilter(self):
+        """Propagate the sources queued in the prefilter and wake the pairs waiting for them"""
+        if self._prefilter_timer is not None:
+            self._prefilter_timer.cancel()
+            self._prefilter_timer = None
+        
+        if self.prefilter:
+            self.prefilter.propagate()
+        
+        batch, self._prefilter_batch = self._prefilter_batch, None
+        if batch is not None and not batch.done():
+            batch.set_result(None)
+    
+    def _node_of(self, detection: Dict[str, Any]) -> Optional[Any]:
+        """Return the graph node of a detection, looking it up the first time the detection is seen"""
+        key = self._get_detection_key(detection)
+        if key not in self.detection_nodes:
+            self.detection_nodes[key] = find_node_id(self.graph, detection.get('line_number'))
+        return self.detection_nodes[key]
     
     def _get_pair_key(self, source: Dict[str, Any], sink: Dict[str, Any]) -> Tuple[str, str]:
         """Generate unique key for source/sink pair"""
-        source_key = f"{source.get('file', '')}:{source.get('line_number', '')}"
-        sink_key = f"{sink.get('file', '')}:{sink.get('line_number', '')}"
-        return (source_key, sink_key)
-    
-    async def _create_search_task(self, source: Dict[str, Any], sink: Dict[str, Any]):
-        """Create and run a search task for a source/sink pair"""
-        logger.info(f"Starting DFS search from {source} to {sink}")
-        
-        # Create DFS instance with current sanitizers
-        dfs = DepthFirstSearch(
-            source=source,
-            sink=sink,
-            sanitizers=self.all_sanitizers.copy(),  # Pass copy of current sanitizers
-            graph=self.graph,
-            path_analysis_queue=self.path_analysis_queue
-        )
-        
-        # Run the search
-        await dfs.find_paths()
\ No newline at end of file
+        return (self._get_detection_key(source), self._get_detection_key(sink))
+    
+    async def _create_search_task(self, source: Dict[str, Any], sink: Dict[str, Any],
+                                  strategies: Optional[List[StrategyConfig]] = None):
+        """Create and run a search task for a source/sink pair, with the configured strategies unless others are given"""
+        strategies = strategies or self.strategies
+        source_node, sink_node = self._node_of(source), self._node_of(sink)
+        if source_node is None or sink_node is None:
+            logger.debug(f"Skipping {source} to {sink}: not in the graph")
+            return
+        
+        if self.prefilter and not await self._prefilter_reaches(source_node, sink_node):
+            self.skipped_pairs += 1
+            logger.debug(f"Skipping {source} to {sink}: sink not reachable")
+            return
+        
+        names = ", ".join(config.name for config in strategies)
+        logger.info(f"Starting {names} search from {source} to {sink}")
+        
+        # Create one search per strategy with the sanitizers known now, its own options over the shared ones
+        sanitizers = self.sanitizer_log.view()
+        searches = [
+            config.strategy(
+                source=source,
+                sink=sink,
+                sanitizers=sanitizers,
+                graph=self.graph,
+                path_analysis_queue=self.path_store,
+                source_node=source_node,
+                sink_node=sink_node,
+                **dict(self.search_options, **config.options),
+                **{name: self.shared_resources[name] for name in config.strategy.shared_resources}
+            )
+            for config in strategies
+        ]
+        
+        if self.race and len(searches) > 1:
+            await self._race(searches, [config.name for config in strategies])
+        else:
+            # Run the searches alongside each other
+            await asyncio.gather(*(self._run_search(search) for search in searches))
+        
+        # A sanitizer discovered while the searches ran may have made a verdict they reported stale
+        self._recheck_stale_verdicts()
+    
+    async def _race(self, searches: List[PathSearch], names: List[str]):
+        """
+        Run the searches of a pair side by side until one settles the pair, then cancel the others
+        
+        Args:
+            searches: Searches of one source/sink pair
+            names: Name of each search's strategy configuration, for the statistics
+        """
+        settled = asyncio.Event()
+        winners: List[int] = []
+        
+        def settle(index: int):
+            if not winners:
+                winners.append(index)
+                settled.set()
+        
+        async def run(index: int, search: PathSearch):
+            await self._run_search(search)
+            # Ran to the end without a limit cutting it short, so finding nothing proves there is no path
+            if not search.truncated:
+                settle(index)
+        
+        for index, search in enumerate(searches):
+            search.path_analysis_queue = _RaceQueue(self.path_store, functools.partial(settle, index))
+        
+        runs = [asyncio.create_task(run(index, search)) for index, search in enumerate(searches)]
+        waiter = asyncio.create_task(settled.wait())
+        pending = set(runs)
+        try:
+            while pending and not settled.is_set():
+                _, pending = await asyncio.wait(pending | {waiter}, return_when=asyncio.FIRST_COMPLETED)
+                pending.discard(waiter)
+        except asyncio.CancelledError:
+            for task in runs:
+                task.cancel()
+            raise
+        finally:
+            waiter.cancel()
+        
+        if winners:
+            winner = winners[0]
+            self.race_wins[names[winner]] = self.race_wins.get(names[winner], 0) + 1
+            logger.debug(f"{names[winner]} settled {searches[winner].source} to {searches[winner].sink}")
+            
+            # The winner carries on to report the rest of its paths
+            for index, task in enumerate(runs):
+                if index != winner and not task.done():
+                    task.cancel()
+                    self.cancelled_searches += 1
+        
+        for result in await asyncio.gather(*runs, return_exceptions=True):
+            if isinstance(result, Exception):
+                raise result
+    
+    async def _run_search(self, search: PathSearch):
+        """Run a search on the event loop, or in the process pool when one is configured"""
+        if self.backend:
+            await self.backend.run(search)
+        else:
+            await search.find_paths()
\ No newline at end of file
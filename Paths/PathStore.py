@@ -0,0 +1,385 @@
+"""
+<spec>
+The path store sits in front of the path analysis queue and makes sure downstream stages never see the same path twice.
+
+Different search strategies (and the same strategy run for overlapping pairs) find the same paths. Every path is given a fingerprint, a stable hash over the source identity, the sink identity and the sequence of node IDs. The first time a fingerprint is seen the path is forwarded to the queue with the fingerprint attached; repeats are dropped.
+
+The store keeps per-strategy counts of unique and duplicate paths, which is what the UI reports as "unique" paths across algorithms.
+
+Searches only know the sanitizers discovered before they started, so the store also keeps every emitted path indexed by the nodes it contains. When a sanitizer is discovered later, `add_sanitizer` looks up the paths going through its node and sends an update for each of them with the corrected `goes_through_sanitizer` / `sanitizers_crossed` fields; no search is run again. Paths arriving after a sanitizer was added are checked against it before they are forwarded.
+
+The one exception is a dominance verdict (see Paths/SanitizerDominance.py): a new sanitizer on its witness path can change the verdict itself, which the store cannot work out without the graph. Its update is sent with 'verdict': 'stale' and the pair is kept for `take_stale_verdicts`, so the orchestrator can run the dominance check again. A pair has one verdict whatever its witness, so verdict fingerprints leave the witness out: the fresh verdict has the fingerprint of the stale one and replaces that record, witness included, and is sent as an update. A check that ends without a verdict (a limit cut it short) is settled with `settle_verdict`, which sends 'verdict': 'unknown' for the record instead of leaving it stale.
+
+Stored paths are kept in compact form (see Paths/PathTrie.py): node sequences in a shared prefix tree and source/sink detections in a table, referenced by integer IDs, and the strategy name by its index. Other fields a search attaches (a chop, a verdict) are kept in a dictionary for the records that have any. Full path information messages are only rebuilt when they are put on the queue.
+
+# Input
+ - path analysis async queue
+ - path information messages (via put, the same interface as the queue)
+
+# Output
+ - (via queue) Each unique path, once
+ - (via queue) Sanitizer updates for paths already sent, marked with 'update': True
+</spec>
+"""
+
+import asyncio
+import hashlib
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from Paths import detection_key
+from Paths.PathTrie import PathTrie, DetectionTable, ROOT
+
+# Record kinds stored once per source/sink pair
+PAIR_KINDS = ("verdict",)
+
+
+def path_fingerprint(path_info: Dict[str, Any]) -> str:
+    """
+    Compute the stable fingerprint of a path
+    
+    Args:
+        path_info: Path information with 'source', 'sink' and 'path' keys (and 'kind' for other records)
+    
+    Returns:
+        Hex digest identifying the record kind, source, sink and node sequence (a verdict's witness is left out)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    
+    # Records other than plain paths (such as chops) never collide with the path they carry as a witness
+    kind = path_info.get('kind')
+    if kind:
+        digest.update(kind.encode('utf-8'))
+        digest.update(b'\x1d')
+    
+    digest.update(detection_key(path_info.get('source', {})).encode('utf-8'))
+    digest.update(b'\x1e')
+    digest.update(detection_key(path_info.get('sink', {})).encode('utf-8'))
+    
+    # There is one verdict per pair, whichever witness it was found with
+    if kind in PAIR_KINDS:
+        return digest.hexdigest()
+    
+    for node_id in path_info.get('path', []):
+        digest.update(b'\x1e')
+        digest.update(str(node_id).encode('utf-8'))
+    return digest.hexdigest()
+
+
+# Keys rebuilt from the compact record; everything else a search attaches is kept as is
+RECORD_KEYS = ("source", "sink", "path", "goes_through_sanitizer", "sanitizers_crossed", "strategy", "fingerprint")
+
+
+class PathStore:
+    def __init__(self, path_analysis_queue: asyncio.Queue):
+        """
+        Initialize the path store
+        
+        Args:
+            path_analysis_queue: Queue unique paths are forwarded to
+        """
+        self.path_analysis_queue = path_analysis_queue
+        
+        # Fingerprint -> record ID
+        self.fingerprints: Dict[str, int] = {}
+        
+        # Compact records: paths live in a shared prefix tree and detections in a table, both referenced by ID
+        self.trie = PathTrie()
+        self.detections = DetectionTable()
+        self.record_fingerprints: List[str] = []
+        self.record_paths = array('q')
+        self.record_sources = array('q')
+        self.record_sinks = array('q')
+        self.record_strategies = array('q')
+        self.record_crossed: List[Tuple[int, ...]] = []
+        self.record_extras: List[Optional[Dict[str, Any]]] = []
+        
+        # Strategy names referenced by records (-1 for a record without one)
+        self.strategy_names: List[str] = []
+        self.strategy_ids: Dict[str, int] = {}
+        
+        # Trie entry -> records whose path ends there, and chop node -> chop records covering it
+        self.terminals: Dict[int, List[int]] = {}
+        self.chop_index: Dict[Any, List[int]] = {}
+        
+        # Sanitizer nodes reported to the store, applied to every path it forwards
+        self.sanitizer_nodes: Set[Any] = set()
+        self.updates = 0
+        
+        # Verdict records a late sanitizer made stale, and their pairs waiting to be checked again
+        self.stale_records: Set[int] = set()
+        self.stale_pairs: List[Tuple[int, int]] = []
+        
+        # Strategy name -> {"unique": count, "duplicates": count}
+        self.strategy_counts: Dict[str, Dict[str, int]] = {}
+    
+    async def put(self, path_info: Dict[str, Any]) -> bool:
+        """
+        Forward a path to the queue unless an identical path was already forwarded
+        
+        Args:
+            path_info: Path information message
+        
+        Returns:
+            True if the path was new and queued, False if it was a duplicate
+        """
+        fingerprint = path_fingerprint(path_info)
+        counts = self.strategy_counts.setdefault(
+            path_info.get('strategy', 'unknown'),
+            {"unique": 0, "duplicates": 0}
+        )
+        
+        known = self.fingerprints.get(fingerprint)
+        if known is not None and known not in self.stale_records:
+            counts["duplicates"] += 1
+            return False
+        
+        if known is None:
+            counts["unique"] += 1
+            record = self._add_record(fingerprint, path_info)
+        else:
+            # A verdict checked again replaces the stale record, with whichever witness it was found with
+            record = known
+            self.stale_records.discard(record)
+            self._unlink_path(record)
+            self._set_record(record, path_info)
+        
+        # The search may have started before some of the known sanitizers were discovered
+        for node_id in {node for node in self._record_nodes(path_info) if node in self.sanitizer_nodes}:
+            self._mark_sanitizer(record, node_id)
+        
+        message = self.materialize(record)
+        if known is not None:
+            message["update"] = True
+            self.updates += 1
+        await self.path_analysis_queue.put(message)
+        return True
+    
+    async def add_sanitizer(self, node_id: Any) -> int:
+        """
+        Apply a newly discovered sanitizer to the paths already sent
+        
+        Args:
+            node_id: Graph node of the sanitizer
+        
+        Returns:
+            Number of paths an update was sent for
+        """
+        if node_id is None or node_id in self.sanitizer_nodes:
+            return 0
+        self.sanitizer_nodes.add(node_id)
+        
+        # Every path through the node has a trie entry for it as part of its prefix
+        affected = set(self.chop_index.get(node_id, ()))
+        for entry in self.trie.entries_with(node_id):
+            for descendant in self.trie.subtree(entry):
+                affected.update(self.terminals.get(descendant, ()))
+        
+        updated = 0
+        for record in sorted(affected):
+            if not self._mark_sanitizer(record, node_id):
+                continue
+            
+            await self.path_analysis_queue.put(dict(self.materialize(record), update=True))
+            updated += 1
+        
+        self.updates += updated
+        return updated
+    
+    def pairs_through(self, nodes: Iterable[Any]) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Return the source/sink pairs of the stored paths going through any of the nodes
+        
+        Args:
+            nodes: Graph nodes
+        
+        Returns:
+            (source, sink) detections, once per pair
+        """
+        pairs = set()
+        for node_id in nodes:
+            for entry in self.trie.entries_with(node_id):
+                for descendant in self.trie.subtree(entry):
+                    for record in self.terminals.get(descendant, ()):
+                        pairs.add((self.record_sources[record], self.record_sinks[record]))
+        return [(self.detections.get(source), self.detections.get(sink)) for source, sink in sorted(pairs)]
+    
+    def take_stale_verdicts(self) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Return the source/sink pairs whose dominance verdict went stale since the last call
+        
+        Returns:
+            (source, sink) detections, once per pair
+        """
+        pairs = sorted(set(self.stale_pairs))
+        self.stale_pairs.clear()
+        return [(self.detections.get(source), self.detections.get(sink)) for source, sink in pairs]
+    
+    async def settle_verdict(self, source: Dict[str, Any], sink: Dict[str, Any]) -> bool:
+        """
+        Mark a pair's verdict unknown when it is still stale after being checked again
+        
+        Args:
+            source: Source detection
+            sink: Sink detection
+        
+        Returns:
+            True if an update was sent for the verdict
+        """
+        record = self.fingerprints.get(path_fingerprint({"kind": "verdict", "source": source, "sink": sink}))
+        if record is None or record not in self.stale_records:
+            return False
+        
+        # A pair still waiting to be checked again is settled by that check
+        if (self.record_sources[record], self.record_sinks[record]) in self.stale_pairs:
+            return False
+        
+        self.stale_records.discard(record)
+        self.record_extras[record] = dict(self.record_extras[record], verdict="unknown")
+        await self.path_analysis_queue.put(dict(self.materialize(record), update=True))
+        self.updates += 1
+        return True
+    
+    def get(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Return the path information of a stored path, or None if the fingerprint is unknown"""
+        record = self.fingerprints.get(fingerprint)
+        return None if record is None else self.materialize(record)
+    
+    def materialize(self, record: int) -> Dict[str, Any]:
+        """
+        Rebuild the full path information message of a stored record
+        
+        Args:
+            record: Record ID
+        
+        Returns:
+            Path information with the path, detections and sanitizer fields filled in
+        """
+        path = self.trie.path(self.record_paths[record])
+        crossed = {self.trie.node_ids[label] for label in self.record_crossed[record]}
+        sanitizers_crossed = [node for node in path if node in crossed]
+        
+        path_info = {
+            "source": self.detections.get(self.record_sources[record]),
+            "sink": self.detections.get(self.record_sinks[record]),
+            "path": path,
+            "goes_through_sanitizer": len(sanitizers_crossed) > 0,
+            "sanitizers_crossed": sanitizers_crossed
+        }
+        strategy = self.record_strategies[record]
+        if strategy != -1:
+            path_info["strategy"] = self.strategy_names[strategy]
+        if self.record_extras[record]:
+            path_info.update(self.record_extras[record])
+        path_info["fingerprint"] = self.record_fingerprints[record]
+        return path_info
+    
+    def _add_record(self, fingerprint: str, path_info: Dict[str, Any]) -> int:
+        """Store the compact form of a path information message and return its record ID"""
+        record = len(self.record_fingerprints)
+        
+        self.fingerprints[fingerprint] = record
+        self.record_fingerprints.append(fingerprint)
+        self.record_paths.append(ROOT)
+        self.record_sources.append(self.detections.add(path_info.get('source', {})))
+        self.record_sinks.append(self.detections.add(path_info.get('sink', {})))
+        self.record_crossed.append(())
+        self.record_strategies.append(-1)
+        self.record_extras.append(None)
+        self._set_record(record, path_info)
+        
+        if 'chop' in path_info:
+            for node_id in path_info['chop'].get('nodes', []):
+                self.chop_index.setdefault(node_id, []).append(record)
+        return record
+    
+    def _set_record(self, record: int, path_info: Dict[str, Any]):
+        """Store the path, sanitizer fields, strategy and other fields of a path information message in a record"""
+        entry = self.trie.insert(path_info.get('path', []))
+        self.record_paths[record] = entry
+        self.record_crossed[record] = tuple(
+            self.trie.intern(node) for node in path_info.get('sanitizers_crossed', [])
+        )
+        self.record_strategies[record] = self._strategy_id(path_info.get('strategy'))
+        extras = {key: value for key, value in path_info.items() if key not in RECORD_KEYS}
+        self.record_extras[record] = extras or None
+        self.terminals.setdefault(entry, []).append(record)
+    
+    def _unlink_path(self, record: int):
+        """Remove a record from the index of the paths it ends, before its path is replaced"""
+        entry = self.record_paths[record]
+        records = self.terminals.get(entry, [])
+        if record in records:
+            records.remove(record)
+        if not records:
+            self.terminals.pop(entry, None)
+    
+    def _strategy_id(self, name: Optional[str]) -> int:
+        """Return the index of a strategy name, -1 for no name"""
+        if name is None:
+            return -1
+        strategy = self.strategy_ids.get(name)
+        if strategy is None:
+            strategy = len(self.strategy_names)
+            self.strategy_ids[name] = strategy
+            self.strategy_names.append(name)
+        return strategy
+    
+    def _record_nodes(self, path_info: Dict[str, Any]) -> List[Any]:
+        """Return the nodes a record covers: its path, plus the subgraph of a chop record"""
+        nodes = list(path_info.get('path', []))
+        if 'chop' in path_info:
+            nodes.extend(path_info['chop'].get('nodes', []))
+        return nodes
+    
+    def _mark_sanitizer(self, record: int, node_id: Any) -> bool:
+        """
+        Apply a sanitizer node to the sanitizer fields of a record
+        
+        Args:
+            record: Record ID
+            node_id: Sanitizer node
+        
+        Returns:
+            True if any field changed
+        """
+        changed = False
+        
+        label = self.trie.labels.get(node_id)
+        if label is not None and label not in self.record_crossed[record]:
+            if any(self.trie.entry_labels[entry] == label for entry in self._path_entries(record)):
+                self.record_crossed[record] += (label,)
+                changed = True
+        
+        extras = self.record_extras[record] or {}
+        chop = extras.get('chop')
+        if chop and node_id not in chop.get('sanitizers', []) and node_id in chop.get('nodes', []):
+            known = set(chop.get('sanitizers', [])) | {node_id}
+            # The chop may be shared with the search that built it, so replace rather than mutate
+            extras['chop'] = dict(chop, sanitizers=[node for node in chop['nodes'] if node in known])
+            changed = True
+        
+        # The verdict fields were worked out without this sanitizer on the witness; they are checked again later
+        if changed and extras.get('kind') == 'verdict' and record not in self.stale_records:
+            self.record_extras[record] = dict(extras, verdict="stale", sanitizer_cut=None, dominating_sanitizers=None)
+            self.stale_records.add(record)
+            self.stale_pairs.append((self.record_sources[record], self.record_sinks[record]))
+        
+        return changed
+    
+    def _path_entries(self, record: int) -> Iterator[int]:
+        """Yield the trie entries on the path of a record, from its last node up"""
+        entry = self.record_paths[record]
+        while entry != ROOT:
+            yield entry
+            entry = self.trie.parents[entry]
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of unique paths, sanitizer updates sent, storage size and the per-strategy counts"""
+        return {
+            "unique": len(self.fingerprints),
+            "updates": self.updates,
+            "trie_entries": len(self.trie),
+            "detections": len(self.detections),
+            "strategies": {name: dict(counts) for name, counts in self.strategy_counts.items()}
+        }
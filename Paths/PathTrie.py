@@ -0,0 +1,144 @@
+"""
+<spec>
+Compact storage for large numbers of paths.
+
+Paths found for the same source (or by different strategies) share long prefixes. Instead of keeping a list of node ID strings per path, every graph node ID is interned to an integer once and paths are inserted into a prefix tree: each entry of the tree is one node of one prefix, stored as a few integers in flat arrays (parent entry, node label, first child, next sibling). A path is then identified by the entry of its last node, and all paths with a common prefix store that prefix once. The full list of node IDs is only rebuilt when it is asked for.
+
+The arrays are the only per-entry storage. Inserting looks a child up by walking its parent's first child / next sibling links (the tree is narrow, paths branch a few ways per node), and the label -> entries index used to find the paths through a node is built when it is first asked for and dropped on the next insert, so its memory is only held while sanitizer lookups run.
+
+Source and sink detections are interned the same way, so a stored path refers to them by a small integer instead of holding its own copy of the dictionaries.
+
+# Input
+ - paths (sequences of node IDs)
+ - detections (source / sink dictionaries)
+
+# Output
+ - integer handles, and the original paths / detections rebuilt from them
+</spec>
+"""
+
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from Paths import detection_key
+
+# Entry of the empty prefix every path hangs off
+ROOT = 0
+
+
+class PathTrie:
+    def __init__(self):
+        """Initialize an empty prefix tree"""
+        # Node ID <-> label interning
+        self.node_ids: List[Any] = []
+        self.labels: Dict[Any, int] = {}
+        
+        # One slot per entry; entry 0 is the root and has no label
+        self.parents = array('q', [-1])
+        self.entry_labels = array('q', [-1])
+        self.first_child = array('q', [-1])
+        self.next_sibling = array('q', [-1])
+        
+        # Label -> every entry carrying it, built on demand
+        self._by_label: Optional[Dict[int, List[int]]] = None
+    
+    def __len__(self) -> int:
+        """Number of entries, excluding the root"""
+        return len(self.parents) - 1
+    
+    def intern(self, node_id: Any) -> int:
+        """Return the integer label of a node ID, assigning one on first use"""
+        label = self.labels.get(node_id)
+        if label is None:
+            label = len(self.node_ids)
+            self.labels[node_id] = label
+            self.node_ids.append(node_id)
+        return label
+    
+    def insert(self, path: Sequence[Any]) -> int:
+        """
+        Add a path, reusing the entries of its longest stored prefix
+        
+        Args:
+            path: Node IDs of the path
+        
+        Returns:
+            Entry of the last node of the path (ROOT for an empty path)
+        """
+        entry = ROOT
+        for node_id in path:
+            label = self.intern(node_id)
+            child = self._child(entry, label)
+            if child == -1:
+                child = len(self.parents)
+                self.parents.append(entry)
+                self.entry_labels.append(label)
+                self.first_child.append(-1)
+                self.next_sibling.append(self.first_child[entry])
+                self.first_child[entry] = child
+                self._by_label = None
+            entry = child
+        return entry
+    
+    def _child(self, entry: int, label: int) -> int:
+        """Return the child of entry carrying label, or -1 if there is none"""
+        child = self.first_child[entry]
+        while child != -1 and self.entry_labels[child] != label:
+            child = self.next_sibling[child]
+        return child
+    
+    def path(self, entry: int) -> List[Any]:
+        """Rebuild the node IDs of the path ending at entry"""
+        path = []
+        while entry != ROOT:
+            path.append(self.node_ids[self.entry_labels[entry]])
+            entry = self.parents[entry]
+        path.reverse()
+        return path
+    
+    def entries_with(self, node_id: Any) -> List[int]:
+        """Return every entry whose node is node_id"""
+        label = self.labels.get(node_id)
+        if label is None:
+            return []
+        
+        if self._by_label is None:
+            self._by_label = {}
+            for entry in range(1, len(self.entry_labels)):
+                self._by_label.setdefault(self.entry_labels[entry], []).append(entry)
+        return self._by_label.get(label, [])
+    
+    def subtree(self, entry: int) -> Iterator[int]:
+        """Yield entry and every entry below it, i.e. every path that has entry's path as a prefix"""
+        stack = [entry]
+        while stack:
+            current = stack.pop()
+            yield current
+            child = self.first_child[current]
+            while child != -1:
+                stack.append(child)
+                child = self.next_sibling[child]
+
+
+class DetectionTable:
+    def __init__(self):
+        """Initialize an empty detection table"""
+        self.detections: List[Dict[str, Any]] = []
+        self.ids: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self.detections)
+    
+    def add(self, detection: Dict[str, Any]) -> int:
+        """Return the ID of a detection, storing it the first time its key is seen"""
+        key = detection_key(detection)
+        detection_id = self.ids.get(key)
+        if detection_id is None:
+            detection_id = len(self.detections)
+            self.ids[key] = detection_id
+            self.detections.append(detection)
+        return detection_id
+    
+    def get(self, detection_id: int) -> Dict[str, Any]:
+        """Return the detection stored under an ID"""
+        return self.detections[detection_id]
@@ -0,0 +1,97 @@
+"""
+<spec>
+Reverse adjacency of the graph shared by every search of an orchestrator that walks edges backwards.
+
+Plain graphs (such as the CodeQL graph) only answer neighbor lookups, so a search going backward from a sink (bidirectional, chop, dominance) needs every edge reversed first. That costs a pass over the whole graph, which is paid once here instead of once per pair. Graphs that answer predecessor lookups themselves (the snapshot and the collapsed view, see Graphs/Snapshot.py and Graphs/Compaction.py) are passed through.
+
+The index is built lazily and in steps: `iter_build` indexes one node per step and yields it, so searches can build it between their own checkpoints. Every caller continues the same pass, so a build that a search left part way (at a checkpoint, or when its time budget ran out) is finished by whichever search needs the index next and no node is indexed twice.
+
+Edges of every kind are indexed together; lookups restricted to some kinds filter on the graph's edge kinds, keeping untyped edges.
+
+# Input
+ - graph object (CodeQL)
+
+# Output
+ - predecessors of a node, optionally over some edge kinds only
+ - statistics: indexed nodes, whether the index is complete
+</spec>
+"""
+
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional
+
+from Graphs.Snapshot import GraphSnapshot
+from Graphs.Compaction import ChainCompaction
+
+
+class PredecessorIndex:
+    def __init__(self, graph: Any):
+        """
+        Initialize an index that is built the first time it is needed
+        
+        Args:
+            graph: Graph object with nodes and edges
+        """
+        self.graph = graph
+        
+        # Graphs with their own predecessor lookups need no index
+        self.native = isinstance(graph, (GraphSnapshot, ChainCompaction))
+        self.ready = self.native
+        
+        # Node -> nodes with an edge into it, and the nodes still to be indexed
+        self._predecessors: Dict[Any, List[Any]] = {}
+        self._remaining: Optional[Iterator[Any]] = None
+        self.indexed = 0
+    
+    def iter_build(self) -> Iterator[Any]:
+        """Index the nodes not indexed yet, yielding each one once its edges are in the index"""
+        if self.ready:
+            return
+        
+        if self._remaining is None:
+            self._remaining = iter(list(self.graph.nodes))
+        
+        # The pass is shared, so a build resumed by another caller picks up where this one stopped
+        for node_id in self._remaining:
+            for neighbor in self.graph.get_neighbors(node_id):
+                self._predecessors.setdefault(neighbor, []).append(node_id)
+            self.indexed += 1
+            yield node_id
+        self.ready = True
+    
+    def build(self):
+        """Finish indexing the graph in one go"""
+        for _ in self.iter_build():
+            pass
+    
+    def get(self, node_id: Any, kinds: Optional[FrozenSet[str]] = None) -> List[Any]:
+        """
+        Return the nodes with an edge into node_id
+        
+        Args:
+            node_id: Node ID
+            kinds: Only count edges of these kinds, plus untyped edges (None for every edge)
+        
+        Returns:
+            Predecessor node IDs
+        """
+        if self.native:
+            return self.graph.get_predecessors(node_id, kinds=kinds)
+        
+        if not self.ready:
+            self.build()
+        predecessors = self._predecessors.get(node_id, [])
+        
+        get_edge_kind = getattr(self.graph, "get_edge_kind", None)
+        if kinds is None or get_edge_kind is None:
+            return predecessors
+        
+        selected = []
+        for predecessor in predecessors:
+            kind = get_edge_kind(predecessor, node_id)
+            if kind is None or kind in kinds:
+                selected.append(predecessor)
+        return selected
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of indexed nodes and whether the index is complete"""
+        return {"indexed": self.indexed, "ready": self.ready}
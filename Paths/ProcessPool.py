@@ -0,0 +1,270 @@
+"""
+<spec>
+Execution backend that runs path searches in a pool of worker processes instead of on the event loop.
+
+Path search is pure Python CPU work, so on the event loop it can only ever use one core. This backend writes the graph once to a snapshot file (see Graphs/Snapshot.py) and every worker memory maps that file when it starts, so the graph is shared by all workers and never pickled per task. A search task only sends its source, sink, sanitizers and options to the worker; the worker runs the search on its mapped graph and sends back the path information messages (built there, so anything a strategy attaches to them comes along), which are then put onto the path analysis queue in the orchestrator's process.
+
+Paths are streamed back while the search runs rather than when it finishes: workers put them in small chunks on a result queue shared by the pool (the first path of a search on its own, so a raced pair can be settled right away), and a reader thread in the orchestrator's process hands each chunk to the search it belongs to. Chunks of a search that was cancelled in the meantime are dropped.
+
+Function summaries computed in a worker are sent back with the result of each search and merged into the orchestrator's summaries, so they are saved to the summary cache with the ones computed in the orchestrator's process; the workers start from that cache file too.
+
+Closing the backend never waits for running searches: the pool is shut down without waiting and its worker processes are terminated, so stopping the orchestrator returns at once. Each worker records its process ID in a shared array when it starts, which is how the backend finds the processes to terminate.
+
+# Input
+ - graph object (CodeQL)
+ - number of worker processes
+
+# Output
+ - (via the search's queue) Code path information
+</spec>
+"""
+
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from Graphs.Snapshot import GraphSnapshot
+from Paths import PathSearch
+from Paths.SanitizerLog import SanitizerView
+from Paths.MultiSourceSearch import SourceReachability
+from Paths.ReachabilityMemo import ReachabilityMemo
+from Paths.FunctionSummaries import FunctionSummaries
+from Paths.PredecessorIndex import PredecessorIndex
+
+logger = logging.getLogger(__name__)
+
+# Paths sent back per chunk, and the longest a found path waits in a worker before its chunk is sent
+CHUNK_SIZE = 32
+CHUNK_INTERVAL = 0.05
+
+# Per worker process state, set up once by _attach_worker
+_worker_graph: Optional[GraphSnapshot] = None
+_worker_resources: Dict[str, Any] = {}
+_worker_results: Optional[Any] = None
+
+
+def _attach_worker(snapshot_path: str, results: Any, pids: Any, function_summaries: bool = False,
+                   summary_cache: Optional[str] = None):
+    """Worker initializer: record this process, map the shared graph snapshot into it, load the summary cache and keep the pool's result queue"""
+    global _worker_graph, _worker_resources, _worker_results
+    with pids.get_lock():
+        for slot in range(len(pids)):
+            if pids[slot] == 0:
+                pids[slot] = os.getpid()
+                break
+    
+    _worker_graph = GraphSnapshot.load(snapshot_path)
+    _worker_results = results
+    functions = FunctionSummaries(_worker_graph, cache_path=summary_cache)
+    _worker_resources = {
+        "reachability": SourceReachability(_worker_graph),
+        "reach_memo": ReachabilityMemo(),
+        "predecessors": PredecessorIndex(_worker_graph),
+        "functions": functions,
+        "summaries": functions if function_summaries else None
+    }
+
+
+def _run_search(task_id: int, strategy: Type[PathSearch], source: Dict[str, Any], sink: Dict[str, Any],
+                sanitizers: Union[List[Dict[str, Any]], SanitizerView], options: Dict[str, Any]
+                ) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Run one search inside a worker process, streaming its path information messages to the result queue
+    
+    Args:
+        task_id: ID the chunks are sent under, followed by (task_id, None) once the search is over
+        strategy: PathSearch subclass to run
+        source: Source detection
+        sink: Sink detection
+        sanitizers: Sanitizers known when the search was created
+        options: Search options
+    
+    Returns:
+        Whether a limit cut the search short, and the function summary cache entries computed during the search
+    """
+    try:
+        search = strategy(
+            source=source,
+            sink=sink,
+            sanitizers=sanitizers,
+            graph=_worker_graph,
+            path_analysis_queue=None,
+            **options,
+            **{name: _worker_resources[name] for name in strategy.shared_resources}
+        )
+        
+        chunk: List[Dict[str, Any]] = []
+        sent = time.monotonic()
+        for path in search.iter_paths():
+            chunk.append(search._build_path_info(path))
+            # The first path goes out on its own so a raced pair settles as soon as it is found
+            if search.paths_found == 0 or len(chunk) >= CHUNK_SIZE or time.monotonic() - sent >= CHUNK_INTERVAL:
+                _worker_results.put((task_id, chunk))
+                chunk = []
+                sent = time.monotonic()
+        
+        if chunk:
+            _worker_results.put((task_id, chunk))
+        return search.truncated, _worker_resources["functions"].take_computed()
+    finally:
+        _worker_results.put((task_id, None))
+
+
+class ProcessPoolBackend:
+    def __init__(self, graph: Any, max_workers: Optional[int] = None, function_summaries: bool = False,
+                 summaries: Optional[FunctionSummaries] = None):
+        """
+        Initialize the process pool backend
+        
+        Args:
+            graph: Graph object with nodes and edges
+            max_workers: Number of worker processes (default: one per CPU)
+            function_summaries: Let searches that can step over function bodies do so (see Paths/FunctionSummaries.py)
+            summaries: Summaries the ones computed in the workers are merged into, and whose cache file the workers load
+        """
+        self.graph = graph
+        self.max_workers = max_workers
+        self.function_summaries = function_summaries
+        self.summaries = summaries
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.snapshot_path: Optional[str] = None
+        
+        # Process IDs of the started workers (0 for a slot not taken yet)
+        self.worker_pids: Optional[Any] = None
+        
+        # Result queue shared by the workers, and the thread handing its chunks to the running searches
+        self.results: Optional[Any] = None
+        self._closed = threading.Event()
+        self._reader: Optional[threading.Thread] = None
+        self._streams: Dict[int, asyncio.Queue] = {}
+        self._task_ids = itertools.count()
+    
+    def start(self):
+        """Write the graph snapshot and start the worker processes"""
+        if self.executor is not None:
+            return
+        
+        fd, self.snapshot_path = tempfile.mkstemp(suffix='.graph')
+        os.close(fd)
+        GraphSnapshot.from_graph(self.graph).save(self.snapshot_path)
+        
+        self.results = multiprocessing.Queue()
+        self._closed = threading.Event()
+        self.worker_pids = multiprocessing.Array('q', self.max_workers or os.cpu_count() or 1)
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_attach_worker,
+            initargs=(self.snapshot_path, self.results, self.worker_pids, self.function_summaries,
+                      self.summaries.cache_path if self.summaries is not None else None)
+        )
+        logger.info(f"Started path search process pool with snapshot {self.snapshot_path}")
+    
+    def close(self):
+        """Stop the worker processes without waiting for running searches, and remove the graph snapshot"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            for pid in self.worker_pids:
+                if pid == 0:
+                    continue
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except OSError:
+                    # Already gone
+                    pass
+            self.executor = None
+            self.worker_pids = None
+        
+        # A worker terminated while writing may leave the result queue locked, so nothing is put on it from here
+        self._closed.set()
+        self.results = None
+        self._reader = None
+        for stream in self._streams.values():
+            stream.put_nowait(None)
+        self._streams.clear()
+        
+        if self.snapshot_path is not None:
+            try:
+                os.remove(self.snapshot_path)
+            except OSError:
+                pass
+            self.snapshot_path = None
+    
+    async def run(self, search: PathSearch):
+        """
+        Run a search in a worker process and queue its paths
+        
+        Args:
+            search: Search instance built in this process, used for its inputs and its queue
+        """
+        if self.executor is None:
+            raise RuntimeError("ProcessPoolBackend.run() called before start()")
+        
+        loop = asyncio.get_running_loop()
+        if self._reader is None:
+            self._reader = threading.Thread(target=self._read_results, args=(self.results, self._closed, loop),
+                                            daemon=True)
+            self._reader.start()
+        
+        task_id = next(self._task_ids)
+        stream: asyncio.Queue = asyncio.Queue()
+        self._streams[task_id] = stream
+        
+        future = loop.run_in_executor(
+            self.executor,
+            _run_search,
+            task_id,
+            type(search),
+            search.source,
+            search.sink,
+            search.sanitizers,
+            search._search_options()
+        )
+        def failed(done: asyncio.Future):
+            # A worker that dies never sends the end of its stream
+            if not done.cancelled() and done.exception() is not None:
+                stream.put_nowait(None)
+        future.add_done_callback(failed)
+        
+        try:
+            while True:
+                chunk = await stream.get()
+                if chunk is None:
+                    break
+                for path_info in chunk:
+                    await search.path_analysis_queue.put(path_info)
+                    search.paths_found += 1
+            search.truncated, computed = await future
+            if self.summaries is not None and computed:
+                self.summaries.merge(computed)
+        finally:
+            self._streams.pop(task_id, None)
+            # Only a search still waiting for a worker can be cancelled; a running one finishes and is dropped
+            future.cancel()
+    
+    def _read_results(self, results: Any, closed: threading.Event, loop: asyncio.AbstractEventLoop):
+        """Reader thread: hand each chunk on the result queue to its search on the event loop, until closed"""
+        while not closed.is_set():
+            try:
+                message = results.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            try:
+                loop.call_soon_threadsafe(self._dispatch, *message)
+            except RuntimeError:
+                # The event loop is closed
+                return
+    
+    def _dispatch(self, task_id: int, chunk: Optional[List[Dict[str, Any]]]):
+        """Pass a chunk to the search it belongs to, dropping it if that search is no longer running"""
+        stream = self._streams.get(task_id)
+        if stream is not None:
+            stream.put_nowait(chunk)
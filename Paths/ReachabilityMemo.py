@@ -0,0 +1,92 @@
+"""
+<spec>
+Memo of "node reaches target" facts shared by every search of an orchestrator.
+
+Many pairs explore the same regions of the graph: every source that calls a common helper walks everything below it again. Searches record what they learn as (node, target) -> reaches / does not reach entries, and later searches look a node up before expanding it, cutting off subtrees that are known not to reach their target.
+
+Only facts that hold for the whole graph are recorded: a node on a path that reached the target reaches it, and a node whose every successor was explored without reaching the target (no depth limit hit, no successor skipped because it was already on the current path) does not. Searches that treat sanitizers as barriers see a different graph and neither read nor write the memo.
+
+The memo holds at most `max_entries` facts; the least recently used ones are evicted first.
+
+# Input
+ - facts from completed parts of searches (via record)
+ - lookups from running searches (via get)
+
+# Output
+ - True / False for known (node, target) pairs, None when unknown
+ - statistics: entries, hits, misses, evictions
+</spec>
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class ReachabilityMemo:
+    def __init__(self, max_entries: int = 200000):
+        """
+        Initialize an empty memo
+        
+        Args:
+            max_entries: Maximum number of facts kept before the least recently used are evicted
+        """
+        if max_entries < 1:
+            raise ValueError(f"Invalid max_entries: {max_entries}. Must be at least 1")
+        
+        self.max_entries = max_entries
+        self.facts: 'OrderedDict[Tuple[Any, Any], bool]' = OrderedDict()
+        
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self.facts)
+    
+    def get(self, node: Any, target: Any) -> Optional[bool]:
+        """
+        Look up whether node reaches target
+        
+        Args:
+            node: Node ID
+            target: Target node ID
+        
+        Returns:
+            True or False if known, None otherwise
+        """
+        key = (node, target)
+        reaches = self.facts.get(key)
+        if reaches is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        self.facts.move_to_end(key)
+        return reaches
+    
+    def record(self, node: Any, target: Any, reaches: bool):
+        """
+        Record whether node reaches target, evicting the least recently used facts past the cap
+        
+        Args:
+            node: Node ID
+            target: Target node ID
+            reaches: Whether a path from node to target exists
+        """
+        key = (node, target)
+        self.facts[key] = reaches
+        self.facts.move_to_end(key)
+        
+        while len(self.facts) > self.max_entries:
+            self.facts.popitem(last=False)
+            self.evictions += 1
+    
+    def stats(self) -> Dict[str, int]:
+        """Return the memo size and hit statistics"""
+        return {
+            "entries": len(self.facts),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
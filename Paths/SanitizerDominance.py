@@ -0,0 +1,237 @@
+"""
+<spec>
+#Input
+ - source
+ - sink
+ - list of all the sanitizers
+ - Graph object (CodeQL)
+ - path analysis async queue
+ - optional limits: wall-clock budget
+ - optional unsanitized only mode: sanitized pairs produce no record
+ - optional edge kinds to follow (e.g. data-flow and call edges only)
+
+#Output
+ - (via queue) One record per pair (kind 'verdict') with the verdict: 'sanitized' if every path from the source to the sink crosses a sanitizer, 'unsanitized' if at least one path does not
+ - The record's path is a witness: an unsanitized path, or for a sanitized pair the shortest path (which crosses a sanitizer)
+ - 'sanitizer_cut': sanitizers that every path reaches first (empty when unsanitized)
+ - 'dominating_sanitizers': sanitizers that lie on every path, in source to sink order
+
+#Algorthim
+Deciding whether a sink is protected does not need every path. The search first computes the chop, the nodes reachable from the source that can also reach the sink, with one forward and one backward traversal. A breadth first search over the chop that refuses to go through sanitizer nodes then either reaches the sink (an unsanitized witness) or stops at a set of sanitizers that cuts every path.
+
+The immediate dominators of the chop are computed with the iterative algorithm of Cooper, Harvey and Kennedy; the sanitizers on the dominator chain of the sink are the ones no path can avoid. Every step is linear or close to it in the size of the chop, so this scales where path enumeration cannot.
+
+</spec>
+"""
+
+from collections import deque
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple
+
+from Paths import PathSearch
+
+
+class SanitizerDominance(PathSearch):
+    name = "DOM"
+    
+    # Resources the orchestrator shares between every search of this kind
+    shared_resources = ("predecessors",)
+    
+    # Verdict fields attached to the witness, set once the analysis has finished
+    verdict: Optional[Dict[str, Any]] = None
+    
+    def _search(self, start: str, target: str) -> Iterator[Optional[List[str]]]:
+        """
+        Decide whether every path from start to target crosses a sanitizer and yield one witness
+        
+        Args:
+            start: Node ID to start from
+            target: Node ID to reach
+        
+        Yields:
+            The witness path for the verdict, or None at checkpoints
+        """
+        self.verdict = None
+        
+        if start == target:
+            crossed = [start] if start in self.sanitizer_nodes else []
+            self.verdict = {
+                "verdict": "sanitized" if crossed else "unsanitized",
+                "sanitizer_cut": crossed,
+                "dominating_sanitizers": crossed
+            }
+            yield [start]
+            return
+        
+        forward = yield from self._reach(start, self._neighbors)
+        if forward is None or target not in forward:
+            return
+        
+        if not (yield from self._index_predecessors()):
+            return
+        
+        chop = yield from self._reach(target, self._get_predecessors, forward)
+        if chop is None:
+            return
+        
+        result = yield from self._first_sanitizers(start, target, chop)
+        if result is None:
+            return
+        witness, cut = result
+        
+        # Only unsanitized flows were asked for
+        if witness is None and self.unsanitized_only:
+            return
+        
+        idom = yield from self._dominators(start, chop)
+        if idom is None:
+            return
+        
+        chain = [target]
+        while chain[-1] != start:
+            chain.append(idom[chain[-1]])
+        chain.reverse()
+        
+        sanitized = witness is None
+        if sanitized:
+            witness = yield from self._shortest_path(start, target, set(), set())
+            if witness is None:
+                return
+        
+        self.verdict = {
+            "verdict": "sanitized" if sanitized else "unsanitized",
+            "sanitizer_cut": cut,
+            "dominating_sanitizers": [node for node in chain if node in self.sanitizer_nodes]
+        }
+        yield witness
+    
+    def _build_path_info(self, path: List[str]) -> Dict[str, Any]:
+        """Build the path information message with the verdict attached"""
+        path_info = super()._build_path_info(path)
+        if self.verdict:
+            # A verdict is a different record from the same path found by a path enumerating search
+            path_info["kind"] = "verdict"
+            path_info.update(self.verdict)
+        return path_info
+    
+    def _first_sanitizers(self, start: str, target: str, chop: Dict[str, int]
+                          ) -> Generator[None, None, Optional[Tuple[Optional[List[str]], List[str]]]]:
+        """
+        Search the chop without going through sanitizers
+        
+        Args:
+            start: Node ID to start from
+            target: Node ID to reach
+            chop: Nodes on some path from start to target
+        
+        Returns:
+            Tuple of an unsanitized path (None if there is none) and the sanitizers the search stopped at,
+            or None if the time budget ran out
+        """
+        if start in self.sanitizer_nodes:
+            return None, [start]
+        
+        parents: Dict[str, Optional[str]] = {start: None}
+        cut: List[str] = []
+        frontier = deque([start])
+        
+        while frontier:
+            if self._out_of_time():
+                return None
+            
+            current = frontier.popleft()
+            if self._tick():
+                yield None
+            
+            for neighbor in self._neighbors(current):
+                if neighbor not in chop or neighbor in parents:
+                    continue
+                parents[neighbor] = current
+                
+                if neighbor in self.sanitizer_nodes:
+                    cut.append(neighbor)
+                    continue
+                
+                if neighbor == target:
+                    path = [neighbor]
+                    node = current
+                    while node is not None:
+                        path.append(node)
+                        node = parents[node]
+                    path.reverse()
+                    return path, []
+                
+                frontier.append(neighbor)
+        
+        return None, cut
+    
+    def _dominators(self, start: str, chop: Dict[str, int]) -> Generator[None, None, Optional[Dict[str, str]]]:
+        """
+        Compute the immediate dominators of the chop (Cooper, Harvey and Kennedy)
+        
+        Args:
+            start: Entry node of the chop
+            chop: Nodes on some path from start to the target
+        
+        Returns:
+            Mapping of node ID to its immediate dominator (start maps to itself), or None if the time budget ran out
+        """
+        # Reverse postorder of the chop from start
+        postorder: List[str] = []
+        visited = {start}
+        stack = [(start, iter(self._neighbors(start)))]
+        while stack:
+            if self._out_of_time():
+                return None
+            
+            node, neighbors = stack[-1]
+            if self._tick():
+                yield None
+            
+            for neighbor in neighbors:
+                if neighbor in chop and neighbor not in visited:
+                    visited.add(neighbor)
+                    stack.append((neighbor, iter(self._neighbors(neighbor))))
+                    break
+            else:
+                stack.pop()
+                postorder.append(node)
+        
+        order = list(reversed(postorder))
+        rank = {node: i for i, node in enumerate(order)}
+        predecessors = {
+            node: [p for p in self._get_predecessors(node) if p in rank]
+            for node in order
+        }
+        
+        idom: Dict[str, str] = {start: start}
+        changed = True
+        while changed:
+            if self._out_of_time():
+                return None
+            
+            changed = False
+            for node in order[1:]:
+                if self._tick():
+                    yield None
+                
+                new_idom = None
+                for predecessor in predecessors[node]:
+                    if predecessor not in idom:
+                        continue
+                    if new_idom is None:
+                        new_idom = predecessor
+                        continue
+                    
+                    # Walk both fingers up the dominator tree until they meet
+                    finger = predecessor
+                    while finger != new_idom:
+                        while rank[finger] > rank[new_idom]:
+                            finger = idom[finger]
+                        while rank[new_idom] > rank[finger]:
+                            new_idom = idom[new_idom]
+                
+                if new_idom is not None and idom.get(node) != new_idom:
+                    idom[node] = new_idom
+                    changed = True
+        
+        return idom
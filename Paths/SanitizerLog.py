@@ -0,0 +1,95 @@
+"""
+<spec>
+Append-only log of the sanitizers discovered so far, shared by every search task.
+
+Sanitizers keep arriving while searches run. Instead of every task copying the sanitizer list and resolving each sanitizer to its graph node again, the orchestrator appends each sanitizer once, together with its node, and the log maintains the set of sanitizer nodes. A search task only holds a view: the log plus the version (number of entries) it was started at. Checking whether a node is a sanitizer for that view is a single dictionary lookup, and nothing is copied when a task starts.
+
+Entries are never removed or reordered, so a view always sees exactly the sanitizers that were known at its version.
+
+# Input
+ - sanitizer detections with their graph node (via append)
+
+# Output
+ - views pinned at a version, supporting `node in view` and iteration over the sanitizer detections
+</spec>
+"""
+
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class SanitizerLog:
+    def __init__(self):
+        """Initialize an empty sanitizer log"""
+        self.entries: List[Dict[str, Any]] = []
+        self.node_ids: List[Optional[Any]] = []
+        
+        # Node ID -> index of the first entry resolving to it
+        self.first_seen: Dict[Any, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    @property
+    def version(self) -> int:
+        """Current version of the log (the number of entries)"""
+        return len(self.entries)
+    
+    def append(self, sanitizer: Dict[str, Any], node_id: Optional[Any]) -> int:
+        """
+        Record a sanitizer
+        
+        Args:
+            sanitizer: Sanitizer detection
+            node_id: Graph node of the sanitizer, or None if it is not in the graph
+        
+        Returns:
+            Version of the log including this sanitizer
+        """
+        if node_id is not None and node_id not in self.first_seen:
+            self.first_seen[node_id] = len(self.entries)
+        self.entries.append(sanitizer)
+        self.node_ids.append(node_id)
+        return len(self.entries)
+    
+    def view(self, version: Optional[int] = None) -> 'SanitizerView':
+        """
+        Return a view of the log pinned at a version
+        
+        Args:
+            version: Number of entries visible to the view (default: the current version)
+        """
+        return SanitizerView(self, self.version if version is None else version)
+
+
+class SanitizerView:
+    """The sanitizers of a log up to a fixed version"""
+    __slots__ = ('log', 'version')
+    
+    def __init__(self, log: SanitizerLog, version: int):
+        self.log = log
+        self.version = version
+    
+    def __contains__(self, node_id: Any) -> bool:
+        """Check whether node_id is a sanitizer node at this view's version"""
+        seen = self.log.first_seen.get(node_id)
+        return seen is not None and seen < self.version
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the sanitizer detections visible to this view"""
+        for i in range(self.version):
+            yield self.log.entries[i]
+    
+    def __len__(self) -> int:
+        return self.version
+    
+    def __reduce__(self):
+        # Only the visible entries are sent when a view crosses a process boundary
+        return (_rebuild_view, (self.log.entries[:self.version], self.log.node_ids[:self.version]))
+
+
+def _rebuild_view(entries: List[Dict[str, Any]], node_ids: List[Optional[Any]]) -> SanitizerView:
+    """Recreate an unpickled view from its visible entries"""
+    log = SanitizerLog()
+    for sanitizer, node_id in zip(entries, node_ids):
+        log.append(sanitizer, node_id)
+    return log.view()
@@ -0,0 +1,111 @@
+"""
+<spec>
+The scheduler runs the orchestrator's search tasks with bounded concurrency.
+
+Pairs are submitted with a priority and wait in a priority queue; a fixed number of worker tasks take the highest priority pair, run its search and move on. Only the workers exist as asyncio tasks, so memory stays bounded no matter how many pairs a large scan produces, and nothing is kept once a search has finished.
+
+# Input
+ - concurrency (number of searches allowed to run at the same time)
+ - (priority, coroutine function, arguments) submissions
+
+# Output
+ - statistics: queue depth, running/completed/failed counts and throughput
+</spec>
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SearchScheduler:
+    def __init__(self, concurrency: int = 8):
+        """
+        Initialize the scheduler
+        
+        Args:
+            concurrency: Maximum number of searches running at the same time
+        """
+        if concurrency < 1:
+            raise ValueError(f"Invalid concurrency: {concurrency}. Must be at least 1")
+        
+        self.concurrency = concurrency
+        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        
+        # Tie breaker so equal priorities run in submission order
+        self._sequence = itertools.count()
+        self._workers: List[asyncio.Task] = []
+        
+        # Statistics
+        self.submitted = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.started_at: Optional[float] = None
+    
+    def start(self):
+        """Start the worker tasks"""
+        if self._workers:
+            return
+        self.started_at = time.monotonic()
+        self._workers = [
+            asyncio.create_task(self._worker())
+            for _ in range(self.concurrency)
+        ]
+    
+    async def stop(self):
+        """Cancel the worker tasks, dropping any searches still queued"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+    
+    def submit(self, priority: float, search: Callable[..., Awaitable[Any]], *args):
+        """
+        Queue a search
+        
+        Args:
+            priority: Higher values run first
+            search: Coroutine function running the search
+            *args: Arguments for the coroutine function
+        """
+        self.submitted += 1
+        self.queue.put_nowait((-priority, next(self._sequence), search, args))
+    
+    async def join(self):
+        """Wait until every submitted search has finished"""
+        await self.queue.join()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth and throughput statistics"""
+        elapsed = time.monotonic() - self.started_at if self.started_at else 0.0
+        
+        return {
+            "queued": self.queue.qsize(),
+            "running": self.running,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "throughput": self.completed / elapsed if elapsed > 0 else 0.0
+        }
+    
+    async def _worker(self):
+        """Run queued searches one at a time, highest priority first"""
+        while True:
+            _, _, search, args = await self.queue.get()
+            self.running += 1
+            try:
+                await search(*args)
+                self.completed += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Search task failed: {e}", exc_info=True)
+            finally:
+                self.running -= 1
+                self.queue.task_done()
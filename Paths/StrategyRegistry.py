@@ -0,0 +1,129 @@
+"""
+<spec>
+Registry of the path search strategies, and the settings each one runs with.
+
+Strategies are registered under the key they are selected by (on the command line with --search, or by the orchestrator's configuration). The built-in strategies are always registered; other engines add themselves with `register_strategy`, and the orchestrator runs them like any other.
+
+A `StrategyConfig` pairs a strategy with its own options, on top of the options shared by every search: mostly its budgets, so a fast engine can be given a short time budget and a single path while an exhaustive one runs longer. Configurations are written as the key followed by budgets, e.g. `dfs:time=2,paths=10` or `chop:depth=50`:
+
+ - time: wall-clock budget in seconds (time_budget)
+ - paths: stop after this many paths (max_paths)
+ - depth: maximum number of edges in a path (max_depth)
+
+# Input
+ - strategy classes to register, under their keys
+ - configuration strings
+
+# Output
+ - strategy classes by key
+ - strategy configurations (strategy and its own options)
+</spec>
+"""
+
+from typing import Any, Callable, Dict, Tuple, Type
+
+from Paths import PathSearch
+from Paths.DepthFirstSearch import DepthFirstSearch
+from Paths.BreadthFirstSearch import BreadthFirstSearch
+from Paths.BidirectionalSearch import BidirectionalSearch
+from Paths.MultiSourceSearch import MultiSourceSearch
+from Paths.SanitizerDominance import SanitizerDominance
+from Paths.ChopSearch import ChopSearch
+from Paths.ContextSensitiveSearch import ContextSensitiveSearch
+from Paths.BestFirstSearch import BestFirstSearch
+
+# Key -> strategy class, built-in strategies first
+STRATEGIES: Dict[str, Type[PathSearch]] = {
+    'dfs': DepthFirstSearch,
+    'bfs': BreadthFirstSearch,
+    'bidirectional': BidirectionalSearch,
+    'multi-source': MultiSourceSearch,
+    'dominators': SanitizerDominance,
+    'chop': ChopSearch,
+    'context': ContextSensitiveSearch,
+    'best-first': BestFirstSearch,
+}
+
+# Budget name in a configuration string -> (search option, value type)
+BUDGETS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "time": ("time_budget", float),
+    "paths": ("max_paths", int),
+    "depth": ("max_depth", int)
+}
+
+
+def register_strategy(key: str, strategy: Type[PathSearch]):
+    """
+    Register a strategy under a key
+    
+    Args:
+        key: Key the strategy is selected by
+        strategy: PathSearch subclass
+    """
+    if not (isinstance(strategy, type) and issubclass(strategy, PathSearch)):
+        raise TypeError(f"Strategy {key} must be a PathSearch subclass, got {strategy!r}")
+    if STRATEGIES.get(key, strategy) is not strategy:
+        raise ValueError(f"Strategy key already registered: {key}")
+    STRATEGIES[key] = strategy
+
+
+def get_strategy(key: str) -> Type[PathSearch]:
+    """Return the strategy registered under key"""
+    strategy = STRATEGIES.get(key)
+    if strategy is None:
+        raise ValueError(f"Unknown search strategy: {key}. Must be one of {', '.join(sorted(STRATEGIES))}")
+    return strategy
+
+
+class StrategyConfig:
+    def __init__(self, strategy: Type[PathSearch], **options):
+        """
+        Initialize a strategy configuration
+        
+        Args:
+            strategy: PathSearch subclass to run
+            **options: Search options for this strategy only, such as time_budget or max_paths (see PathSearch)
+        """
+        self.strategy = strategy
+        self.options = options
+    
+    @classmethod
+    def parse(cls, spec: str) -> "StrategyConfig":
+        """
+        Parse a configuration string such as 'dfs:time=2,paths=10'
+        
+        Args:
+            spec: Strategy key, optionally followed by ':' and comma separated budget=value settings
+        
+        Returns:
+            The strategy configuration
+        """
+        key, _, settings = spec.partition(':')
+        strategy = get_strategy(key.strip())
+        
+        options = {}
+        for setting in filter(None, (s.strip() for s in settings.split(','))):
+            name, _, value = (part.strip() for part in setting.partition('='))
+            if name not in BUDGETS:
+                raise ValueError(f"Unknown budget: {name}. Must be one of {', '.join(BUDGETS)}")
+            
+            option, convert = BUDGETS[name]
+            try:
+                options[option] = convert(value)
+            except ValueError:
+                raise ValueError(f"Invalid {name} budget: {value!r}")
+            if options[option] <= 0:
+                raise ValueError(f"Invalid {name} budget: {value}. Must be positive")
+        return cls(strategy, **options)
+    
+    @property
+    def name(self) -> str:
+        """Strategy name with its own options, for logs and statistics"""
+        if not self.options:
+            return self.strategy.name
+        settings = ", ".join(f"{option}={value}" for option, value in sorted(self.options.items()))
+        return f"{self.strategy.name}({settings})"
+    
+    def __repr__(self) -> str:
+        return f"StrategyConfig({self.name})"
+
@@ -1,5 +1,413 @@
 """
 <spec>
-This class will hold any common 
+This class will hold any common logic for the path search algorithms.
+
+Each search algorithm (depth first, breadth first, ...) is given the same inputs: a source, a sink, the sanitizers known so far (a list, or a view of the orchestrator's sanitizer log), the graph and the path analysis queue. The parent class resolves those to graph nodes, enforces the search limits and turns every path the child class finds into a path information message on the queue.
+
+Child classes only implement `_search`, a generator that yields paths (lists of node IDs) as they are found. `iter_paths` drives that generator synchronously with the limits applied, which is what lets a search run in a worker process as well as on the event loop.
+
+With `unsanitized_only` set, sanitizer nodes are barriers: child classes expand nodes through `_next_nodes` / `_previous_nodes`, which leave sanitizers out, so the search never explores past one and only unsanitized paths are found.
+
+With `edge_kinds` set, searches only follow edges of those kinds (e.g. data-flow and call edges for taint questions) plus untyped edges: every neighbor and predecessor lookup goes through `_neighbors` / `_get_predecessors`, which filter on the graph's edge kinds (see Graphs/Snapshot.py). Such searches see a smaller graph than the others, so like unsanitized only searches they do not use the shared memo or summaries.
+
+On a graph with its linear chains collapsed (see Graphs/Compaction.py) searches step over chain nodes; the source, sink and sanitizers of a search are protected so they stay visible, and `_build_path_info` puts the chains back so reported paths hold the original node IDs.
+
+Strategies that list "summaries" step over the bodies of functions through `_next_nodes` using the shared function summaries when the orchestrator enables them (see Paths/FunctionSummaries.py); the bodies are spliced back in by `_build_path_info`. Functions with one of the search's sanitizers in their body are walked node by node, so paths that differ in the sanitizers they cross are all found.
+
+Strategies that walk edges backwards list "predecessors" in `shared_resources`: on plain graphs the reverse adjacency is indexed once for the orchestrator (see Paths/PredecessorIndex.py), and such a search calls `_index_predecessors` before its first predecessor lookup so any part of the index still missing is built between checkpoints.
+
+Strategies that can use or add to the orchestrator's reachability memo (see Paths/ReachabilityMemo.py) list "reach_memo" in `shared_resources` and check `_known_dead_end` before expanding a node.
+
+Searches share the event loop with the queue monitors and the other searches, so they must not hold it for long. Child classes call `_tick()` once per node expansion and, when it returns True, yield None as a checkpoint; `find_paths` then hands control back to the event loop before continuing. A checkpoint is due every `expansion_budget` expansions and/or every `slice_time` seconds, both configurable per strategy (class attributes) and per search (constructor arguments).
 </spec>
-"""
\ No newline at end of file
+"""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Dict, List, Set, Any, Optional, Iterator, Tuple, Union, Callable, Iterable, Generator, FrozenSet
+
+from Graphs.Snapshot import GraphSnapshot
+from Graphs.Compaction import ChainCompaction
+from Paths.SanitizerLog import SanitizerView
+from Paths.ReachabilityMemo import ReachabilityMemo
+from Paths.FunctionSummaries import FunctionSummaries
+from Paths.PredecessorIndex import PredecessorIndex
+
+
+def detection_key(detection: Dict[str, Any]) -> str:
+    """Generate unique key for a source, sink or sanitizer detection"""
+    file_name = detection.get('file', detection.get('filename', ''))
+    return f"{file_name}:{detection.get('line_number', '')}"
+
+
+def find_node_id(graph: Any, line_number: int) -> Optional[str]:
+    """Find node ID in graph by line number"""
+    for node_id, node_data in graph.nodes.items():
+        if node_data.get('line') == line_number:
+            return node_id
+    return None
+
+
+class PathSearch(ABC):
+    """
+    Abstract class for path search algorithms
+    """
+    # Short name used in logs and reporting
+    name = "search"
+    
+    # Names of orchestrator-wide resources passed to the constructor as keyword arguments
+    shared_resources: Tuple[str, ...] = ()
+    
+    # Default time slice: yield to the event loop after this many expansions / seconds
+    expansion_budget: Optional[int] = 1000
+    slice_time: Optional[float] = None
+    
+    def __init__(self, source: Dict[str, Any], sink: Dict[str, Any],
+                 sanitizers: Union[List[Dict[str, Any]], SanitizerView], graph: Any,
+                 path_analysis_queue: asyncio.Queue,
+                 max_depth: Optional[int] = None,
+                 max_paths: Optional[int] = None,
+                 time_budget: Optional[float] = None,
+                 expansion_budget: Optional[int] = None,
+                 slice_time: Optional[float] = None,
+                 unsanitized_only: bool = False,
+                 reach_memo: Optional[ReachabilityMemo] = None,
+                 summaries: Optional[FunctionSummaries] = None,
+                 predecessors: Optional[PredecessorIndex] = None,
+                 edge_kinds: Optional[Iterable[str]] = None,
+                 source_node: Optional[str] = None,
+                 sink_node: Optional[str] = None):
+        """
+        Initialize path finder
+        
+        Args:
+            source: Source node information with 'line_number' key
+            sink: Sink node information with 'line_number' key
+            sanitizers: List of sanitizer nodes with 'line_number' keys, or a view of the sanitizer log
+            graph: Graph object with nodes and edges
+            path_analysis_queue: Async queue to put found paths
+            max_depth: Maximum number of edges in a path (None for unlimited)
+            max_paths: Stop after this many paths have been queued (None for unlimited)
+            time_budget: Wall-clock budget for the search in seconds (None for unlimited)
+            expansion_budget: Node expansions between yields to the event loop (default: class setting)
+            slice_time: Seconds between yields to the event loop (default: class setting)
+            unsanitized_only: Treat sanitizer nodes as barriers, so only unsanitized paths are found
+            reach_memo: Shared memo of (node, target) reachability facts (ignored in unsanitized only mode)
+            summaries: Shared function summaries used to step over function bodies (ignored in unsanitized only mode)
+            predecessors: Shared reverse adjacency of the graph (a private one is made if not given)
+            edge_kinds: Only follow edges of these kinds, plus untyped edges (None for every edge)
+            source_node: Graph node of the source, when the caller already resolved it (looked up by line number otherwise)
+            sink_node: Graph node of the sink, when the caller already resolved it (looked up by line number otherwise)
+        """
+        self.source = source
+        self.sink = sink
+        self.sanitizers = sanitizers
+        self.graph = graph
+        self.path_analysis_queue = path_analysis_queue
+        
+        # Search limits
+        self.max_depth = max_depth
+        self.max_paths = max_paths
+        self.time_budget = time_budget
+        self.unsanitized_only = unsanitized_only
+        self.edge_kinds: Optional[FrozenSet[str]] = frozenset(edge_kinds) if edge_kinds else None
+        
+        # Facts in the memo hold for the whole graph, which a search with barriers or filtered edges does not see
+        restricted = unsanitized_only or self.edge_kinds is not None
+        self.reach_memo = None if restricted else reach_memo
+        self.summaries = None if restricted else summaries
+        
+        # Time slicing, falling back to the strategy's defaults
+        if expansion_budget is not None:
+            self.expansion_budget = expansion_budget
+        if slice_time is not None:
+            self.slice_time = slice_time
+        
+        # Search statistics
+        self.paths_found = 0
+        self.expansions = 0
+        self.checkpoints = 0
+        self.truncated = False
+        self._deadline: Optional[float] = None
+        self._slice_expansions = 0
+        self._slice_started = time.monotonic()
+        
+        # Function -> whether one of this search's sanitizers is in its body
+        self._sanitized_functions: Dict[Any, bool] = {}
+        
+        # Reverse adjacency, only built if a search needs predecessor lookups
+        self.predecessors = predecessors if predecessors is not None else PredecessorIndex(graph)
+        
+        # Identify nodes in graph, unless the caller resolved them once for every search of the detection
+        self.source_node = source_node if source_node is not None else self._get_node_id(source['line_number'])
+        self.sink_node = sink_node if sink_node is not None else self._get_node_id(sink['line_number'])
+        if isinstance(sanitizers, SanitizerView):
+            # Already resolved by the sanitizer log, membership is checked against it directly
+            self.sanitizer_nodes = sanitizers
+        else:
+            self.sanitizer_nodes = {
+                self._get_node_id(san['line_number'])
+                for san in sanitizers
+                if self._get_node_id(san['line_number']) is not None
+            }
+        
+        # Chains must not step over the nodes this search has to stop at or check
+        if isinstance(graph, ChainCompaction):
+            graph.protect(self.source_node)
+            graph.protect(self.sink_node)
+            if not isinstance(sanitizers, SanitizerView):
+                for node_id in self.sanitizer_nodes:
+                    graph.protect(node_id)
+    
+    def _get_node_id(self, line_number: int) -> Optional[str]:
+        """Find node ID in graph by line number"""
+        return find_node_id(self.graph, line_number)
+    
+    async def find_paths(self):
+        """Find paths from source to sink, queueing each one as soon as it is found"""
+        for path in self.iter_paths(checkpoints=True):
+            if path is None:
+                # Time slice used up, let the rest of the pipeline run
+                await asyncio.sleep(0)
+                continue
+            await self.path_analysis_queue.put(self._build_path_info(path))
+    
+    def iter_paths(self, checkpoints: bool = False) -> Iterator[Optional[List[str]]]:
+        """
+        Yield paths from source to sink with the search limits applied
+        
+        Args:
+            checkpoints: Also yield None each time the search's time slice is used up
+        """
+        if not self.source_node or not self.sink_node:
+            return
+        
+        # Every path starts at the source and ends at the sink, so either being a barrier leaves nothing to find
+        if self.unsanitized_only and (self.source_node in self.sanitizer_nodes or self.sink_node in self.sanitizer_nodes):
+            return
+        
+        if self.time_budget is not None:
+            self._deadline = time.monotonic() + self.time_budget
+        self._slice_started = time.monotonic()
+        
+        for path in self._search(self.source_node, self.sink_node):
+            if path is None:
+                if checkpoints:
+                    yield None
+                continue
+            
+            yield path
+            self.paths_found += 1
+            
+            if self.max_paths is not None and self.paths_found >= self.max_paths:
+                self.truncated = True
+                break
+    
+    def _search_options(self) -> Dict[str, Any]:
+        """Return the constructor options needed to recreate this search elsewhere"""
+        return {
+            "max_depth": self.max_depth,
+            "max_paths": self.max_paths,
+            "time_budget": self.time_budget,
+            "expansion_budget": self.expansion_budget,
+            "slice_time": self.slice_time,
+            "unsanitized_only": self.unsanitized_only,
+            "edge_kinds": sorted(self.edge_kinds) if self.edge_kinds is not None else None,
+            "source_node": self.source_node,
+            "sink_node": self.sink_node
+        }
+    
+    @abstractmethod
+    def _search(self, start: str, target: str) -> Iterator[Optional[List[str]]]:
+        """Yield paths (lists of node IDs) from start to target as they are found, or None at checkpoints"""
+        pass
+    
+    def _build_path_info(self, path: List[str]) -> Dict[str, Any]:
+        """Build the path information message for a found path"""
+        if self.summaries is not None:
+            path = self.summaries.expand(path, avoid=self.sanitizer_nodes)
+        if isinstance(self.graph, ChainCompaction):
+            path = self.graph.expand(path)
+        
+        sanitizers_in_path = [node for node in path if node in self.sanitizer_nodes]
+        
+        return {
+            "source": self.source,
+            "sink": self.sink,
+            "path": path,
+            "goes_through_sanitizer": len(sanitizers_in_path) > 0,
+            "sanitizers_crossed": sanitizers_in_path,
+            "strategy": self.name
+        }
+    
+    def _tick(self) -> bool:
+        """Count one node expansion and report whether the search should yield to the event loop"""
+        self.expansions += 1
+        self._slice_expansions += 1
+        
+        due = self.expansion_budget is not None and self._slice_expansions >= self.expansion_budget
+        if not due and self.slice_time is not None:
+            due = time.monotonic() - self._slice_started >= self.slice_time
+        
+        if due:
+            self.checkpoints += 1
+            self._slice_expansions = 0
+            if self.slice_time is not None:
+                self._slice_started = time.monotonic()
+        return due
+    
+    def _out_of_time(self) -> bool:
+        """Check the wall-clock budget, marking the search as truncated once it is spent"""
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            self.truncated = True
+            return True
+        return False
+    
+    def _next_nodes(self, node: str) -> List[str]:
+        """Return the nodes a search may step to from node: its neighbors, or the exits of its function body when summarized, leaving out sanitizers in unsanitized only mode"""
+        if self.summaries is not None and not self._in_sanitized_function(node):
+            exits = self.summaries.exits(node, self.sink_node)
+            if exits is not None:
+                return exits
+        
+        neighbors = self._neighbors(node)
+        if not self.unsanitized_only:
+            return neighbors
+        return [neighbor for neighbor in neighbors if neighbor not in self.sanitizer_nodes]
+    
+    def _in_sanitized_function(self, node: str) -> bool:
+        """Check whether node's function has a sanitizer in its body, so routes through it must not be merged by a jump"""
+        function = self.summaries.function_of(node)
+        if function is None:
+            return False
+        
+        # The sanitizers of a search never change while it runs, so the answer is kept per function
+        sanitized = self._sanitized_functions.get(function)
+        if sanitized is None:
+            sanitized = any(member in self.sanitizer_nodes for member in self.summaries.members(function))
+            self._sanitized_functions[function] = sanitized
+        return sanitized
+    
+    def _previous_nodes(self, node: str) -> List[str]:
+        """Return the predecessors a backward search may step to from node, leaving out sanitizers in unsanitized only mode"""
+        predecessors = self._get_predecessors(node)
+        if not self.unsanitized_only:
+            return predecessors
+        return [predecessor for predecessor in predecessors if predecessor not in self.sanitizer_nodes]
+    
+    def _neighbors(self, node: str) -> List[str]:
+        """Return the neighbors of node over the selected edge kinds"""
+        if self.edge_kinds is None:
+            return self.graph.get_neighbors(node)
+        if isinstance(self.graph, (GraphSnapshot, ChainCompaction)):
+            return self.graph.get_neighbors(node, kinds=self.edge_kinds)
+        
+        get_edge_kind = getattr(self.graph, 'get_edge_kind', None)
+        if get_edge_kind is None:
+            return self.graph.get_neighbors(node)
+        neighbors = []
+        for neighbor in self.graph.get_neighbors(node):
+            kind = get_edge_kind(node, neighbor)
+            if kind is None or kind in self.edge_kinds:
+                neighbors.append(neighbor)
+        return neighbors
+    
+    def _known_dead_end(self, node: str, target: str) -> bool:
+        """Check the shared memo for a node already known not to reach target"""
+        return self.reach_memo is not None and self.reach_memo.get(node, target) is False
+    
+    def _get_predecessors(self, node: str) -> List[str]:
+        """Return the nodes with an edge into node over the selected edge kinds, finishing the index first if needed"""
+        return self.predecessors.get(node, self.edge_kinds)
+    
+    def _index_predecessors(self) -> Generator[None, None, bool]:
+        """
+        Build whatever part of the predecessor index is still missing, yielding None at checkpoints
+        
+        Returns:
+            True once the index is complete, False if the time budget ran out first
+        """
+        for _ in self.predecessors.iter_build():
+            if self._out_of_time():
+                return False
+            if self._tick():
+                yield None
+        return True
+    
+    def _reach(self, root: str, next_nodes: Callable[[str], Iterable[str]],
+               within: Optional[Dict[str, int]] = None) -> Generator[None, None, Optional[Dict[str, int]]]:
+        """
+        Breadth first traversal collecting the nodes reachable from root, yielding None at checkpoints
+        
+        Args:
+            root: Node ID to start from
+            next_nodes: Neighbor lookup for the direction of the traversal (_next_nodes or _previous_nodes)
+            within: Only visit these nodes (None for the whole graph)
+        
+        Returns:
+            Reached node IDs mapped to their distance from root in traversal order, or None if the time budget ran out
+        """
+        reached = {root: 0}
+        frontier = deque([root])
+        
+        while frontier:
+            if self._out_of_time():
+                return None
+            
+            current = frontier.popleft()
+            if self._tick():
+                yield None
+            
+            for neighbor in next_nodes(current):
+                if neighbor in reached or (within is not None and neighbor not in within):
+                    continue
+                reached[neighbor] = reached[current] + 1
+                frontier.append(neighbor)
+        
+        return reached
+    
+    def _shortest_path(self, start: str, target: str, blocked_nodes: Set[str],
+                       blocked_edges: Set[Tuple[str, str]]) -> Generator[None, None, Optional[List[str]]]:
+        """
+        Breadth first search for the shortest path avoiding the given nodes and edges, yielding None at checkpoints
+        
+        Args:
+            start: Node ID to start from
+            target: Node ID to reach
+            blocked_nodes: Nodes that may not be entered
+            blocked_edges: (from, to) edges that may not be followed
+        
+        Returns:
+            Shortest path as a list of node IDs, or None if the target is unreachable or the time budget ran out
+        """
+        parents: Dict[str, Optional[str]] = {start: None}
+        frontier = deque([start])
+        
+        while frontier:
+            if self._out_of_time():
+                return None
+            
+            current = frontier.popleft()
+            
+            if current == target:
+                path = []
+                while current is not None:
+                    path.append(current)
+                    current = parents[current]
+                path.reverse()
+                return path
+            
+            if self._tick():
+                yield None
+            
+            for neighbor in self._next_nodes(current):
+                if neighbor in parents or neighbor in blocked_nodes:
+                    continue
+                if (current, neighbor) in blocked_edges:
+                    continue
+                parents[neighbor] = current
+                frontier.append(neighbor)
+        
+        return None
@@ -0,0 +1,43 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from unittest.mock import MagicMock
+
+
+def make_graph(edges: Dict[str, List[str]],
+               kinds: Optional[Dict[Tuple[str, str], str]] = None,
+               labels: Optional[Dict[Tuple[str, str], Tuple[str, Any]]] = None,
+               functions: Optional[Dict[str, Iterable[str]]] = None,
+               files: Optional[Dict[str, str]] = None) -> MagicMock:
+    """
+    Create a mock graph where a node named like 'n_X' sits on line X
+    
+    Args:
+        edges: Node -> its neighbors; every node named in it is in the graph
+        kinds: (from, to) -> edge kind, for edges that have one
+        labels: (from, to) -> call/return label, for edges that have one
+        functions: Function name -> the nodes of its body
+        files: Node -> the file it is in, for nodes that have one
+    
+    Returns:
+        Graph with nodes, edges and the neighbor / edge kind / edge label lookups; every neighbor
+        lookup is recorded in graph.calls
+    """
+    graph = MagicMock()
+    names = set(edges) | {n for targets in edges.values() for n in targets}
+    graph.nodes = {name: {"line": int(name.split("_")[1])} for name in sorted(names)}
+    for function, members in (functions or {}).items():
+        for name in members:
+            graph.nodes[name]["function"] = function
+    for name, file_name in (files or {}).items():
+        graph.nodes[name]["file"] = file_name
+    
+    graph.edges = edges
+    graph.calls = []
+    
+    def get_neighbors(node):
+        graph.calls.append(node)
+        return edges.get(node, [])
+    
+    graph.get_neighbors = get_neighbors
+    graph.get_edge_kind = lambda node, neighbor: (kinds or {}).get((node, neighbor))
+    graph.get_edge_label = lambda node, neighbor: (labels or {}).get((node, neighbor))
+    return graph
@@ -0,0 +1,197 @@
+import pytest
+import sys
+import os
+import asyncio
+
+
+# Ensure parent directory is on sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Here you can do imports for local files
+from Tests.helpers import make_graph
+import Paths.BitsetReachability as bitset_module
+from Paths.BitsetReachability import BitsetReachability
+from Paths.MultiSourceSearch import SourceReachability
+from Paths.Orchestrator import Orchestrator, PREFILTER_WAIT
+from Detectors import EndOfStream
+
+
+class TestBitsetReachability:
+    """Test suite for the bit-parallel reachability engine"""
+    
+    @pytest.fixture
+    def graph(self):
+        """Two sources sharing a helper, a cycle, and a sink only one of them reaches"""
+        return make_graph({
+            "n_1": ["n_10"],
+            "n_2": ["n_10", "n_20"],
+            "n_10": ["n_11"],
+            "n_11": ["n_12", "n_10"],
+            "n_12": ["n_90"],
+            "n_20": ["n_91"],
+            "n_3": []
+        })
+    
+    def test_matrix(self, graph):
+        """Test the sources x sinks matrix, including unknown nodes"""
+        pytest.importorskip("numpy")
+        engine = BitsetReachability(graph)
+        
+        matrix = engine.matrix(["n_1", "n_2", "n_3", "missing"], ["n_90", "n_91", "n_1", "missing"])
+        
+        assert matrix.tolist() == [
+            [True, False, True, False],
+            [True, True, False, False],
+            [False, False, False, False],
+            [False, False, False, False]
+        ]
+        assert engine.stats()["sources"] == 3
+        assert engine.stats()["batches"] == 1
+    
+    def test_matches_breadth_first_traversal(self):
+        """Test that several words of sources give the same answers as a plain traversal"""
+        pytest.importorskip("numpy")
+        # A layered graph: node n_i has edges to n_{2i} and n_{3i} below 400
+        edges = {f"n_{i}": [f"n_{j}" for j in (2 * i, 3 * i) if j < 400] for i in range(1, 400)}
+        graph = make_graph(edges)
+        engine = BitsetReachability(graph, batch_size=100)
+        
+        sources = [f"n_{i}" for i in range(1, 150)]
+        sinks = [f"n_{i}" for i in range(200, 400, 7)]
+        matrix = engine.matrix(sources, sinks)
+        
+        table = SourceReachability(graph)
+        assert matrix.tolist() == [[table.reaches(s, t) for t in sinks] for s in sources]
+        assert engine.stats()["batches"] == 2
+    
+    def test_batches_queued_sources(self, graph):
+        """Test that queued sources are propagated together on the first question"""
+        pytest.importorskip("numpy")
+        engine = BitsetReachability(graph)
+        engine.add_source("n_1")
+        engine.add_source("n_2")
+        
+        assert engine.reaches("n_2", "n_91") is True
+        assert engine.reaches("n_1", "n_91") is False
+        assert engine.stats()["batches"] == 1
+    
+    def test_edge_kinds(self, graph):
+        """Test that only the selected kinds (and untyped edges) are followed"""
+        pytest.importorskip("numpy")
+        graph = make_graph({"n_1": ["n_2", "n_3"], "n_2": ["n_9"], "n_3": ["n_8"]},
+                                {("n_1", "n_2"): "control", ("n_1", "n_3"): "data"})
+        
+        engine = BitsetReachability(graph, edge_kinds=["data"])
+        
+        assert engine.matrix(["n_1"], ["n_9", "n_8"]).tolist() == [[False, True]]
+        with pytest.raises(ValueError):
+            BitsetReachability(graph, edge_kinds=["unknown"])
+    
+    @pytest.mark.asyncio
+    async def test_orchestrator_skips_unreachable_pairs(self, graph):
+        """Test that the orchestrator only searches pairs the prefilter finds connected"""
+        pytest.importorskip("numpy")
+        path_analysis_queue = asyncio.Queue()
+        orchestrator = Orchestrator(
+            source_queue=asyncio.Queue(),
+            sink_queue=asyncio.Queue(),
+            sanitizer_queue=asyncio.Queue(),
+            graph=graph,
+            path_analysis_queue=path_analysis_queue,
+            prefilter=True
+        )
+        
+        await orchestrator._create_search_task({"line_number": 1}, {"line_number": 91})
+        await orchestrator._create_search_task({"line_number": 2}, {"line_number": 91})
+        
+        assert orchestrator.skipped_pairs == 1
+        assert path_analysis_queue.qsize() == 1
+        assert orchestrator.get_stats()["prefilter"]["skipped_pairs"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_streamed_sources_batched(self, graph):
+        """Test that sources arriving one at a time are still propagated in one batch"""
+        pytest.importorskip("numpy")
+        source_queue = asyncio.Queue()
+        sink_queue = asyncio.Queue()
+        orchestrator = Orchestrator(
+            source_queue=source_queue,
+            sink_queue=sink_queue,
+            sanitizer_queue=asyncio.Queue(),
+            graph=graph,
+            path_analysis_queue=asyncio.Queue(),
+            prefilter=True
+        )
+        
+        await sink_queue.put({"line_number": 90})
+        start_task = asyncio.create_task(orchestrator.start())
+        for line in (1, 2, 3):
+            await asyncio.sleep(0.01)
+            await source_queue.put({"line_number": line})
+        await asyncio.sleep(0.5)
+        orchestrator.stop()
+        await start_task
+        
+        stats = orchestrator.get_stats()["prefilter"]
+        assert stats["sources"] == 3
+        assert stats["batches"] == 1
+        assert stats["skipped_pairs"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_source_stream_end_flushes_batch(self, graph):
+        """Test that pairs do not wait out the batching delay once no more sources can come"""
+        pytest.importorskip("numpy")
+        source_queue = asyncio.Queue()
+        sink_queue = asyncio.Queue()
+        orchestrator = Orchestrator(
+            source_queue=source_queue,
+            sink_queue=sink_queue,
+            sanitizer_queue=asyncio.Queue(),
+            graph=graph,
+            path_analysis_queue=asyncio.Queue(),
+            prefilter=True
+        )
+        
+        await sink_queue.put({"line_number": 91})
+        await sink_queue.put(EndOfStream("sinks", 0.0))
+        await orchestrator.sanitizer_queue.put(EndOfStream("sanitizers", 0.0))
+        for line in (1, 2):
+            await source_queue.put({"line_number": line})
+        await source_queue.put(EndOfStream("sources", 0.0))
+        
+        await asyncio.wait_for(orchestrator.start(), timeout=PREFILTER_WAIT / 2)
+        
+        stats = orchestrator.get_stats()["prefilter"]
+        assert stats["batches"] == 1
+        assert stats["skipped_pairs"] == 1
+    
+    def test_without_numpy(self, graph, monkeypatch):
+        """Test that without NumPy the engine cannot be created and the orchestrator runs every pair"""
+        monkeypatch.setattr(bitset_module, "np", None)
+        
+        with pytest.raises(ImportError):
+            BitsetReachability(graph)
+        
+        orchestrator = Orchestrator(
+            source_queue=asyncio.Queue(),
+            sink_queue=asyncio.Queue(),
+            sanitizer_queue=asyncio.Queue(),
+            graph=graph,
+            path_analysis_queue=asyncio.Queue(),
+            prefilter=True
+        )
+        assert orchestrator.prefilter is None
+
+
+if __name__ == "__main__":
+    # Ensure parent directory (project root) is on sys.path for imports like `from Detectors ...`
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    
+    # Run just this test module when executed directly
+    raise SystemExit(pytest.main([os.path.abspath(__file__)]))
@@ -157,6 +157,36 @@ class TestDetectorThreads:
         assert len(source_results) > 0
         assert len(sink_results) > 0
     
+    def test_end_of_stream_after_threads(self, sample_queue, temp_repo):
+        """Test that the end-of-stream marker is put on the queue once, after every detection"""
+        from Detectors import EndOfStream
+        from Detectors.Sources import SourcesDetector
+        
+        detector = SourcesDetector(sample_queue, temp_repo)
+        for thread in detector.start_threads(end_of_stream=True):
+            thread.join(timeout=2)
+        
+        results = []
+        while not sample_queue.empty():
+            results.append(sample_queue.get())
+        
+        assert len(results) > 1
+        assert isinstance(results[-1], EndOfStream)
+        assert results[-1].stage == "sources"
+        assert results[-1].elapsed >= 0
+        assert not any(isinstance(r, EndOfStream) for r in results[:-1])
+    
+    def test_no_end_of_stream_by_default(self, sample_queue, temp_repo):
+        """Test that detectors started without end_of_stream only put detections on the queue"""
+        from Detectors.Sinks import SinksDetector
+        
+        detector = SinksDetector(sample_queue, temp_repo)
+        for thread in detector.start_threads():
+            thread.join(timeout=2)
+        
+        while not sample_queue.empty():
+            assert sample_queue.get()['type'] == 'sink'
+    
 
 
 if __name__ == "__main__":
@@ -0,0 +1,199 @@
+import pytest
+import sys
+import os
+import asyncio
+
+
+# Ensure parent directory is on sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Here you can do imports for local files
+from Tests.helpers import make_graph
+from Paths.FunctionSummaries import FunctionSummaries
+from Paths.DepthFirstSearch import DepthFirstSearch
+from Paths.BreadthFirstSearch import BreadthFirstSearch
+
+
+class TestFunctionSummaries:
+    """Test suite for function-level flow summaries"""
+    
+    # n_1 calls a helper (n_10 .. n_13) that returns to n_2, which flows to the sink n_9
+    EDGES = {
+        "n_1": ["n_10"],
+        "n_10": ["n_11", "n_12"],
+        "n_11": ["n_13"],
+        "n_12": ["n_13"],
+        "n_13": ["n_2"],
+        "n_2": ["n_9"]
+    }
+    HELPER = ("n_10", "n_11", "n_12", "n_13")
+    
+    def test_exits_jump_over_body(self):
+        """Test that a node inside a function steps straight to the nodes outside it"""
+        graph = make_graph(self.EDGES, functions={"helper": self.HELPER})
+        summaries = FunctionSummaries(graph)
+        
+        assert summaries.exits("n_1", "n_9") is None
+        assert summaries.exits("n_10", "n_9") == ["n_2"]
+        assert summaries.expand(["n_1", "n_10", "n_2", "n_9"]) == ["n_1", "n_10", "n_11", "n_13", "n_2", "n_9"]
+    
+    def test_no_jump_when_target_inside(self):
+        """Test that a function is walked normally when the target lies inside it"""
+        graph = make_graph(self.EDGES, functions={"helper": self.HELPER})
+        summaries = FunctionSummaries(graph)
+        
+        assert summaries.exits("n_10", "n_13") is None
+    
+    def test_expand_avoids_sanitizers(self):
+        """Test that the way spliced into a path goes around a sanitizer inside the body when it can"""
+        graph = make_graph(self.EDGES, functions={"helper": self.HELPER})
+        summaries = FunctionSummaries(graph)
+        summaries.exits("n_10", "n_9")
+        
+        assert summaries.expand(["n_10", "n_2"], avoid={"n_11"}) == ["n_10", "n_12", "n_13", "n_2"]
+        assert summaries.expand(["n_10", "n_2"], avoid={"n_11", "n_12"}) == ["n_10", "n_11", "n_13", "n_2"]
+    
+    def test_cache_reused_across_runs(self, tmp_path):
+        """Test that summaries saved by one run are reused for an unchanged function, even if it moved"""
+        cache = str(tmp_path / "summaries.json")
+        graph = make_graph(self.EDGES, functions={"helper": self.HELPER})
+        first = FunctionSummaries(graph, cache_path=cache)
+        first.exits("n_10", "n_9")
+        first.save()
+        assert first.stats() == {"functions": 1, "computed": 1, "reused": 0}
+        
+        # Same helper shifted down by 10 lines
+        moved = {
+            "n_1": ["n_20"],
+            "n_20": ["n_21", "n_22"],
+            "n_21": ["n_23"],
+            "n_22": ["n_23"],
+            "n_23": ["n_2"],
+            "n_2": ["n_9"]
+        }
+        graph = make_graph(moved, functions={"helper": ("n_20", "n_21", "n_22", "n_23")})
+        second = FunctionSummaries(graph, cache_path=cache)
+        
+        assert second.exits("n_20", "n_9") == ["n_2"]
+        assert second.expand(["n_20", "n_2"]) == ["n_20", "n_21", "n_23", "n_2"]
+        assert second.stats() == {"functions": 1, "computed": 0, "reused": 1}
+    
+    def test_searches_report_expanded_paths(self):
+        """Test that DFS and BFS step over the helper but report the full path"""
+        for strategy in (DepthFirstSearch, BreadthFirstSearch):
+            graph = make_graph(self.EDGES, functions={"helper": self.HELPER})
+            search = strategy(
+                source={"line_number": 1},
+                sink={"line_number": 9},
+                sanitizers=[{"line_number": 2}],
+                graph=graph,
+                path_analysis_queue=None,
+                summaries=FunctionSummaries(graph)
+            )
+            
+            paths = list(search.iter_paths())
+            assert paths == [["n_1", "n_10", "n_2", "n_9"]]
+            
+            path_info = search._build_path_info(paths[0])
+            assert path_info["path"] == ["n_1", "n_10", "n_11", "n_13", "n_2", "n_9"]
+            assert path_info["sanitizers_crossed"] == ["n_2"]
+    
+    def test_sanitized_body_walked(self):
+        """Test that a function with a sanitizer in its body is not jumped over, so both routes through it are found"""
+        for strategy in (DepthFirstSearch, BreadthFirstSearch):
+            graph = make_graph(self.EDGES, functions={"helper": self.HELPER})
+            search = strategy(
+                source={"line_number": 1},
+                sink={"line_number": 9},
+                sanitizers=[{"line_number": 11}],
+                graph=graph,
+                path_analysis_queue=None,
+                summaries=FunctionSummaries(graph)
+            )
+            
+            paths = sorted(search.iter_paths())
+            assert paths == [["n_1", "n_10", "n_11", "n_13", "n_2", "n_9"], ["n_1", "n_10", "n_12", "n_13", "n_2", "n_9"]]
+            crossed = sorted(search._build_path_info(path)["sanitizers_crossed"] for path in paths)
+            assert crossed == [[], ["n_11"]]
+    
+    @pytest.mark.asyncio
+    async def test_orchestrator_summaries_opt_in(self):
+        """Test that searches only jump over bodies when enabled, and a late sanitizer in a jumped body re-searches the pair"""
+        from Paths.Orchestrator import Orchestrator
+        
+        graph = make_graph(self.EDGES, functions={"helper": self.HELPER})
+        source = {"line_number": 1, "file": "a.c"}
+        sink = {"line_number": 9, "file": "a.c"}
+        
+        default = Orchestrator(asyncio.Queue(), asyncio.Queue(), asyncio.Queue(), graph, asyncio.Queue())
+        assert default.shared_resources["summaries"] is None
+        assert "summaries" not in default.get_stats()
+        await default._create_search_task(source, sink)
+        assert default.path_store.stats()["unique"] == 2
+        
+        paths = asyncio.Queue()
+        sanitizer_queue = asyncio.Queue()
+        orchestrator = Orchestrator(asyncio.Queue(), asyncio.Queue(), sanitizer_queue, graph, paths,
+                                    function_summaries=True)
+        await orchestrator._create_search_task(source, sink)
+        assert orchestrator.path_store.stats()["unique"] == 1
+        
+        # The jump reported the route through n_11; once n_11 is a sanitizer the route around it is found too
+        orchestrator.started_at = 0.0
+        orchestrator.scheduler.start()
+        monitor = asyncio.create_task(orchestrator._monitor_sanitizers())
+        await sanitizer_queue.put({"line_number": 11, "file": "a.c"})
+        await asyncio.sleep(0.1)
+        await orchestrator.scheduler.join()
+        monitor.cancel()
+        await orchestrator.scheduler.stop()
+        
+        results = []
+        while not paths.empty():
+            results.append(paths.get_nowait())
+        routes = [r for r in results if not r.get("update")]
+        assert len(routes) == 2
+        assert any(r["sanitizers_crossed"] == [] for r in routes)
+    
+    @pytest.mark.asyncio
+    async def test_worker_summaries_saved(self, tmp_path):
+        """Test that summaries computed in worker processes end up in the summary cache"""
+        from Paths.Orchestrator import Orchestrator
+        
+        graph = make_graph(self.EDGES, functions={"helper": self.HELPER})
+        cache_path = str(tmp_path / "summaries.json")
+        source_queue = asyncio.Queue()
+        sink_queue = asyncio.Queue()
+        orchestrator = Orchestrator(source_queue, sink_queue, asyncio.Queue(), graph, asyncio.Queue(),
+                                    workers=1, function_summaries=True, summary_cache=cache_path)
+        await source_queue.put({"line_number": 1, "file": "a.c"})
+        await sink_queue.put({"line_number": 9, "file": "a.c"})
+        
+        start_task = asyncio.create_task(orchestrator.start())
+        for _ in range(100):
+            if orchestrator.path_store.stats()["unique"]:
+                break
+            await asyncio.sleep(0.1)
+        orchestrator.stop()
+        await start_task
+        
+        assert orchestrator.path_store.stats()["unique"] == 1
+        assert orchestrator.summaries.stats()["computed"] == 0
+        
+        # The next run reuses what the worker computed
+        cached = FunctionSummaries(graph, cache_path=cache_path)
+        assert cached.exits("n_10", "n_9") == ["n_2"]
+        assert cached.stats() == {"functions": 1, "computed": 0, "reused": 1}
+
+if __name__ == "__main__":
+    # Ensure parent directory (project root) is on sys.path for imports like `from Detectors ...`
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    
+    # Run just this test module when executed directly
+    raise SystemExit(pytest.main([os.path.abspath(__file__)]))
@@ -0,0 +1,182 @@
+import pytest
+import sys
+import os
+
+
+# Ensure parent directory is on sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Here you can do imports for local files
+from Tests.helpers import make_graph
+from Graphs.Compaction import ChainCompaction
+from Paths.DepthFirstSearch import DepthFirstSearch
+from Paths.BidirectionalSearch import BidirectionalSearch
+from Paths.ChopSearch import ChopSearch
+from Paths.MultiSourceSearch import MultiSourceSearch, SourceReachability
+
+
+class TestChainCompaction:
+    """Test suite for the collapsed-chain view of a graph"""
+    
+    @pytest.fixture
+    def graph(self):
+        """Two long chains from n_1 meeting at n_50, which flows to the sink n_99"""
+        return make_graph({
+            "n_1": ["n_2", "n_10"],
+            "n_2": ["n_3"],
+            "n_3": ["n_4"],
+            "n_4": ["n_50"],
+            "n_10": ["n_11"],
+            "n_11": ["n_12"],
+            "n_12": ["n_50"],
+            "n_50": ["n_99"]
+        })
+    
+    def test_chains_collapsed_and_expanded(self):
+        """Test that a chain becomes one super-edge and expands back to the original nodes"""
+        graph = make_graph({"n_1": ["n_2"], "n_2": ["n_3"], "n_3": ["n_4"], "n_4": ["n_9", "n_8"]})
+        view = ChainCompaction(graph)
+        
+        assert view.get_neighbors("n_1") == ["n_4"]
+        assert view.get_predecessors("n_4") == ["n_1"]
+        assert view.expand(["n_1", "n_4", "n_9"]) == ["n_1", "n_2", "n_3", "n_4", "n_9"]
+        assert view.stats() == {"chain_nodes": 2, "super_edges": 1, "protected": 0}
+    
+    def test_parallel_chains_not_collapsed(self, graph):
+        """Test that chains ending at the same node are walked node by node, so paths stay distinct"""
+        view = ChainCompaction(graph)
+        
+        assert view.get_neighbors("n_1") == ["n_2", "n_10"]
+        assert view.get_neighbors("n_2") == ["n_50"]
+        assert view.expand(["n_1", "n_2", "n_50"]) == ["n_1", "n_2", "n_3", "n_4", "n_50"]
+    
+    def test_protect_splits_chain(self):
+        """Test that a protected node stays visible and old super-edges still expand"""
+        graph = make_graph({"n_1": ["n_2"], "n_2": ["n_3"], "n_3": ["n_4"], "n_4": ["n_9", "n_8"]})
+        view = ChainCompaction(graph)
+        assert view.get_neighbors("n_1") == ["n_4"]
+        
+        view.protect("n_3")
+        
+        assert view.get_neighbors("n_1") == ["n_3"]
+        assert view.get_neighbors("n_3") == ["n_4"]
+        assert sorted(view.get_predecessors("n_4")) == ["n_3"]
+        assert view.expand(["n_1", "n_3", "n_4"]) == ["n_1", "n_2", "n_3", "n_4"]
+        assert view.expand(["n_1", "n_4"]) == ["n_1", "n_2", "n_3", "n_4"]
+    
+    def test_reachability_rebuilt_after_protect(self):
+        """Test that a shared reachability table built before a sink was protected still finds that sink"""
+        graph = make_graph({"n_1": ["n_2"], "n_2": ["n_3"], "n_3": ["n_4"], "n_4": ["n_9", "n_8"]})
+        view = ChainCompaction(graph)
+        reachability = SourceReachability(view)
+        
+        def search(sink_line):
+            return MultiSourceSearch(
+                source={"line_number": 1},
+                sink={"line_number": sink_line},
+                sanitizers=[],
+                graph=view,
+                path_analysis_queue=None,
+                reachability=reachability
+            )
+        
+        assert list(search(9).iter_paths()) == [["n_1", "n_4", "n_9"]]
+        assert "n_3" not in reachability.traverse("n_1")
+        
+        # The second search protects n_3, which the table stepped over
+        assert list(search(3).iter_paths()) == [["n_1", "n_3"]]
+        assert reachability.traversals == 2
+    
+    def test_reachability_keeps_tables_off_split_chain(self):
+        """Test that splitting a chain only drops the tables that stepped over it"""
+        graph = make_graph({
+            "n_1": ["n_2"], "n_2": ["n_3"], "n_3": ["n_4"], "n_4": ["n_8", "n_9"],
+            "n_10": ["n_11"], "n_11": ["n_12"], "n_12": ["n_13", "n_14"]
+        })
+        view = ChainCompaction(graph)
+        reachability = SourceReachability(view)
+        
+        reachability.traverse("n_1")
+        reachability.traverse("n_10")
+        assert reachability.traversals == 2
+        
+        view.protect("n_3")
+        assert view.chain_start("n_3") == "n_1"
+        assert "n_3" in reachability.traverse("n_1")
+        assert "n_13" in reachability.traverse("n_10")
+        assert reachability.traversals == 3
+    
+    def test_chains_stop_at_kind_changes(self):
+        """Test that a chain is only collapsed over edges of one kind, and keeps that kind"""
+        edges = {"n_1": ["n_2"], "n_2": ["n_3"], "n_3": ["n_4"], "n_4": ["n_9", "n_8"]}
+        kinds = {("n_1", "n_2"): "data", ("n_2", "n_3"): "data", ("n_3", "n_4"): "control"}
+        view = ChainCompaction(make_graph(edges, kinds))
+        
+        assert view.get_neighbors("n_1") == ["n_3"]
+        assert view.get_edge_kind("n_1", "n_3") == "data"
+        assert view.get_neighbors("n_1", kinds=["control"]) == []
+        assert view.get_neighbors("n_3", kinds=["control"]) == ["n_4"]
+    
+    def test_searches_report_original_nodes(self, graph):
+        """Test that searches on the view protect their endpoints and sanitizers and report full paths"""
+        view = ChainCompaction(graph)
+        
+        dfs = DepthFirstSearch(
+            source={"line_number": 1},
+            sink={"line_number": 99},
+            sanitizers=[{"line_number": 11}],
+            graph=view,
+            path_analysis_queue=None
+        )
+        infos = [dfs._build_path_info(path) for path in dfs.iter_paths()]
+        
+        assert sorted(info["path"] for info in infos) == [
+            ["n_1", "n_10", "n_11", "n_12", "n_50", "n_99"],
+            ["n_1", "n_2", "n_3", "n_4", "n_50", "n_99"]
+        ]
+        assert sorted(info["sanitizers_crossed"] for info in infos) == [[], ["n_11"]]
+        assert {"n_1", "n_99", "n_11"} <= view.protected
+        
+        bidi = BidirectionalSearch(
+            source={"line_number": 2},
+            sink={"line_number": 99},
+            sanitizers=[],
+            graph=view,
+            path_analysis_queue=None
+        )
+        assert [bidi._build_path_info(path)["path"] for path in bidi.iter_paths()] == [
+            ["n_2", "n_3", "n_4", "n_50", "n_99"]
+        ]
+    
+    def test_chop_edges_expanded(self):
+        """Test that the chop record lists the edges of the original graph"""
+        graph = make_graph({"n_1": ["n_2", "n_7"], "n_2": ["n_3"], "n_3": ["n_9"], "n_7": ["n_9", "n_6"]})
+        chop = ChopSearch(
+            source={"line_number": 1},
+            sink={"line_number": 9},
+            sanitizers=[],
+            graph=ChainCompaction(graph),
+            path_analysis_queue=None
+        )
+        
+        list(chop.iter_paths())
+        
+        assert chop.graph.get_neighbors("n_1") == ["n_9", "n_7"]
+        assert sorted(chop.chop["nodes"]) == ["n_1", "n_2", "n_3", "n_7", "n_9"]
+        assert sorted(chop.chop["edges"]) == [
+            ("n_1", "n_2"), ("n_1", "n_7"), ("n_2", "n_3"), ("n_3", "n_9"), ("n_7", "n_9")
+        ]
+
+
+if __name__ == "__main__":
+    # Ensure parent directory (project root) is on sys.path for imports like `from Detectors ...`
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    
+    # Run just this test module when executed directly
+    raise SystemExit(pytest.main([os.path.abspath(__file__)]))
@@ -0,0 +1,122 @@
+import pytest
+import sys
+import os
+import tempfile
+from unittest.mock import MagicMock
+
+
+# Ensure parent directory is on sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Here you can do imports for local files
+from Graphs.Snapshot import GraphSnapshot
+
+
+class TestGraphSnapshot:
+    """Test suite for the shared, memory mapped graph snapshot"""
+    
+    @pytest.fixture
+    def mock_graph(self):
+        """Create a mock graph object with a cycle and a dangling edge"""
+        graph = MagicMock()
+        graph.nodes = {
+            "node_1": {"line": 10, "file": "a.c"},
+            "node_2": {"line": 20, "file": "a.c"},
+            "node_3": {"line": 30, "file": "b.c"},
+            "node_4": {"line": 40, "file": "b.c"}
+        }
+        edges = {
+            "node_1": ["node_2", "node_3"],
+            "node_2": ["node_4"],
+            "node_3": ["node_4", "missing"],
+            "node_4": ["node_1"]
+        }
+        graph.get_neighbors = lambda node: edges.get(node, [])
+        return graph
+    
+    def test_from_graph(self, mock_graph):
+        """Test that a snapshot keeps the nodes and edges of the graph"""
+        snapshot = GraphSnapshot.from_graph(mock_graph)
+        
+        assert snapshot.nodes == mock_graph.nodes
+        assert snapshot.get_neighbors("node_1") == ["node_2", "node_3"]
+        assert snapshot.get_neighbors("node_3") == ["node_4"]
+        assert snapshot.get_neighbors("unknown") == []
+        assert list(snapshot.offsets) == [0, 2, 3, 4, 5]
+    
+    def test_predecessors(self, mock_graph):
+        """Test the reverse lookups built from the CSR arrays"""
+        snapshot = GraphSnapshot.from_graph(mock_graph)
+        
+        assert sorted(snapshot.get_predecessors("node_4")) == ["node_2", "node_3"]
+        assert snapshot.get_predecessors("node_1") == ["node_4"]
+        assert snapshot.get_predecessors("unknown") == []
+    
+    def test_save_and_load(self, mock_graph):
+        """Test that a saved snapshot maps back with the same graph"""
+        snapshot = GraphSnapshot.from_graph(mock_graph)
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "graph.snapshot")
+            snapshot.save(path)
+            
+            loaded = GraphSnapshot.load(path)
+            try:
+                assert isinstance(loaded.targets, memoryview)
+                assert loaded.nodes == mock_graph.nodes
+                for node_id in mock_graph.nodes:
+                    assert loaded.get_neighbors(node_id) == snapshot.get_neighbors(node_id)
+                assert sorted(loaded.get_predecessors("node_4")) == ["node_2", "node_3"]
+            finally:
+                loaded.close()
+    
+    def test_edge_kinds(self, mock_graph):
+        """Test that edge kinds and call site labels are kept, filtered on, and survive save and load"""
+        labels = {("node_1", "node_3"): ("call", "node_1"), ("node_3", "node_4"): ("return", "node_1")}
+        mock_graph.get_edge_kind = lambda node, neighbor: "control" if node == "node_4" else "data"
+        mock_graph.get_edge_label = lambda node, neighbor: labels.get((node, neighbor))
+        snapshot = GraphSnapshot.from_graph(mock_graph)
+        
+        assert snapshot.get_edge_kind("node_1", "node_2") == "data"
+        assert snapshot.get_edge_kind("node_1", "node_3") == "call"
+        assert snapshot.get_edge_label("node_3", "node_4") == ("return", "node_1")
+        assert snapshot.get_edge_label("node_1", "node_2") is None
+        
+        assert snapshot.get_neighbors("node_1", kinds=["data"]) == ["node_2"]
+        assert snapshot.get_neighbors("node_4", kinds=["data", "call"]) == []
+        assert snapshot.get_predecessors("node_4", kinds=["data"]) == ["node_2"]
+        with pytest.raises(ValueError):
+            snapshot.get_neighbors("node_1", kinds=["unknown"])
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "graph.snapshot")
+            snapshot.save(path)
+            
+            loaded = GraphSnapshot.load(path)
+            try:
+                assert loaded.get_neighbors("node_1", kinds=["call"]) == ["node_3"]
+                assert loaded.get_edge_label("node_1", "node_3") == ("call", "node_1")
+                assert loaded.get_edge_kind("node_4", "node_1") == "control"
+            finally:
+                loaded.close()
+    
+    def test_untyped_graph(self, mock_graph):
+        """Test that edges of graphs without kinds are untyped and never filtered out"""
+        snapshot = GraphSnapshot.from_graph(mock_graph)
+        
+        assert snapshot.get_edge_kind("node_1", "node_2") is None
+        assert snapshot.get_neighbors("node_1", kinds=["data"]) == ["node_2", "node_3"]
+
+
+if __name__ == "__main__":
+    # Ensure parent directory (project root) is on sys.path for imports like `from Detectors ...`
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    
+    # Run just this test module when executed directly
+    raise SystemExit(pytest.main([os.path.abspath(__file__)]))
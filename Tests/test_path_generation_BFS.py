@@ -0,0 +1,236 @@
+import pytest
+import sys
+import os
+import asyncio
+from unittest.mock import MagicMock
+
+
+# Ensure parent directory is on sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Here you can do imports for local files
+from Paths.BreadthFirstSearch import BreadthFirstSearch
+
+
+class TestPathGenerationBFS:
+    """Test suite for path generation, breadth first search"""
+    
+    @pytest.fixture
+    def complex_graph(self):
+        """Create a graph with paths of different lengths from source to sink"""
+        graph = MagicMock()
+        
+        nodes = {
+            "source_100": {"line": 100, "type": "source"},
+            "node_200": {"line": 200, "type": "intermediate"},
+            "node_300": {"line": 300, "type": "intermediate"},
+            "sanitizer_400": {"line": 400, "type": "sanitizer"},
+            "sanitizer_500": {"line": 500, "type": "sanitizer"},
+            "node_600": {"line": 600, "type": "intermediate"},
+            "sink_700": {"line": 700, "type": "sink"}
+        }
+        
+        # The long branch is listed first so DFS would find it first
+        edges = {
+            "source_100": ["node_300", "node_200", "sink_700"],
+            "node_200": ["sanitizer_400", "node_600"],
+            "node_300": ["sanitizer_500"],
+            "sanitizer_400": ["sink_700"],
+            "sanitizer_500": ["node_600"],
+            "node_600": ["sink_700", "node_300"],
+            "sink_700": []
+        }
+        
+        graph.nodes = nodes
+        graph.edges = edges
+        graph.get_neighbors = lambda node: edges.get(node, [])
+        
+        return graph
+    
+    @pytest.fixture
+    def async_queue(self):
+        """Create an async queue for path analysis"""
+        return asyncio.Queue()
+    
+    def create_bfs(self, graph, queue, **kwargs):
+        """Create a BFS instance for the complex graph"""
+        return BreadthFirstSearch(
+            source={"line_number": 100},
+            sink={"line_number": 700},
+            sanitizers=[{"line_number": 400}, {"line_number": 500}],
+            graph=graph,
+            path_analysis_queue=queue,
+            **kwargs
+        )
+    
+    async def collect(self, queue):
+        """Drain all path information from the queue"""
+        results = []
+        while not queue.empty():
+            results.append(await queue.get())
+        return results
+    
+    @pytest.mark.asyncio
+    async def test_paths_emitted_shortest_first(self, complex_graph, async_queue):
+        """Test that paths come out in order of length"""
+        bfs = self.create_bfs(complex_graph, async_queue)
+        
+        await bfs.find_paths()
+        
+        paths = [info["path"] for info in await self.collect(async_queue)]
+        lengths = [len(path) for path in paths]
+        
+        assert paths[0] == ["source_100", "sink_700"]
+        assert lengths == sorted(lengths)
+        assert len(paths) == 4
+        assert ["source_100", "node_300", "sanitizer_500", "node_600", "sink_700"] in paths
+    
+    @pytest.mark.asyncio
+    async def test_path_info_format(self, complex_graph, async_queue):
+        """Test that BFS emits the same path information as DFS"""
+        bfs = self.create_bfs(complex_graph, async_queue, max_paths=2)
+        
+        await bfs.find_paths()
+        
+        results = await self.collect(async_queue)
+        assert len(results) == 2
+        
+        direct, sanitized = results
+        assert direct["source"] == {"line_number": 100}
+        assert direct["sink"] == {"line_number": 700}
+        assert direct["goes_through_sanitizer"] is False
+        assert direct["sanitizers_crossed"] == []
+        assert sanitized["goes_through_sanitizer"] is True
+        assert sanitized["sanitizers_crossed"] == ["sanitizer_400"]
+    
+    @pytest.mark.asyncio
+    async def test_single_shortest_witness(self, complex_graph, async_queue):
+        """Test that max_paths=1 gives just the shortest witness"""
+        bfs = self.create_bfs(complex_graph, async_queue, max_paths=1)
+        
+        await bfs.find_paths()
+        
+        results = await self.collect(async_queue)
+        assert [info["path"] for info in results] == [["source_100", "sink_700"]]
+        assert bfs.truncated is True
+    
+    @pytest.mark.asyncio
+    async def test_max_depth_limit(self, complex_graph, async_queue):
+        """Test that paths longer than max_depth edges are not explored"""
+        bfs = self.create_bfs(complex_graph, async_queue, max_depth=3)
+        
+        await bfs.find_paths()
+        
+        paths = [info["path"] for info in await self.collect(async_queue)]
+        assert all(len(path) <= 4 for path in paths)
+        assert len(paths) == 3
+    
+    @pytest.mark.asyncio
+    async def test_cycle_detection(self, async_queue):
+        """Test that cycles do not produce repeated nodes or endless searching"""
+        graph = MagicMock()
+        graph.nodes = {
+            "source_1": {"line": 1},
+            "node_2": {"line": 2},
+            "node_3": {"line": 3},
+            "sink_4": {"line": 4}
+        }
+        graph.edges = {
+            "source_1": ["node_2"],
+            "node_2": ["node_3"],
+            "node_3": ["node_2", "source_1", "sink_4"],
+            "sink_4": []
+        }
+        graph.get_neighbors = lambda node: graph.edges.get(node, [])
+        
+        bfs = BreadthFirstSearch(
+            source={"line_number": 1},
+            sink={"line_number": 4},
+            sanitizers=[],
+            graph=graph,
+            path_analysis_queue=async_queue
+        )
+        
+        await bfs.find_paths()
+        
+        paths = [info["path"] for info in await self.collect(async_queue)]
+        assert paths == [["source_1", "node_2", "node_3", "sink_4"]]
+    
+    @pytest.mark.asyncio
+    async def test_no_path_exists(self, async_queue):
+        """Test when no path exists from source to sink"""
+        graph = MagicMock()
+        graph.nodes = {
+            "source_1": {"line": 1},
+            "sink_2": {"line": 2}
+        }
+        graph.get_neighbors = lambda node: []
+        
+        bfs = BreadthFirstSearch(
+            source={"line_number": 1},
+            sink={"line_number": 2},
+            sanitizers=[],
+            graph=graph,
+            path_analysis_queue=async_queue
+        )
+        
+        await bfs.find_paths()
+        
+        assert async_queue.qsize() == 0
+
+    @pytest.mark.asyncio
+    async def test_unsanitized_only_across_strategies(self, complex_graph):
+        """Test that every strategy honours unsanitized_only and never reports a sanitized path"""
+        from Paths.BidirectionalSearch import BidirectionalSearch
+        from Paths.ChopSearch import ChopSearch
+        from Paths.SanitizerDominance import SanitizerDominance
+        
+        queue = asyncio.Queue()
+        await self.create_bfs(complex_graph, queue, unsanitized_only=True).find_paths()
+        results = await self.collect(queue)
+        assert [r["path"] for r in results] == [
+            ["source_100", "sink_700"],
+            ["source_100", "node_200", "node_600", "sink_700"]
+        ]
+        
+        for strategy in (BidirectionalSearch, ChopSearch, SanitizerDominance):
+            search = strategy(
+                source={"line_number": 100},
+                sink={"line_number": 700},
+                sanitizers=[{"line_number": 400}, {"line_number": 500}],
+                graph=complex_graph,
+                path_analysis_queue=queue,
+                unsanitized_only=True
+            )
+            await search.find_paths()
+            results = await self.collect(queue)
+            
+            assert len(results) == 1
+            assert results[0]["path"] == ["source_100", "sink_700"]
+            assert results[0]["goes_through_sanitizer"] is False
+        
+        # The chop of the unsanitized region leaves the sanitizers and the cycle through them out
+        chop = ChopSearch(
+            source={"line_number": 100},
+            sink={"line_number": 700},
+            sanitizers=[{"line_number": 400}, {"line_number": 500}],
+            graph=complex_graph,
+            path_analysis_queue=queue,
+            unsanitized_only=True
+        )
+        list(chop.iter_paths())
+        assert set(chop.chop["nodes"]) == {"source_100", "node_200", "node_600", "sink_700"}
+
+
+if __name__ == "__main__":
+    # Ensure parent directory (project root) is on sys.path for imports like `from Detectors ...`
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    
+    # Run just this test module when executed directly
+    raise SystemExit(pytest.main([os.path.abspath(__file__)]))
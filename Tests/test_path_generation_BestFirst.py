@@ -0,0 +1,130 @@
+import pytest
+import sys
+import os
+import asyncio
+
+
+# Ensure parent directory is on sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Here you can do imports for local files
+from Tests.helpers import make_graph
+from Paths.BestFirstSearch import BestFirstSearch
+from Paths.DepthFirstSearch import DepthFirstSearch
+from Paths.FunctionSummaries import FunctionSummaries
+
+
+class TestPathGenerationBestFirst:
+    """Test suite for the best-first search guided by code locality"""
+    
+    @pytest.fixture
+    def graph(self):
+        """Two equally long branches from n_1 to n_9; the first one leaves the sink's file"""
+        return make_graph(
+            {
+                "n_1": ["n_50", "n_7"],
+                "n_50": ["n_51"],
+                "n_51": ["n_9"],
+                "n_7": ["n_8"],
+                "n_8": ["n_9"]
+            },
+            files={"n_50": "b.c", "n_51": "b.c"}
+        )
+    
+    def create_search(self, graph, source_line, sink_line, strategy=BestFirstSearch, **kwargs):
+        """Create a search between two lines"""
+        return strategy(
+            source={"line_number": source_line},
+            sink={"line_number": sink_line},
+            sanitizers=[],
+            graph=graph,
+            path_analysis_queue=None,
+            **kwargs
+        )
+    
+    def test_local_path_first(self, graph):
+        """Test that the branch staying in the sink's file is reported before the one leaving it"""
+        dfs = list(self.create_search(graph, 1, 9, DepthFirstSearch).iter_paths())
+        assert dfs[0] == ["n_1", "n_50", "n_51", "n_9"]
+        
+        paths = list(self.create_search(graph, 1, 9).iter_paths())
+        assert paths[0] == ["n_1", "n_7", "n_8", "n_9"]
+    
+    def test_same_paths_as_dfs(self):
+        """Test that the search finds every simple path DFS finds, cycles included"""
+        edges = {"n_1": ["n_2", "n_3"], "n_2": ["n_4"], "n_3": ["n_4", "n_1"], "n_4": ["n_9", "n_2"]}
+        graph = make_graph(edges, files={"n_3": "b.c"})
+        
+        dfs = list(self.create_search(graph, 1, 9, DepthFirstSearch).iter_paths())
+        paths = list(self.create_search(graph, 1, 9).iter_paths())
+        assert sorted(paths) == sorted(dfs)
+        assert len(paths) == len(dfs)
+    
+    def test_max_paths_keeps_local_witness(self, graph):
+        """Test that with a single path allowed, the local witness is the one kept"""
+        search = self.create_search(graph, 1, 9, max_paths=1)
+        assert list(search.iter_paths()) == [["n_1", "n_7", "n_8", "n_9"]]
+    
+    def test_call_distance(self):
+        """Test that the branch fewer function boundaries away from the sink's function is followed first"""
+        graph = make_graph(
+            {
+                "n_1": ["n_20", "n_30"],
+                "n_20": ["n_25"],
+                "n_25": ["n_9"],
+                "n_30": ["n_31"],
+                "n_31": ["n_9"]
+            },
+            functions={
+                "main": ["n_1"],
+                "log": ["n_20"],
+                "format": ["n_25"],
+                "helper": ["n_30", "n_31"],
+                "sink": ["n_9"]
+            }
+        )
+        summaries = FunctionSummaries(graph)
+        assert summaries.distances_to("sink") == {"sink": 0, "format": 1, "helper": 1, "log": 2, "main": 2}
+        
+        dfs = list(self.create_search(graph, 1, 9, DepthFirstSearch).iter_paths())
+        assert dfs[0] == ["n_1", "n_20", "n_25", "n_9"]
+        
+        search = self.create_search(graph, 1, 9, functions=summaries)
+        paths = list(search.iter_paths())
+        assert paths[0] == ["n_1", "n_30", "n_31", "n_9"]
+        assert len(paths) == 2
+    
+    @pytest.mark.asyncio
+    async def test_find_paths_queues_strategy(self, graph):
+        """Test that found paths are queued with the strategy name"""
+        queue = asyncio.Queue()
+        search = BestFirstSearch(
+            source={"line_number": 1},
+            sink={"line_number": 9},
+            sanitizers=[{"line_number": 50}],
+            graph=graph,
+            path_analysis_queue=queue
+        )
+        
+        await search.find_paths()
+        
+        first = queue.get_nowait()
+        second = queue.get_nowait()
+        assert first["strategy"] == "BEST"
+        assert first["sanitizers_crossed"] == []
+        assert second["sanitizers_crossed"] == ["n_50"]
+        assert queue.empty()
+
+
+if __name__ == "__main__":
+    # Ensure parent directory (project root) is on sys.path for imports like `from Detectors ...`
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    
+    # Run just this test module when executed directly
+    raise SystemExit(pytest.main([os.path.abspath(__file__)]))
@@ -0,0 +1,153 @@
+import pytest
+import sys
+import os
+import asyncio
+
+
+# Ensure parent directory is on sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Here you can do imports for local files
+from Tests.helpers import make_graph
+from Paths.BidirectionalSearch import BidirectionalSearch
+from Paths.ChopSearch import ChopSearch
+from Paths.SanitizerDominance import SanitizerDominance
+from Paths.PredecessorIndex import PredecessorIndex
+
+
+class TestPathGenerationBidirectional:
+    """Test suite for path generation, bidirectional search"""
+    
+    @pytest.fixture
+    def async_queue(self):
+        """Create an async queue for path analysis"""
+        return asyncio.Queue()
+    
+    def create_search(self, graph, queue, source_line, sink_line, **kwargs):
+        """Create a bidirectional search between two lines"""
+        return BidirectionalSearch(
+            source={"line_number": source_line},
+            sink={"line_number": sink_line},
+            sanitizers=[{"line_number": 3}],
+            graph=graph,
+            path_analysis_queue=queue,
+            **kwargs
+        )
+    
+    @pytest.mark.asyncio
+    async def test_finds_shortest_witness(self, async_queue):
+        """Test that the witness is a shortest path rebuilt through the meeting node"""
+        graph = make_graph({
+            "n_1": ["n_2", "n_5"],
+            "n_2": ["n_3"],
+            "n_3": ["n_4"],
+            "n_4": ["n_9"],
+            "n_5": ["n_6"],
+            "n_6": ["n_7"],
+            "n_7": ["n_8"],
+            "n_8": ["n_9"]
+        })
+        search = self.create_search(graph, async_queue, 1, 9)
+        
+        await search.find_paths()
+        
+        assert async_queue.qsize() == 1
+        path_info = await async_queue.get()
+        assert path_info["path"] == ["n_1", "n_2", "n_3", "n_4", "n_9"]
+        assert path_info["goes_through_sanitizer"] is True
+        assert path_info["sanitizers_crossed"] == ["n_3"]
+    
+    @pytest.mark.asyncio
+    async def test_backward_expansion_uses_predecessors(self, async_queue):
+        """Test a graph whose sink has a wide fan-in so the backward side is exercised"""
+        edges = {"n_1": ["n_2"], "n_2": ["n_4"], "n_4": ["n_100"]}
+        for i in range(10, 30):
+            edges[f"n_{i}"] = ["n_100"]
+        graph = make_graph(edges)
+        search = self.create_search(graph, async_queue, 1, 100)
+        
+        await search.find_paths()
+        
+        path_info = await async_queue.get()
+        assert path_info["path"] == ["n_1", "n_2", "n_4", "n_100"]
+    
+    @pytest.mark.asyncio
+    async def test_no_path_exists(self, async_queue):
+        """Test that disconnected source and sink produce no witness"""
+        graph = make_graph({"n_1": ["n_2"], "n_3": ["n_4"]})
+        search = self.create_search(graph, async_queue, 1, 4)
+        
+        await search.find_paths()
+        
+        assert async_queue.qsize() == 0
+        assert search.truncated is False
+    
+    @pytest.mark.asyncio
+    async def test_cycles_terminate(self, async_queue):
+        """Test that cycles on both sides do not stop the frontiers meeting"""
+        graph = make_graph({
+            "n_1": ["n_2"],
+            "n_2": ["n_1", "n_3"],
+            "n_3": ["n_2", "n_4"],
+            "n_4": ["n_3"]
+        })
+        search = self.create_search(graph, async_queue, 1, 4)
+        
+        await search.find_paths()
+        
+        path_info = await async_queue.get()
+        assert path_info["path"] == ["n_1", "n_2", "n_3", "n_4"]
+    
+    @pytest.mark.asyncio
+    async def test_max_depth_limit(self, async_queue):
+        """Test that witnesses longer than max_depth edges are not reported"""
+        graph = make_graph({"n_1": ["n_2"], "n_2": ["n_3"], "n_3": ["n_4"]})
+        search = self.create_search(graph, async_queue, 1, 4, max_depth=2)
+        
+        await search.find_paths()
+        
+        assert async_queue.qsize() == 0
+        assert search.truncated is True
+    
+    def test_predecessor_index_shared(self, async_queue):
+        """Test that searches walking backwards share one index of the graph, built in checkpointed steps"""
+        edges = {"n_1": ["n_2"], "n_2": ["n_9"]}
+        for i in range(100, 400):
+            edges[f"n_{i}"] = [f"n_{i + 1}"]
+        graph = make_graph(edges)
+        index = PredecessorIndex(graph)
+        
+        # The first search is abandoned at its first checkpoint, part way through the index
+        first = self.create_search(graph, async_queue, 1, 9, predecessors=index, expansion_budget=50)
+        assert next(first.iter_paths(checkpoints=True)) is None
+        assert 0 < index.indexed < len(graph.nodes)
+        
+        for strategy in (BidirectionalSearch, ChopSearch, SanitizerDominance):
+            search = strategy(
+                source={"line_number": 1},
+                sink={"line_number": 9},
+                sanitizers=[],
+                graph=graph,
+                path_analysis_queue=async_queue,
+                predecessors=index
+            )
+            assert list(search.iter_paths()) == [["n_1", "n_2", "n_9"]]
+        
+        # Every node was indexed once, the nodes no search reaches were only ever touched by the index
+        assert index.ready is True
+        assert index.indexed == len(graph.nodes)
+        assert graph.calls.count("n_250") == 1
+
+
+if __name__ == "__main__":
+    # Ensure parent directory (project root) is on sys.path for imports like `from Detectors ...`
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    
+    # Run just this test module when executed directly
+    raise SystemExit(pytest.main([os.path.abspath(__file__)]))
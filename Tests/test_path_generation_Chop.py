@@ -0,0 +1,122 @@
+import pytest
+import sys
+import os
+import asyncio
+
+
+# Ensure parent directory is on sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Here you can do imports for local files
+from Tests.helpers import make_graph
+from Paths.ChopSearch import ChopSearch
+from Paths.PathStore import PathStore, path_fingerprint
+
+
+class TestPathGenerationChop:
+    """Test suite for the source/sink chop subgraph"""
+    
+    @pytest.fixture
+    def graph(self):
+        """Diamond from n_1 to n_9 with a dead end branch and an unrelated predecessor of the sink"""
+        return make_graph({
+            "n_1": ["n_2", "n_3", "n_7"],
+            "n_2": ["n_4"],
+            "n_3": ["n_4"],
+            "n_4": ["n_9"],
+            "n_7": ["n_8"],
+            "n_6": ["n_9"]
+        })
+    
+    def create_search(self, graph, queue, **kwargs):
+        """Create a chop search from line 1 to line 9 with a sanitizer on line 3"""
+        return ChopSearch(
+            source={"line_number": 1},
+            sink={"line_number": 9},
+            sanitizers=[{"line_number": 3}],
+            graph=graph,
+            path_analysis_queue=queue,
+            **kwargs
+        )
+    
+    @pytest.mark.asyncio
+    async def test_chop_record(self, graph):
+        """Test that one record holds exactly the nodes and edges between source and sink"""
+        queue = asyncio.Queue()
+        search = self.create_search(graph, queue)
+        
+        await search.find_paths()
+        
+        assert queue.qsize() == 1
+        record = await queue.get()
+        assert record["kind"] == "chop"
+        assert record["path"] == ["n_1", "n_2", "n_4", "n_9"]
+        
+        chop = record["chop"]
+        assert set(chop["nodes"]) == {"n_1", "n_2", "n_3", "n_4", "n_9"}
+        assert set(chop["edges"]) == {
+            ("n_1", "n_2"), ("n_1", "n_3"), ("n_2", "n_4"), ("n_3", "n_4"), ("n_4", "n_9")
+        }
+        assert chop["sanitizers"] == ["n_3"]
+    
+    def test_max_depth_trims_chop(self):
+        """Test that nodes only on paths longer than max_depth are left out"""
+        graph = make_graph({
+            "n_1": ["n_2", "n_9"],
+            "n_2": ["n_3"],
+            "n_3": ["n_9"]
+        })
+        search = self.create_search(graph, None, max_depth=2)
+        
+        paths = list(search.iter_paths())
+        
+        assert paths == [["n_1", "n_9"]]
+        assert search.chop["nodes"] == ["n_1", "n_9"]
+        assert search.truncated is True
+    
+    def test_unreachable_sink(self):
+        """Test that no record is produced when the sink cannot be reached"""
+        graph = make_graph({"n_1": ["n_2"], "n_6": ["n_9"]})
+        search = self.create_search(graph, None)
+        
+        assert list(search.iter_paths()) == []
+        assert search.chop is None
+    
+    @pytest.mark.asyncio
+    async def test_store_keeps_chop_apart_from_paths(self, graph):
+        """Test that a chop record is not dropped as a duplicate of its witness and gets sanitizer updates"""
+        queue = asyncio.Queue()
+        store = PathStore(queue)
+        search = self.create_search(graph, store)
+        search.sanitizer_nodes = set()
+        
+        witness = {"source": search.source, "sink": search.sink, "path": ["n_1", "n_2", "n_4", "n_9"]}
+        assert await store.put(witness) is True
+        await search.find_paths()
+        assert queue.qsize() == 2
+        
+        plain = await queue.get()
+        record = await queue.get()
+        assert record["fingerprint"] != plain["fingerprint"] == path_fingerprint(witness)
+        
+        # A sanitizer inside the chop but off the witness still updates the chop record
+        assert await store.add_sanitizer("n_3") == 1
+        update = await queue.get()
+        assert update["kind"] == "chop"
+        assert update["chop"]["sanitizers"] == ["n_3"]
+        assert update["goes_through_sanitizer"] is False
+        assert search.chop["sanitizers"] == []
+
+
+if __name__ == "__main__":
+    # Ensure parent directory (project root) is on sys.path for imports like `from Detectors ...`
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    
+    # Run just this test module when executed directly
+    raise SystemExit(pytest.main([os.path.abspath(__file__)]))
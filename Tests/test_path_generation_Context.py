@@ -0,0 +1,137 @@
+import pytest
+import sys
+import os
+import asyncio
+
+
+# Ensure parent directory is on sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Here you can do imports for local files
+from Tests.helpers import make_graph
+from Paths.ContextSensitiveSearch import ContextSensitiveSearch, CALL, RETURN
+from Paths.DepthFirstSearch import DepthFirstSearch
+
+
+class TestPathGenerationContext:
+    """Test suite for the context-sensitive (call/return matching) search"""
+    
+    @pytest.fixture
+    def graph(self):
+        """A helper (n_10, n_11) called from n_1 and n_4; only the call from n_4 continues to the sink"""
+        return make_graph(
+            {
+                "n_1": ["n_10"],
+                "n_4": ["n_10"],
+                "n_10": ["n_11"],
+                "n_11": ["n_2", "n_5"],
+                "n_5": ["n_9"]
+            },
+            labels={
+                ("n_1", "n_10"): (CALL, "n_1"),
+                ("n_4", "n_10"): (CALL, "n_4"),
+                ("n_11", "n_2"): (RETURN, "n_1"),
+                ("n_11", "n_5"): (RETURN, "n_4")
+            }
+        )
+    
+    def create_search(self, graph, source_line, sink_line, strategy=ContextSensitiveSearch, **kwargs):
+        """Create a search between two lines"""
+        return strategy(
+            source={"line_number": source_line},
+            sink={"line_number": sink_line},
+            sanitizers=[],
+            graph=graph,
+            path_analysis_queue=None,
+            **kwargs
+        )
+    
+    def test_return_to_other_caller_pruned(self, graph):
+        """Test that a path returning to a different caller than the one that called is not followed"""
+        dfs = self.create_search(graph, 1, 9, DepthFirstSearch)
+        assert list(dfs.iter_paths()) == [["n_1", "n_10", "n_11", "n_5", "n_9"]]
+        
+        search = self.create_search(graph, 1, 9)
+        assert list(search.iter_paths()) == []
+        assert search.mismatched_returns == 1
+    
+    def test_matching_return_followed(self, graph):
+        """Test that a return to the calling site is followed"""
+        search = self.create_search(graph, 4, 9)
+        assert list(search.iter_paths()) == [["n_4", "n_10", "n_11", "n_5", "n_9"]]
+    
+    def test_unbalanced_return_followed(self, graph):
+        """Test that a source inside a function may return to any of its callers"""
+        search = self.create_search(graph, 10, 9)
+        assert list(search.iter_paths()) == [["n_10", "n_11", "n_5", "n_9"]]
+    
+    def test_call_depth_bound(self):
+        """Test that calls deeper than the bound forget the oldest site instead of pruning feasible paths"""
+        graph = make_graph(
+            {
+                "n_1": ["n_20"],
+                "n_20": ["n_10"],
+                "n_10": ["n_21"],
+                "n_21": ["n_2", "n_3"],
+                "n_2": ["n_9"],
+                "n_3": ["n_9"]
+            },
+            labels={
+                ("n_1", "n_20"): (CALL, "n_1"),
+                ("n_20", "n_10"): (CALL, "n_20"),
+                ("n_10", "n_21"): (RETURN, "n_20"),
+                ("n_21", "n_2"): (RETURN, "n_1"),
+                ("n_21", "n_3"): (RETURN, "n_7")
+            }
+        )
+        
+        precise = self.create_search(graph, 1, 9, call_depth=2)
+        assert list(precise.iter_paths()) == [["n_1", "n_20", "n_10", "n_21", "n_2", "n_9"]]
+        
+        # With one site kept the outer call is forgotten, so both returns out of n_21 are followed
+        bounded = self.create_search(graph, 1, 9, call_depth=1)
+        assert len(list(bounded.iter_paths())) == 2
+        
+        with pytest.raises(ValueError):
+            self.create_search(graph, 1, 9, call_depth=-1)
+    
+    def test_unlabeled_graph_matches_dfs(self):
+        """Test that without edge labels the search finds the same paths as DFS"""
+        edges = {"n_1": ["n_2", "n_3"], "n_2": ["n_4"], "n_3": ["n_4", "n_1"], "n_4": ["n_9"]}
+        graph = make_graph(edges)
+        
+        dfs = list(self.create_search(graph, 1, 9, DepthFirstSearch).iter_paths())
+        assert list(self.create_search(graph, 1, 9).iter_paths()) == dfs
+    
+    @pytest.mark.asyncio
+    async def test_find_paths_queues_strategy(self, graph):
+        """Test that found paths are queued with the strategy name"""
+        queue = asyncio.Queue()
+        search = ContextSensitiveSearch(
+            source={"line_number": 4},
+            sink={"line_number": 9},
+            sanitizers=[{"line_number": 5}],
+            graph=graph,
+            path_analysis_queue=queue
+        )
+        
+        await search.find_paths()
+        
+        path_info = queue.get_nowait()
+        assert path_info["strategy"] == "CONTEXT"
+        assert path_info["sanitizers_crossed"] == ["n_5"]
+        assert queue.empty()
+
+
+if __name__ == "__main__":
+    # Ensure parent directory (project root) is on sys.path for imports like `from Detectors ...`
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    
+    # Run just this test module when executed directly
+    raise SystemExit(pytest.main([os.path.abspath(__file__)]))
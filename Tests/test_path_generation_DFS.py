@@ -350,6 +350,332 @@ class TestPathGenerationDFS:
         assert len(path_info["sanitizers_crossed"]) == 2
         assert set(path_info["sanitizers_crossed"]) == {"sanitizer_2000", "sanitizer_3000"}
 
+    
+    @pytest.mark.asyncio
+    async def test_deep_graph_beyond_recursion_limit(self, async_queue):
+        """Test that long chains do not hit the interpreter recursion limit"""
+        depth = sys.getrecursionlimit() * 2
+        
+        graph = MagicMock()
+        graph.nodes = {f"node_{i}": {"line": i} for i in range(depth)}
+        graph.edges = {f"node_{i}": [f"node_{i + 1}"] for i in range(depth - 1)}
+        graph.get_neighbors = lambda node: graph.edges.get(node, [])
+        
+        dfs = DepthFirstSearch(
+            source={"line_number": 0},
+            sink={"line_number": depth - 1},
+            sanitizers=[{"line_number": depth // 2}],
+            graph=graph,
+            path_analysis_queue=async_queue
+        )
+        
+        await dfs.find_paths()
+        
+        assert async_queue.qsize() == 1
+        path_info = await async_queue.get()
+        assert len(path_info["path"]) == depth
+        assert path_info["path"][0] == "node_0"
+        assert path_info["path"][-1] == f"node_{depth - 1}"
+        assert path_info["sanitizers_crossed"] == [f"node_{depth // 2}"]
+
+    
+    @pytest.mark.asyncio
+    async def test_max_depth_limit(self, complex_graph, async_queue):
+        """Test that paths longer than max_depth edges are not explored"""
+        dfs = DepthFirstSearch(
+            source={"line_number": 100},
+            sink={"line_number": 700},
+            sanitizers=[],
+            graph=complex_graph,
+            path_analysis_queue=async_queue,
+            max_depth=3
+        )
+        
+        await dfs.find_paths()
+        
+        paths = []
+        while not async_queue.empty():
+            paths.append((await async_queue.get())["path"])
+        
+        assert sorted(paths) == [
+            ["source_100", "node_200", "node_600", "sink_700"],
+            ["source_100", "node_200", "sanitizer_400", "sink_700"]
+        ]
+        assert dfs.truncated is True
+    
+    @pytest.mark.asyncio
+    async def test_max_paths_limit(self, complex_graph, async_queue):
+        """Test that the search stops once max_paths paths have been queued"""
+        dfs = DepthFirstSearch(
+            source={"line_number": 100},
+            sink={"line_number": 700},
+            sanitizers=[],
+            graph=complex_graph,
+            path_analysis_queue=async_queue,
+            max_paths=1
+        )
+        
+        await dfs.find_paths()
+        
+        assert async_queue.qsize() == 1
+        assert dfs.paths_found == 1
+        assert dfs.truncated is True
+    
+    @pytest.mark.asyncio
+    async def test_time_budget_exhausted(self, complex_graph, async_queue):
+        """Test that an exhausted wall-clock budget stops the search"""
+        dfs = DepthFirstSearch(
+            source={"line_number": 100},
+            sink={"line_number": 700},
+            sanitizers=[],
+            graph=complex_graph,
+            path_analysis_queue=async_queue,
+            time_budget=0
+        )
+        
+        await dfs.find_paths()
+        
+        assert async_queue.qsize() == 0
+        assert dfs.truncated is True
+    
+    @pytest.mark.asyncio
+    async def test_paths_streamed_while_searching(self, complex_graph):
+        """Test that each path reaches the queue before the search moves on"""
+        queue_sizes = []
+        queue = asyncio.Queue()
+        neighbors = complex_graph.get_neighbors
+        
+        def recording_neighbors(node):
+            queue_sizes.append(queue.qsize())
+            return neighbors(node)
+        
+        complex_graph.get_neighbors = recording_neighbors
+        
+        dfs = DepthFirstSearch(
+            source={"line_number": 100},
+            sink={"line_number": 700},
+            sanitizers=[],
+            graph=complex_graph,
+            path_analysis_queue=queue
+        )
+        
+        await dfs.find_paths()
+        
+        # Later expansions already see paths found earlier in the queue
+        assert queue.qsize() == 3
+        assert queue_sizes[0] == 0
+        assert max(queue_sizes) > 0
+    
+    @pytest.mark.asyncio
+    async def test_k_shortest_paths_in_order(self, complex_graph, async_queue):
+        """Test that k-shortest mode emits the shortest paths first"""
+        dfs = DepthFirstSearch(
+            source={"line_number": 100},
+            sink={"line_number": 700},
+            sanitizers=[{"line_number": 400}, {"line_number": 500}],
+            graph=complex_graph,
+            path_analysis_queue=async_queue,
+            k_shortest=2
+        )
+        
+        await dfs.find_paths()
+        
+        paths = []
+        while not async_queue.empty():
+            paths.append((await async_queue.get())["path"])
+        
+        assert len(paths) == 2
+        assert [len(p) for p in paths] == [4, 4]
+        assert set(map(tuple, paths)) == {
+            ("source_100", "node_200", "sanitizer_400", "sink_700"),
+            ("source_100", "node_200", "node_600", "sink_700")
+        }
+    
+    @pytest.mark.asyncio
+    async def test_k_shortest_paths_exhausts_graph(self, complex_graph, async_queue):
+        """Test that asking for more paths than exist returns every simple path by length"""
+        dfs = DepthFirstSearch(
+            source={"line_number": 100},
+            sink={"line_number": 700},
+            sanitizers=[],
+            graph=complex_graph,
+            path_analysis_queue=async_queue,
+            k_shortest=10
+        )
+        
+        await dfs.find_paths()
+        
+        paths = []
+        while not async_queue.empty():
+            paths.append((await async_queue.get())["path"])
+        
+        assert len(paths) == 3
+        assert paths[-1] == ["source_100", "node_300", "sanitizer_500", "node_600", "sink_700"]
+
+    
+    @pytest.mark.asyncio
+    async def test_unsanitized_only_prunes_sanitizers(self, complex_graph, async_queue):
+        """Test that sanitizers are barriers: only unsanitized paths are found and nothing past a sanitizer is expanded"""
+        expanded = []
+        get_neighbors = complex_graph.get_neighbors
+        
+        def recording_neighbors(node):
+            expanded.append(node)
+            return get_neighbors(node)
+        
+        complex_graph.get_neighbors = recording_neighbors
+        
+        dfs = DepthFirstSearch(
+            source={"line_number": 100},
+            sink={"line_number": 700},
+            sanitizers=[{"line_number": 400}, {"line_number": 500}],
+            graph=complex_graph,
+            path_analysis_queue=async_queue,
+            unsanitized_only=True
+        )
+        
+        await dfs.find_paths()
+        
+        assert async_queue.qsize() == 1
+        path_info = await async_queue.get()
+        assert path_info["path"] == ["source_100", "node_200", "node_600", "sink_700"]
+        assert path_info["goes_through_sanitizer"] is False
+        assert "sanitizer_400" not in expanded and "sanitizer_500" not in expanded
+        assert dfs._search_options()["unsanitized_only"] is True
+    
+    @pytest.mark.asyncio
+    async def test_unsanitized_only_k_shortest(self, complex_graph, async_queue):
+        """Test that k-shortest mode also avoids sanitizers, including when the source is one"""
+        dfs = DepthFirstSearch(
+            source={"line_number": 100},
+            sink={"line_number": 700},
+            sanitizers=[{"line_number": 400}],
+            graph=complex_graph,
+            path_analysis_queue=async_queue,
+            k_shortest=10,
+            unsanitized_only=True
+        )
+        
+        await dfs.find_paths()
+        
+        paths = []
+        while not async_queue.empty():
+            paths.append((await async_queue.get())["path"])
+        assert paths == [
+            ["source_100", "node_200", "node_600", "sink_700"],
+            ["source_100", "node_300", "sanitizer_500", "node_600", "sink_700"]
+        ]
+        
+        blocked = DepthFirstSearch(
+            source={"line_number": 100},
+            sink={"line_number": 700},
+            sanitizers=[{"line_number": 100}],
+            graph=complex_graph,
+            path_analysis_queue=async_queue,
+            unsanitized_only=True
+        )
+        assert list(blocked.iter_paths()) == []
+    
+    @pytest.mark.asyncio
+    async def test_search_yields_to_event_loop(self, async_queue):
+        """Test that a long search hands control back to the event loop every expansion_budget expansions"""
+        graph = MagicMock()
+        graph.nodes = {f"node_{i}": {"line": i} for i in range(200)}
+        graph.get_neighbors = lambda node: [f"node_{int(node.split('_')[1]) + 1}"] if node != "node_199" else []
+        
+        dfs = DepthFirstSearch(
+            source={"line_number": 0},
+            sink={"line_number": 199},
+            sanitizers=[],
+            graph=graph,
+            path_analysis_queue=async_queue,
+            expansion_budget=10
+        )
+        
+        progress = []
+        
+        async def heartbeat():
+            while True:
+                progress.append(dfs.expansions)
+                await asyncio.sleep(0)
+        
+        heartbeat_task = asyncio.create_task(heartbeat())
+        await asyncio.sleep(0)
+        await dfs.find_paths()
+        heartbeat_task.cancel()
+        
+        assert async_queue.qsize() == 1
+        assert dfs.checkpoints == dfs.expansions // 10
+        # The heartbeat ran while the search was part way through
+        assert any(0 < seen < dfs.expansions for seen in progress)
+    
+    def test_shortest_path_checkpoints(self, async_queue):
+        """Test that the breadth first witness search used by several strategies yields checkpoints as it expands"""
+        graph = MagicMock()
+        graph.nodes = {f"node_{i}": {"line": i} for i in range(200)}
+        graph.get_neighbors = lambda node: [f"node_{int(node.split('_')[1]) + 1}"] if node != "node_199" else []
+        
+        dfs = DepthFirstSearch(
+            source={"line_number": 0},
+            sink={"line_number": 199},
+            sanitizers=[],
+            graph=graph,
+            path_analysis_queue=async_queue,
+            expansion_budget=10
+        )
+        
+        search = dfs._shortest_path("node_0", "node_199", set(), set())
+        checkpoints = 0
+        try:
+            while True:
+                assert next(search) is None
+                checkpoints += 1
+        except StopIteration as done:
+            path = done.value
+        
+        assert len(path) == 200
+        assert checkpoints == dfs.checkpoints == 19
+    
+    def test_edge_kinds_restrict_traversal(self, complex_graph):
+        """Test that only edges of the selected kinds (and untyped edges) are followed, on the graph and on its snapshot"""
+        from Graphs.Snapshot import GraphSnapshot
+        from Paths.ReachabilityMemo import ReachabilityMemo
+        
+        kinds = {("sanitizer_400", "sink_700"): "control", ("node_200", "node_600"): None}
+        complex_graph.get_edge_kind = lambda node, neighbor: kinds.get((node, neighbor), "data")
+        
+        for graph in (complex_graph, GraphSnapshot.from_graph(complex_graph)):
+            dfs = DepthFirstSearch(
+                source={"line_number": 100},
+                sink={"line_number": 700},
+                sanitizers=[],
+                graph=graph,
+                path_analysis_queue=None,
+                edge_kinds=["data"],
+                reach_memo=ReachabilityMemo()
+            )
+            
+            assert sorted(dfs.iter_paths()) == [
+                ["source_100", "node_200", "node_600", "sink_700"],
+                ["source_100", "node_300", "sanitizer_500", "node_600", "sink_700"]
+            ]
+            assert dfs.reach_memo is None
+            assert dfs._search_options()["edge_kinds"] == ["data"]
+    
+    def test_time_slice_defaults(self, sample_source, sample_sink, sample_sanitizers, mock_graph, async_queue):
+        """Test that time slicing falls back to the strategy's class settings"""
+        dfs = DepthFirstSearch(
+            source=sample_source,
+            sink=sample_sink,
+            sanitizers=sample_sanitizers,
+            graph=mock_graph,
+            path_analysis_queue=async_queue,
+            slice_time=0.005
+        )
+        
+        assert dfs.expansion_budget == DepthFirstSearch.expansion_budget
+        assert dfs.slice_time == 0.005
+
 
 if __name__ == "__main__":
     # Ensure parent directory (project root) is on sys.path for imports like `from Detectors ...`
@@ -0,0 +1,207 @@
+import pytest
+import sys
+import os
+import asyncio
+
+
+# Ensure parent directory is on sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Here you can do imports for local files
+from Tests.helpers import make_graph
+from Paths.SanitizerDominance import SanitizerDominance
+from Paths.DepthFirstSearch import DepthFirstSearch
+from Paths.PathStore import PathStore
+
+
+class TestPathGenerationDominance:
+    """Test suite for the dominator based sanitized/unsanitized verdict"""
+    
+    @pytest.fixture
+    def async_queue(self):
+        """Create an async queue for path analysis"""
+        return asyncio.Queue()
+    
+    def create_search(self, graph, queue, source_line, sink_line, sanitizer_lines, strategy=SanitizerDominance, **kwargs):
+        """Create a dominance analysis (or another search) between two lines"""
+        return strategy(
+            source={"line_number": source_line},
+            sink={"line_number": sink_line},
+            sanitizers=[{"line_number": line} for line in sanitizer_lines],
+            graph=graph,
+            path_analysis_queue=queue,
+            **kwargs
+        )
+    
+    @pytest.mark.asyncio
+    async def test_dominating_sanitizer(self, async_queue):
+        """Test a diamond whose only way to the sink goes through a sanitizer"""
+        graph = make_graph({
+            "n_1": ["n_2", "n_3"],
+            "n_2": ["n_4"],
+            "n_3": ["n_4"],
+            "n_4": ["n_5"],
+            "n_5": ["n_9"],
+            "n_6": ["n_9"]
+        })
+        search = self.create_search(graph, async_queue, 1, 9, [4, 6])
+        
+        await search.find_paths()
+        
+        assert async_queue.qsize() == 1
+        path_info = await async_queue.get()
+        assert path_info["verdict"] == "sanitized"
+        assert path_info["sanitizer_cut"] == ["n_4"]
+        assert path_info["dominating_sanitizers"] == ["n_4"]
+        assert path_info["goes_through_sanitizer"] is True
+        assert path_info["path"][0] == "n_1" and path_info["path"][-1] == "n_9"
+    
+    @pytest.mark.asyncio
+    async def test_cut_without_single_dominator(self, async_queue):
+        """Test parallel sanitizers: every path is sanitized but no single sanitizer is on all of them"""
+        graph = make_graph({
+            "n_1": ["n_2", "n_3"],
+            "n_2": ["n_4"],
+            "n_3": ["n_4"],
+            "n_4": ["n_9"]
+        })
+        search = self.create_search(graph, async_queue, 1, 9, [2, 3])
+        
+        await search.find_paths()
+        
+        path_info = await async_queue.get()
+        assert path_info["verdict"] == "sanitized"
+        assert sorted(path_info["sanitizer_cut"]) == ["n_2", "n_3"]
+        assert path_info["dominating_sanitizers"] == []
+    
+    @pytest.mark.asyncio
+    async def test_unsanitized_witness(self, async_queue):
+        """Test that a path avoiding every sanitizer is returned as the witness"""
+        graph = make_graph({
+            "n_1": ["n_2", "n_3"],
+            "n_2": ["n_9"],
+            "n_3": ["n_7"],
+            "n_7": ["n_9"]
+        })
+        search = self.create_search(graph, async_queue, 1, 9, [2])
+        
+        await search.find_paths()
+        
+        path_info = await async_queue.get()
+        assert path_info["verdict"] == "unsanitized"
+        assert path_info["path"] == ["n_1", "n_3", "n_7", "n_9"]
+        assert path_info["goes_through_sanitizer"] is False
+        assert path_info["sanitizer_cut"] == []
+    
+    @pytest.mark.asyncio
+    async def test_unreachable_sink(self, async_queue):
+        """Test that nothing is queued when the sink cannot be reached"""
+        graph = make_graph({"n_1": ["n_2"], "n_3": ["n_9"]})
+        search = self.create_search(graph, async_queue, 1, 9, [2])
+        
+        await search.find_paths()
+        
+        assert async_queue.empty()
+        assert search.verdict is None
+    
+    @pytest.mark.asyncio
+    async def test_verdict_not_duplicate_of_witness(self, async_queue):
+        """Test that the verdict is kept next to the identical path found by DFS"""
+        graph = make_graph({"n_1": ["n_2"], "n_2": ["n_9"]})
+        store = PathStore(async_queue)
+        
+        await self.create_search(graph, store, 1, 9, [], strategy=DepthFirstSearch).find_paths()
+        await self.create_search(graph, store, 1, 9, []).find_paths()
+        
+        assert async_queue.qsize() == 2
+        first, second = async_queue.get_nowait(), async_queue.get_nowait()
+        assert first["path"] == second["path"]
+        assert "kind" not in first
+        assert second["kind"] == "verdict"
+        assert second["verdict"] == "unsanitized"
+    
+    @pytest.mark.asyncio
+    async def test_late_sanitizer_rechecks_verdict(self):
+        """Test that the orchestrator checks a pair again once a late sanitizer lands on its verdict's witness"""
+        from Paths.Orchestrator import Orchestrator
+        
+        graph = make_graph({"n_1": ["n_2"], "n_2": ["n_9"]})
+        paths = asyncio.Queue()
+        sanitizer_queue = asyncio.Queue()
+        orchestrator = Orchestrator(asyncio.Queue(), asyncio.Queue(), sanitizer_queue, graph, paths,
+                                    strategies=[DepthFirstSearch, SanitizerDominance])
+        await orchestrator._create_search_task({"line_number": 1}, {"line_number": 9})
+        
+        orchestrator.started_at = 0.0
+        orchestrator.scheduler.start()
+        monitor = asyncio.create_task(orchestrator._monitor_sanitizers())
+        await sanitizer_queue.put({"line_number": 2})
+        await asyncio.sleep(0.1)
+        await orchestrator.scheduler.join()
+        monitor.cancel()
+        await orchestrator.scheduler.stop()
+        
+        verdicts = [r["verdict"] for r in (paths.get_nowait() for _ in range(paths.qsize())) if r.get("kind") == "verdict"]
+        assert verdicts == ["unsanitized", "stale", "sanitized"]
+    
+    @pytest.mark.asyncio
+    async def test_recheck_replaces_verdict_with_new_witness(self):
+        """Test that rechecks keep one verdict record per pair as the witness moves, also in unsanitized only mode"""
+        from Paths.Orchestrator import Orchestrator
+        
+        graph = make_graph({"n_1": ["n_2", "n_3"], "n_2": ["n_9"], "n_3": ["n_9"]})
+        paths = asyncio.Queue()
+        sanitizer_queue = asyncio.Queue()
+        orchestrator = Orchestrator(asyncio.Queue(), asyncio.Queue(), sanitizer_queue, graph, paths,
+                                    strategies=[SanitizerDominance], search_options={"unsanitized_only": True})
+        await orchestrator._create_search_task({"line_number": 1}, {"line_number": 9})
+        
+        orchestrator.started_at = 0.0
+        orchestrator.scheduler.start()
+        monitor = asyncio.create_task(orchestrator._monitor_sanitizers())
+        for line in (2, 3):
+            await sanitizer_queue.put({"line_number": line})
+            await asyncio.sleep(0.1)
+            await orchestrator.scheduler.join()
+        monitor.cancel()
+        await orchestrator.scheduler.stop()
+        
+        records = [paths.get_nowait() for _ in range(paths.qsize())]
+        assert [r["verdict"] for r in records] == ["unsanitized", "stale", "unsanitized", "stale", "sanitized"]
+        assert records[0]["path"] == ["n_1", "n_2", "n_9"]
+        assert records[2]["path"] == ["n_1", "n_3", "n_9"]
+        assert len({r["fingerprint"] for r in records}) == 1
+        assert orchestrator.path_store.stale_records == set()
+        assert orchestrator.verdict_rechecks == {}
+    
+    def test_scales_where_enumeration_cannot(self):
+        """Test a ladder with 2^40 paths, all through the last sanitizer, answered without enumeration"""
+        edges = {}
+        for i in range(40):
+            a, b, nxt = 100 + 2 * i, 101 + 2 * i, 100 + 2 * (i + 1)
+            edges[f"n_{a}"] = [f"n_{b}", f"n_{nxt}"]
+            edges[f"n_{b}"] = [f"n_{nxt}"]
+        edges["n_180"] = ["n_999"]
+        graph = make_graph(edges)
+        search = self.create_search(graph, None, 100, 999, [180])
+        
+        paths = list(search.iter_paths())
+        
+        assert len(paths) == 1
+        assert search.verdict["verdict"] == "sanitized"
+        assert search.verdict["dominating_sanitizers"] == ["n_180"]
+        assert search.expansions < 1000
+
+
+if __name__ == "__main__":
+    # Ensure parent directory (project root) is on sys.path for imports like `from Detectors ...`
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    
+    # Run just this test module when executed directly
+    raise SystemExit(pytest.main([os.path.abspath(__file__)]))
@@ -0,0 +1,184 @@
+import pytest
+import sys
+import os
+import asyncio
+from unittest.mock import patch
+
+
+# Ensure parent directory is on sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Here you can do imports for local files
+from Tests.helpers import make_graph
+from Paths.MultiSourceSearch import MultiSourceSearch, SourceReachability
+from Paths.Orchestrator import Orchestrator
+
+
+class TestPathGenerationMultiSource:
+    """Test suite for path generation, batched multi-source search"""
+    
+    @pytest.fixture
+    def graph(self):
+        """Create a graph with two sources feeding three sinks and a neighbor call counter"""
+        return make_graph({
+            "src_1": ["mid_3"],
+            "src_2": ["sink_12"],
+            "mid_3": ["sink_10", "sink_11"]
+        })
+    
+    @pytest.fixture
+    def async_queue(self):
+        """Create an async queue for path analysis"""
+        return asyncio.Queue()
+    
+    def test_reachability_table(self, graph):
+        """Test that one traversal answers every sink for a source"""
+        table = SourceReachability(graph)
+        
+        assert table.reaches("src_1", "sink_10")
+        assert table.reaches("src_1", "sink_11")
+        assert not table.reaches("src_1", "sink_12")
+        assert table.witness("src_1", "sink_11") == ["src_1", "mid_3", "sink_11"]
+        assert table.witness("src_1", "sink_12") is None
+        assert table.traversals == 1
+    
+    @pytest.mark.asyncio
+    async def test_pairs_share_traversal(self, graph, async_queue):
+        """Test that searches for several sinks of one source reuse one traversal"""
+        table = SourceReachability(graph)
+        
+        for sink_line in (10, 11, 12):
+            search = MultiSourceSearch(
+                source={"line_number": 1},
+                sink={"line_number": sink_line},
+                sanitizers=[{"line_number": 3}],
+                graph=graph,
+                path_analysis_queue=async_queue,
+                reachability=table
+            )
+            await search.find_paths()
+        
+        assert table.traversals == 1
+        assert graph.calls.count("src_1") == 1
+        
+        results = []
+        while not async_queue.empty():
+            results.append(await async_queue.get())
+        
+        assert [r["path"] for r in results] == [
+            ["src_1", "mid_3", "sink_10"],
+            ["src_1", "mid_3", "sink_11"]
+        ]
+        assert all(r["sanitizers_crossed"] == ["mid_3"] for r in results)
+    
+    def test_unsanitized_only_falls_back_past_table(self):
+        """Test that a table witness through a sanitizer is replaced by an unsanitized path if one exists"""
+        graph = make_graph({"src_1": ["mid_3", "mid_4"], "mid_3": ["sink_10"], "mid_4": ["mid_5"], "mid_5": ["sink_10"]})
+        table = SourceReachability(graph)
+        
+        def search(sanitizer_lines):
+            return MultiSourceSearch(
+                source={"line_number": 1},
+                sink={"line_number": 10},
+                sanitizers=[{"line_number": line} for line in sanitizer_lines],
+                graph=graph,
+                path_analysis_queue=None,
+                reachability=table,
+                unsanitized_only=True
+            )
+        
+        assert list(search([3]).iter_paths()) == [["src_1", "mid_4", "mid_5", "sink_10"]]
+        assert list(search([5]).iter_paths()) == [["src_1", "mid_3", "sink_10"]]
+        assert list(search([3, 5]).iter_paths()) == []
+        assert table.traversals == 1
+    
+    @pytest.mark.asyncio
+    async def test_orchestrator_shares_table(self, graph):
+        """Test that the orchestrator hands one table to every multi-source search"""
+        source_queue = asyncio.Queue()
+        sink_queue = asyncio.Queue()
+        path_analysis_queue = asyncio.Queue()
+        
+        orchestrator = Orchestrator(
+            source_queue=source_queue,
+            sink_queue=sink_queue,
+            sanitizer_queue=asyncio.Queue(),
+            graph=graph,
+            path_analysis_queue=path_analysis_queue,
+            strategies=[MultiSourceSearch]
+        )
+        
+        for line in (1, 2):
+            await source_queue.put({"line_number": line, "file": "a.c"})
+        for line in (10, 11, 12):
+            await sink_queue.put({"line_number": line, "file": "a.c"})
+        
+        # Every detection is looked up in the graph once, by the orchestrator, and never by the searches
+        import Paths
+        import Paths.Orchestrator
+        with patch.object(Paths.Orchestrator, "find_node_id", wraps=Paths.find_node_id) as orchestrator_lookups, \
+                patch.object(Paths, "find_node_id", wraps=Paths.find_node_id) as search_lookups:
+            start_task = asyncio.create_task(orchestrator.start())
+            await asyncio.sleep(0.2)
+            orchestrator.stop()
+            await start_task
+        
+        assert len(orchestrator.tested_pairs) == 6
+        assert orchestrator.shared_resources["reachability"].traversals == 2
+        assert path_analysis_queue.qsize() == 3
+        assert orchestrator_lookups.call_count == 5
+        assert search_lookups.call_count == 0
+    
+    @pytest.mark.asyncio
+    async def test_orchestrator_protects_detections_once(self):
+        """Test that sinks inside collapsed chains do not make the shared table traverse a source again per pair"""
+        graph = make_graph({
+            "src_1": ["mid_2"],
+            "mid_2": ["mid_3"],
+            "mid_3": ["mid_4"],
+            "mid_4": ["mid_5"],
+            "mid_5": ["join_6"],
+            "src_9": ["join_6"],
+            "join_6": ["sink_7", "sink_8"]
+        })
+        source_queue = asyncio.Queue()
+        sink_queue = asyncio.Queue()
+        
+        orchestrator = Orchestrator(
+            source_queue=source_queue,
+            sink_queue=sink_queue,
+            sanitizer_queue=asyncio.Queue(),
+            graph=graph,
+            path_analysis_queue=asyncio.Queue(),
+            strategies=[MultiSourceSearch],
+            max_concurrent_searches=1,
+            compact_chains=True
+        )
+        
+        for line in (1, 9):
+            await source_queue.put({"line_number": line, "file": "a.c"})
+        for line in (3, 4, 5, 7):
+            await sink_queue.put({"line_number": line, "file": "a.c"})
+        
+        start_task = asyncio.create_task(orchestrator.start())
+        await asyncio.sleep(0.2)
+        orchestrator.stop()
+        await start_task
+        
+        assert len(orchestrator.tested_pairs) == 8
+        assert orchestrator.graph.splits == []
+        assert orchestrator.shared_resources["reachability"].traversals == 2
+
+
+if __name__ == "__main__":
+    # Ensure parent directory (project root) is on sys.path for imports like `from Detectors ...`
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    
+    # Run just this test module when executed directly
+    raise SystemExit(pytest.main([os.path.abspath(__file__)]))
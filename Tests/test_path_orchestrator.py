@@ -6,6 +6,7 @@ import json
 from unittest.mock import MagicMock, AsyncMock, patch
 import threading
 import time
+import multiprocessing
 
 
 # Ensure parent directory is on sys.path
@@ -17,6 +18,10 @@ if project_root not in sys.path:
 # Here you can do imports for local files
 from Paths.Orchestrator import Orchestrator
 from Paths.DepthFirstSearch import DepthFirstSearch
+from Paths.BreadthFirstSearch import BreadthFirstSearch
+from Paths.StrategyRegistry import StrategyConfig
+from Paths.ProcessPool import ProcessPoolBackend
+from Paths import PathSearch
 
 # source data for path testing
 SOURCES_EXAMPLES = os.path.join(project_root, "Samples", "sources")
@@ -24,6 +29,15 @@ SINK_EXAMPLES = os.path.join(project_root, "Samples", "sinks")
 SANITIZER_EXAMPLES = os.path.join(project_root, "Samples", "sanitizers")
 
 
+class StallingSearch(PathSearch):
+    """Search that never finds anything and never finishes, only yielding checkpoints"""
+    name = "STALL"
+    
+    def _search(self, start, target):
+        while True:
+            yield None
+
+
 class TestPathOrchestrator:
     """Test suite for detector thread functionality"""
     
@@ -317,6 +331,461 @@ class TestPathOrchestrator:
         assert sanitizer_path["goes_through_sanitizer"] is True
         assert "node_3" in sanitizer_path["sanitizers_crossed"]
 
+    
+    @pytest.mark.asyncio
+    async def test_late_sanitizer_updates_paths(self, mock_graph, test_data):
+        """Test that a sanitizer arriving after the search sends updates instead of searching again"""
+        sources, sinks, sanitizers = test_data
+        
+        source_queue = asyncio.Queue()
+        sink_queue = asyncio.Queue()
+        sanitizer_queue = asyncio.Queue()
+        path_analysis_queue = asyncio.Queue()
+        
+        orchestrator = Orchestrator(
+            source_queue=source_queue,
+            sink_queue=sink_queue,
+            sanitizer_queue=sanitizer_queue,
+            graph=mock_graph,
+            path_analysis_queue=path_analysis_queue
+        )
+        
+        await source_queue.put(sources[0])
+        await sink_queue.put(sinks[0])
+        
+        orchestrator_task = asyncio.create_task(orchestrator.start())
+        await asyncio.sleep(0.3)
+        
+        # Both paths were sent before the sanitizer was known
+        results = []
+        while not path_analysis_queue.empty():
+            results.append(await path_analysis_queue.get())
+        assert len(results) == 2
+        assert not any(r["goes_through_sanitizer"] for r in results)
+        
+        with patch.object(orchestrator, '_create_search_task') as mock_search:
+            await sanitizer_queue.put(sanitizers[0])  # line 30 -> node_3
+            await asyncio.sleep(0.3)
+            mock_search.assert_not_called()
+        
+        orchestrator.stop()
+        await orchestrator_task
+        
+        updates = []
+        while not path_analysis_queue.empty():
+            updates.append(await path_analysis_queue.get())
+        
+        assert len(updates) == 1
+        assert updates[0]["update"] is True
+        assert updates[0]["path"] == ["node_1", "node_3", "node_4", "node_5"]
+        assert updates[0]["sanitizers_crossed"] == ["node_3"]
+        assert updates[0]["fingerprint"] in {r["fingerprint"] for r in results}
+    
+    @pytest.mark.asyncio
+    async def test_search_options_forwarded(self, mock_graph, test_data):
+        """Test that search options such as unsanitized_only reach every search"""
+        sources, sinks, sanitizers = test_data
+        
+        path_analysis_queue = asyncio.Queue()
+        orchestrator = Orchestrator(
+            source_queue=asyncio.Queue(),
+            sink_queue=asyncio.Queue(),
+            sanitizer_queue=asyncio.Queue(),
+            graph=mock_graph,
+            path_analysis_queue=path_analysis_queue,
+            search_options={"unsanitized_only": True}
+        )
+        orchestrator.sanitizer_log.append(sanitizers[0], "node_3")
+        
+        await orchestrator._create_search_task(sources[0], sinks[0])
+        
+        # Only the path through node_2 avoids the sanitizer on node_3
+        assert path_analysis_queue.qsize() == 1
+        path_info = await path_analysis_queue.get()
+        assert path_info["path"] == ["node_1", "node_2", "node_4", "node_5"]
+        assert path_info["goes_through_sanitizer"] is False
+    
+    @pytest.mark.asyncio
+    async def test_compact_chains(self, mock_graph, test_data):
+        """Test that searches run on the collapsed view and still report every node"""
+        from Graphs.Compaction import ChainCompaction
+        sources, sinks, sanitizers = test_data
+        
+        path_analysis_queue = asyncio.Queue()
+        orchestrator = Orchestrator(
+            source_queue=asyncio.Queue(),
+            sink_queue=asyncio.Queue(),
+            sanitizer_queue=asyncio.Queue(),
+            graph=mock_graph,
+            path_analysis_queue=path_analysis_queue,
+            compact_chains=True
+        )
+        assert isinstance(orchestrator.graph, ChainCompaction)
+        
+        await orchestrator._create_search_task(sources[1], sinks[0])
+        
+        path_info = await path_analysis_queue.get()
+        assert path_info["path"] == ["node_2", "node_4", "node_5"]
+        
+        # The search's source is a chain node (one edge in, one out) and was kept visible
+        assert orchestrator.get_stats()["compaction"] == {"chain_nodes": 2, "super_edges": 0, "protected": 2}
+    
+    @pytest.mark.asyncio
+    async def test_strategy_budgets(self, mock_graph, test_data):
+        """Test that a strategy configuration's own budgets apply to that strategy only"""
+        sources, sinks, sanitizers = test_data
+        
+        path_analysis_queue = asyncio.Queue()
+        orchestrator = Orchestrator(
+            source_queue=asyncio.Queue(),
+            sink_queue=asyncio.Queue(),
+            sanitizer_queue=asyncio.Queue(),
+            graph=mock_graph,
+            path_analysis_queue=path_analysis_queue,
+            strategies=[StrategyConfig(DepthFirstSearch, max_paths=1), BreadthFirstSearch],
+            search_options={"max_paths": 5}
+        )
+        
+        await orchestrator._create_search_task(sources[0], sinks[0])
+        
+        counts = orchestrator.get_stats()["paths"]["strategies"]
+        assert counts["DFS"]["unique"] + counts["DFS"]["duplicates"] == 1
+        assert counts["BFS"]["unique"] + counts["BFS"]["duplicates"] == 2
+        assert path_analysis_queue.qsize() == 2
+    
+    @pytest.mark.asyncio
+    async def test_race_cancels_on_witness(self, mock_graph, test_data):
+        """Test that racing cancels the other searches once one finds a witness, and the winner carries on"""
+        sources, sinks, sanitizers = test_data
+        
+        path_analysis_queue = asyncio.Queue()
+        orchestrator = Orchestrator(
+            source_queue=asyncio.Queue(),
+            sink_queue=asyncio.Queue(),
+            sanitizer_queue=asyncio.Queue(),
+            graph=mock_graph,
+            path_analysis_queue=path_analysis_queue,
+            strategies=[StallingSearch, DepthFirstSearch],
+            race=True
+        )
+        
+        await asyncio.wait_for(orchestrator._create_search_task(sources[0], sinks[0]), timeout=5)
+        
+        # Both paths come from the winner, the stalling search was cancelled
+        assert path_analysis_queue.qsize() == 2
+        assert orchestrator.get_stats()["race"] == {"wins": {"DFS": 1}, "cancelled": 1}
+    
+    @pytest.mark.asyncio
+    async def test_race_settled_by_proof(self, mock_graph, test_data):
+        """Test that a search finishing without finding anything settles a raced pair"""
+        sources, sinks, sanitizers = test_data
+        
+        path_analysis_queue = asyncio.Queue()
+        orchestrator = Orchestrator(
+            source_queue=asyncio.Queue(),
+            sink_queue=asyncio.Queue(),
+            sanitizer_queue=asyncio.Queue(),
+            graph=mock_graph,
+            path_analysis_queue=path_analysis_queue,
+            strategies=[StallingSearch, StrategyConfig(BreadthFirstSearch, time_budget=1.0)],
+            race=True
+        )
+        
+        # node_5 has no outgoing edges, so nothing reaches node_1
+        await asyncio.wait_for(orchestrator._create_search_task(
+            {"line_number": 50, "file": "test.py"}, {"line_number": 10, "file": "test.py"}), timeout=5)
+        
+        assert path_analysis_queue.empty()
+        assert orchestrator.get_stats()["race"] == {"wins": {"BFS(time_budget=1.0)": 1}, "cancelled": 1}
+    
+    @pytest.mark.asyncio
+    async def test_end_of_stream_completes(self, mock_graph, test_data):
+        """Test that the orchestrator returns by itself once every detector stream has ended and ends the path stream"""
+        from Detectors import EndOfStream
+        sources, sinks, sanitizers = test_data
+        
+        source_queue = asyncio.Queue()
+        sink_queue = asyncio.Queue()
+        sanitizer_queue = asyncio.Queue()
+        path_analysis_queue = asyncio.Queue()
+        
+        orchestrator = Orchestrator(
+            source_queue=source_queue,
+            sink_queue=sink_queue,
+            sanitizer_queue=sanitizer_queue,
+            graph=mock_graph,
+            path_analysis_queue=path_analysis_queue
+        )
+        
+        await source_queue.put(sources[0])
+        await source_queue.put(EndOfStream("sources", 0.0))
+        await sink_queue.put(sinks[0])
+        await sink_queue.put(EndOfStream("sinks", 0.0))
+        await sanitizer_queue.put(EndOfStream("sanitizers", 0.0))
+        
+        await asyncio.wait_for(orchestrator.start(), timeout=5)
+        
+        results = []
+        while not path_analysis_queue.empty():
+            results.append(path_analysis_queue.get_nowait())
+        
+        # Both paths, then the marker with the number of unique paths
+        assert len(results) == 3
+        assert all(isinstance(r, dict) for r in results[:2])
+        assert isinstance(results[-1], EndOfStream)
+        assert results[-1].stage == "paths"
+        assert results[-1].items == 2
+        
+        streams = orchestrator.get_stats()["streams"]
+        assert set(streams) == {"sources", "sinks", "sanitizers"}
+        assert streams["sources"]["items"] == 1
+        assert streams["sanitizers"]["items"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_breadth_first_search_alongside_dfs(self, mock_graph, test_data):
+        """Test that orchestrator runs every configured search strategy for a pair"""
+        sources, sinks, sanitizers = test_data
+        
+        source_queue = asyncio.Queue()
+        sink_queue = asyncio.Queue()
+        sanitizer_queue = asyncio.Queue()
+        path_analysis_queue = asyncio.Queue()
+        
+        orchestrator = Orchestrator(
+            source_queue=source_queue,
+            sink_queue=sink_queue,
+            sanitizer_queue=sanitizer_queue,
+            graph=mock_graph,
+            path_analysis_queue=path_analysis_queue,
+            strategies=[DepthFirstSearch, BreadthFirstSearch]
+        )
+        
+        await source_queue.put(sources[0])  # line 10 -> node_1
+        await sink_queue.put(sinks[0])      # line 50 -> node_5
+        
+        start_task = asyncio.create_task(orchestrator.start())
+        await asyncio.sleep(0.2)
+        orchestrator.stop()
+        await start_task
+        
+        results = []
+        while not path_analysis_queue.empty():
+            results.append(await path_analysis_queue.get())
+        
+        # Both strategies find the two paths through node_2 and node_3, each is queued once
+        assert len(results) == 2
+        assert all(r["path"][0] == "node_1" and r["path"][-1] == "node_5" for r in results)
+        assert len({r["fingerprint"] for r in results}) == 2
+        assert len(orchestrator.tested_pairs) == 1
+        
+        paths = orchestrator.get_stats()["paths"]
+        assert paths["unique"] == 2
+        counts = paths["strategies"]
+        assert counts["DFS"]["unique"] + counts["BFS"]["unique"] == 2
+        assert counts["DFS"]["duplicates"] + counts["BFS"]["duplicates"] == 2
+
+    
+    @pytest.mark.asyncio
+    async def test_incremental_pairing(self, mock_graph, test_data):
+        """Test that new detections are paired only with the opposite side already known"""
+        sources, sinks, sanitizers = test_data
+        
+        orchestrator = Orchestrator(
+            source_queue=asyncio.Queue(),
+            sink_queue=asyncio.Queue(),
+            sanitizer_queue=asyncio.Queue(),
+            graph=mock_graph,
+            path_analysis_queue=asyncio.Queue()
+        )
+        
+        pairs_started = []
+        
+        async def record_search(source, sink):
+            pairs_started.append((source["line_number"], sink["line_number"]))
+        
+        orchestrator._create_search_task = record_search
+        orchestrator.scheduler.start()
+        
+        # A sink with no sources yet creates nothing
+        orchestrator._add_sink(sinks[0])
+        await orchestrator.scheduler.join()
+        assert pairs_started == []
+        
+        # Each arrival pairs only with what is already known
+        orchestrator._add_source(sources[0])
+        orchestrator._add_source(sources[1])
+        orchestrator._add_sink(sinks[1])
+        await orchestrator.scheduler.join()
+        assert sorted(pairs_started) == [(10, 40), (10, 50), (20, 40), (20, 50)]
+        
+        # Repeated detections are ignored
+        orchestrator._add_source(sources[0])
+        orchestrator._add_sink(sinks[1])
+        await orchestrator.scheduler.join()
+        await orchestrator.scheduler.stop()
+        assert len(pairs_started) == 4
+        assert len(orchestrator.sources_available) == 2
+        assert len(orchestrator.sinks_available) == 2
+
+    
+    @pytest.mark.asyncio
+    async def test_scheduler_priority_and_concurrency(self, mock_graph):
+        """Test that pairs run highest priority first with bounded concurrency"""
+        orchestrator = Orchestrator(
+            source_queue=asyncio.Queue(),
+            sink_queue=asyncio.Queue(),
+            sanitizer_queue=asyncio.Queue(),
+            graph=mock_graph,
+            path_analysis_queue=asyncio.Queue(),
+            max_concurrent_searches=1
+        )
+        
+        order = []
+        
+        async def record_search(source, sink):
+            order.append(sink["name"])
+            await asyncio.sleep(0)
+        
+        orchestrator._create_search_task = record_search
+        
+        # Queue every pair before any worker runs
+        orchestrator._add_source({"line_number": 10, "file": "a.c", "confidence": 0.5})
+        orchestrator._add_sink({"line_number": 20, "file": "a.c", "name": "low", "confidence": 0.1})
+        orchestrator._add_sink({"line_number": 30, "file": "a.c", "name": "severe", "confidence": 0.1, "severity": "ERROR"})
+        orchestrator._add_sink({"line_number": 40, "file": "a.c", "name": "high", "confidence": 0.9})
+        
+        assert orchestrator.get_stats()["queued"] == 3
+        
+        orchestrator.scheduler.start()
+        await orchestrator.scheduler.join()
+        await orchestrator.scheduler.stop()
+        
+        assert order == ["severe", "high", "low"]
+        
+        stats = orchestrator.get_stats()
+        assert stats["queued"] == 0
+        assert stats["completed"] == 3
+        assert stats["running"] == 0
+        assert stats["pairs"] == 3
+
+    
+    def test_pair_priority_confidence_levels(self, mock_graph):
+        """Test that confidences given as levels are weighted instead of failing the priority"""
+        orchestrator = Orchestrator(
+            source_queue=asyncio.Queue(),
+            sink_queue=asyncio.Queue(),
+            sanitizer_queue=asyncio.Queue(),
+            graph=mock_graph,
+            path_analysis_queue=asyncio.Queue()
+        )
+        source = {"line_number": 10, "confidence": 0.5}
+        
+        def priority(confidence):
+            return orchestrator._get_pair_priority(source, {"line_number": 20, "confidence": confidence})
+        
+        assert priority("high") > priority("medium") > priority("low")
+        assert priority("HIGH") == priority("high")
+        assert priority("0.7") == priority(0.7)
+        assert priority("unknown") == priority(None) == priority(0.5) == 1.0
+
+    
+    @pytest.mark.asyncio
+    async def test_process_pool_backend(self, mock_graph, test_data):
+        """Test that searches offloaded to worker processes still reach the path queue"""
+        sources, sinks, sanitizers = test_data
+        
+        source_queue = asyncio.Queue()
+        sink_queue = asyncio.Queue()
+        sanitizer_queue = asyncio.Queue()
+        path_analysis_queue = asyncio.Queue()
+        
+        orchestrator = Orchestrator(
+            source_queue=source_queue,
+            sink_queue=sink_queue,
+            sanitizer_queue=sanitizer_queue,
+            graph=mock_graph,
+            path_analysis_queue=path_analysis_queue,
+            workers=2
+        )
+        
+        await sanitizer_queue.put(sanitizers[0])
+        await asyncio.sleep(0)
+        
+        start_task = asyncio.create_task(orchestrator.start())
+        await asyncio.sleep(0.1)
+        await source_queue.put(sources[0])  # line 10 -> node_1
+        await sink_queue.put(sinks[0])      # line 50 -> node_5
+        
+        # Worker processes take a moment to start
+        for _ in range(50):
+            if path_analysis_queue.qsize() >= 2:
+                break
+            await asyncio.sleep(0.1)
+        
+        snapshot_path = orchestrator.backend.snapshot_path
+        orchestrator.stop()
+        await start_task
+        
+        results = []
+        while not path_analysis_queue.empty():
+            results.append(await path_analysis_queue.get())
+        
+        assert sorted(r["path"] for r in results) == [
+            ["node_1", "node_2", "node_4", "node_5"],
+            ["node_1", "node_3", "node_4", "node_5"]
+        ]
+        assert any(r["sanitizers_crossed"] == ["node_3"] for r in results)
+        
+        # The pool and its graph snapshot are cleaned up on stop
+        assert orchestrator.backend.executor is None
+        assert not os.path.exists(snapshot_path)
+    
+    @pytest.mark.asyncio
+    async def test_process_pool_streams_paths(self):
+        """Test that worker paths arrive while the search still runs, and closing does not wait for it"""
+        # A ladder with 2^20 paths from n_0 to n_40, far more than the test waits for
+        edges = {f"n_{i}": [f"n_{i + 1}", f"n_{i + 2}"] for i in range(0, 40, 2)}
+        edges.update({f"n_{i}": [f"n_{i + 1}"] for i in range(1, 40, 2)})
+        graph = MagicMock()
+        graph.nodes = {f"n_{i}": {"line": i + 1} for i in range(41)}
+        graph.get_neighbors = lambda node: edges.get(node, [])
+        
+        backend = ProcessPoolBackend(graph, max_workers=1)
+        backend.start()
+        queue = asyncio.Queue()
+        search = DepthFirstSearch(
+            source={"line_number": 1},
+            sink={"line_number": 41},
+            sanitizers=[],
+            graph=graph,
+            path_analysis_queue=queue
+        )
+        
+        task = asyncio.create_task(backend.run(search))
+        try:
+            for _ in range(100):
+                if not queue.empty():
+                    break
+                await asyncio.sleep(0.1)
+            
+            assert not queue.empty()
+            assert not task.done()
+            first = queue.get_nowait()
+            assert first["path"][0] == "n_0" and first["path"][-1] == "n_40"
+        finally:
+            task.cancel()
+            pids = [pid for pid in backend.worker_pids if pid]
+            assert len(pids) == 1
+            started = time.monotonic()
+            backend.close()
+            assert time.monotonic() - started < 2
+        
+        for _ in range(50):
+            if not any(child.pid in pids for child in multiprocessing.active_children()):
+                break
+            time.sleep(0.1)
+        assert not any(child.pid in pids for child in multiprocessing.active_children())
+
 
 if __name__ == "__main__":
     # Ensure parent directory (project root) is on sys.path for imports like `from Detectors ...`
@@ -0,0 +1,277 @@
+import pytest
+import sys
+import os
+import asyncio
+import random
+import tracemalloc
+
+
+# Ensure parent directory is on sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Here you can do imports for local files
+from Paths.PathStore import PathStore, path_fingerprint
+
+
+class TestPathStore:
+    """Test suite for path fingerprints and cross-strategy deduplication"""
+    
+    @pytest.fixture
+    def path_info(self):
+        """Sample path information as emitted by a search"""
+        return {
+            "source": {"line_number": 10, "filename": "/test/a.c", "confidence": 0.8},
+            "sink": {"line_number": 50, "filename": "/test/a.c", "confidence": 0.9},
+            "path": ["node_1", "node_3", "node_5"],
+            "goes_through_sanitizer": False,
+            "sanitizers_crossed": [],
+            "strategy": "DFS"
+        }
+    
+    def test_fingerprint_is_stable(self, path_info):
+        """Test that the fingerprint depends only on source, sink and node sequence"""
+        other = dict(path_info)
+        other["strategy"] = "BFS"
+        other["source"] = dict(path_info["source"], confidence=0.1)
+        
+        assert path_fingerprint(path_info) == path_fingerprint(other)
+        assert path_fingerprint(path_info) == path_fingerprint(dict(path_info))
+    
+    def test_fingerprint_distinguishes_paths(self, path_info):
+        """Test that different node sequences or endpoints give different fingerprints"""
+        reordered = dict(path_info, path=["node_1", "node_5", "node_3"])
+        other_sink = dict(path_info, sink={"line_number": 50, "filename": "/test/b.c"})
+        joined = dict(path_info, path=["node_1node_3", "node_5"])
+        
+        fingerprints = {
+            path_fingerprint(path_info),
+            path_fingerprint(reordered),
+            path_fingerprint(other_sink),
+            path_fingerprint(joined)
+        }
+        assert len(fingerprints) == 4
+    
+    @pytest.mark.asyncio
+    async def test_duplicates_dropped(self, path_info):
+        """Test that repeats never reach the queue and are counted per strategy"""
+        queue = asyncio.Queue()
+        store = PathStore(queue)
+        
+        assert await store.put(dict(path_info)) is True
+        assert await store.put(dict(path_info)) is False
+        assert await store.put(dict(path_info, strategy="BFS")) is False
+        assert await store.put(dict(path_info, strategy="BFS", path=["node_1", "node_5"])) is True
+        
+        assert queue.qsize() == 2
+        first = await queue.get()
+        assert first["fingerprint"] == path_fingerprint(path_info)
+        
+        stats = store.stats()
+        assert stats["unique"] == 2
+        assert stats["updates"] == 0
+        assert stats["strategies"] == {
+            "DFS": {"unique": 1, "duplicates": 1},
+            "BFS": {"unique": 1, "duplicates": 1}
+        }
+    
+    @pytest.mark.asyncio
+    async def test_late_sanitizer_updates_sent_paths(self, path_info):
+        """Test that a sanitizer found after a path was sent produces an update for it"""
+        queue = asyncio.Queue()
+        store = PathStore(queue)
+        
+        await store.put(dict(path_info))
+        await store.put(dict(path_info, path=["node_1", "node_5"]))
+        assert queue.qsize() == 2
+        while not queue.empty():
+            await queue.get()
+        
+        # Only the path through node_3 is affected
+        assert await store.add_sanitizer("node_3") == 1
+        update = await queue.get()
+        assert queue.empty()
+        assert update["update"] is True
+        assert update["fingerprint"] == path_fingerprint(path_info)
+        assert update["goes_through_sanitizer"] is True
+        assert update["sanitizers_crossed"] == ["node_3"]
+        
+        # Reporting the same sanitizer again changes nothing
+        assert await store.add_sanitizer("node_3") == 0
+        assert await store.add_sanitizer(None) == 0
+        assert store.stats()["updates"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_known_sanitizer_applied_to_new_paths(self, path_info):
+        """Test that paths from searches started before a sanitizer arrived are corrected on the way in"""
+        queue = asyncio.Queue()
+        store = PathStore(queue)
+        
+        await store.add_sanitizer("node_5")
+        await store.add_sanitizer("node_3")
+        await store.put(dict(path_info))
+        
+        sent = await queue.get()
+        assert "update" not in sent
+        assert sent["goes_through_sanitizer"] is True
+        assert sent["sanitizers_crossed"] == ["node_3", "node_5"]
+    
+    @pytest.mark.asyncio
+    async def test_compact_storage_shares_prefixes(self, path_info):
+        """Test that stored paths share prefixes and detections and are rebuilt intact"""
+        queue = asyncio.Queue()
+        store = PathStore(queue)
+        
+        # Three paths from the same source to the same sink sharing the prefix node_1 -> node_3
+        paths = [
+            ["node_1", "node_3", "node_5"],
+            ["node_1", "node_3", "node_4", "node_5"],
+            ["node_1", "node_2", "node_5"]
+        ]
+        for path in paths:
+            await store.put(dict(path_info, path=path, source=dict(path_info["source"])))
+        
+        stats = store.stats()
+        assert stats["trie_entries"] == 7  # instead of 10 node slots
+        assert stats["detections"] == 2
+        
+        sent = [await queue.get() for _ in paths]
+        assert [message["path"] for message in sent] == paths
+        assert all(message["source"] is sent[0]["source"] for message in sent)
+        assert all(message["strategy"] == "DFS" for message in sent)
+        
+        stored = store.get(sent[1]["fingerprint"])
+        assert stored == sent[1]
+        assert store.get("unknown") is None
+    
+    @pytest.mark.asyncio
+    async def test_compact_storage_memory(self, path_info):
+        """Test that a stored path costs the trie arrays and its record, with no dictionaries per node or record"""
+        rng = random.Random(1)
+        prefix = [f"prefix_{i}" for i in range(10)]
+        messages = [
+            dict(path_info, path=prefix + [f"node_{rng.randrange(5000)}" for _ in range(15)])
+            for _ in range(500)
+        ]
+        
+        # The forwarded messages are dropped so only what the store keeps is measured
+        class DiscardQueue:
+            async def put(self, item):
+                pass
+        
+        store = PathStore(DiscardQueue())
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            for message in messages:
+                await store.put(message)
+            used = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        
+        # About 15 new trie entries per path
+        assert store.stats()["trie_entries"] > 500 * 14
+        assert used / len(messages) < 1500  # was about 3000 bytes with a child dictionary and label index per entry
+        assert store.record_extras.count(None) == len(messages)
+        
+        # The label index is only built when a sanitizer is looked up
+        assert store.trie._by_label is None
+        assert len(store.trie.entries_with("prefix_3")) == 1
+    
+    @pytest.mark.asyncio
+    async def test_sanitizer_update_reaches_paths_below_prefix(self, path_info):
+        """Test that a sanitizer on a shared prefix updates every path extending it"""
+        queue = asyncio.Queue()
+        store = PathStore(queue)
+        
+        for path in (["node_1", "node_3", "node_5"], ["node_1", "node_3", "node_4", "node_5"], ["node_1", "node_5"]):
+            await store.put(dict(path_info, path=path))
+        while not queue.empty():
+            await queue.get()
+        
+        assert await store.add_sanitizer("node_3") == 2
+        updates = [await queue.get() for _ in range(2)]
+        assert {tuple(u["path"]) for u in updates} == {
+            ("node_1", "node_3", "node_5"), ("node_1", "node_3", "node_4", "node_5")
+        }
+        assert all(u["sanitizers_crossed"] == ["node_3"] for u in updates)
+
+    
+    @pytest.mark.asyncio
+    async def test_late_sanitizer_makes_verdict_stale(self, path_info):
+        """Test that a sanitizer on a verdict's witness marks the verdict stale until the pair is checked again"""
+        queue = asyncio.Queue()
+        store = PathStore(queue)
+        verdict = dict(path_info, kind="verdict", verdict="unsanitized", sanitizer_cut=[], dominating_sanitizers=[])
+        
+        await store.put(dict(path_info))
+        await store.put(dict(verdict))
+        assert queue.qsize() == 2
+        while not queue.empty():
+            await queue.get()
+        
+        assert await store.add_sanitizer("node_3") == 2
+        updates = {u.get("kind"): u for u in [await queue.get() for _ in range(2)]}
+        assert updates["verdict"]["verdict"] == "stale"
+        assert updates["verdict"]["sanitizer_cut"] is None
+        assert updates["verdict"]["dominating_sanitizers"] is None
+        assert "verdict" not in updates[None]
+        
+        # The pair is handed out once, and the verdict checked again replaces the stale one
+        source, sink = store.take_stale_verdicts()[0]
+        assert sink["line_number"] == 50
+        assert store.take_stale_verdicts() == []
+        
+        checked = dict(verdict, verdict="sanitized", goes_through_sanitizer=True, sanitizers_crossed=["node_3"],
+                       sanitizer_cut=["node_3"], dominating_sanitizers=["node_3"])
+        assert await store.put(dict(checked)) is True
+        sent = await queue.get()
+        assert sent["verdict"] == "sanitized"
+        assert await store.put(dict(checked)) is False
+        assert store.take_stale_verdicts() == []
+    
+    @pytest.mark.asyncio
+    async def test_rechecked_verdict_replaces_stale_record(self, path_info):
+        """Test that a verdict checked again with another witness replaces the stale record, and an unfinished check settles it"""
+        queue = asyncio.Queue()
+        store = PathStore(queue)
+        verdict = dict(path_info, kind="verdict", verdict="unsanitized", sanitizer_cut=[], dominating_sanitizers=[])
+        
+        await store.put(dict(verdict))
+        first = await queue.get()
+        await store.add_sanitizer("node_3")
+        assert (await queue.get())["verdict"] == "stale"
+        assert len(store.take_stale_verdicts()) == 1
+        
+        # The new witness avoids node_3; the old one is no longer stored
+        rechecked = dict(verdict, path=["node_1", "node_4", "node_5"])
+        assert await store.put(dict(rechecked)) is True
+        sent = await queue.get()
+        assert sent["update"] is True
+        assert sent["fingerprint"] == first["fingerprint"]
+        assert sent["path"] == ["node_1", "node_4", "node_5"]
+        assert store.stats()["unique"] == 1
+        assert await store.settle_verdict(path_info["source"], path_info["sink"]) is False
+        
+        # A check cut short leaves the verdict unknown rather than stale for good
+        await store.add_sanitizer("node_4")
+        assert (await queue.get())["verdict"] == "stale"
+        store.take_stale_verdicts()
+        assert await store.settle_verdict(path_info["source"], path_info["sink"]) is True
+        settled = await queue.get()
+        assert settled["verdict"] == "unknown"
+        assert settled["update"] is True
+        assert queue.empty()
+
+
+if __name__ == "__main__":
+    # Ensure parent directory (project root) is on sys.path for imports like `from Detectors ...`
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    
+    # Run just this test module when executed directly
+    raise SystemExit(pytest.main([os.path.abspath(__file__)]))
@@ -0,0 +1,133 @@
+import pytest
+import sys
+import os
+
+
+# Ensure parent directory is on sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Here you can do imports for local files
+from Tests.helpers import make_graph
+from Paths.ReachabilityMemo import ReachabilityMemo
+from Paths.DepthFirstSearch import DepthFirstSearch
+from Paths.BreadthFirstSearch import BreadthFirstSearch
+from Paths.ChopSearch import ChopSearch
+
+
+class TestReachabilityMemo:
+    """Test suite for the shared reachability memo"""
+    
+    def create_search(self, strategy, graph, source_line, sink_line, memo, **kwargs):
+        """Create a search between two lines sharing the given memo"""
+        return strategy(
+            source={"line_number": source_line},
+            sink={"line_number": sink_line},
+            sanitizers=[],
+            graph=graph,
+            path_analysis_queue=None,
+            reach_memo=memo,
+            **kwargs
+        )
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used facts go first once the cap is reached"""
+        memo = ReachabilityMemo(max_entries=2)
+        memo.record("a", "t", True)
+        memo.record("b", "t", False)
+        assert memo.get("a", "t") is True
+        
+        memo.record("c", "t", False)
+        
+        assert memo.get("b", "t") is None
+        assert memo.get("a", "t") is True
+        assert memo.get("c", "t") is False
+        assert memo.stats() == {"entries": 2, "hits": 3, "misses": 1, "evictions": 1}
+        
+        with pytest.raises(ValueError):
+            ReachabilityMemo(max_entries=0)
+    
+    def test_dfs_records_only_sound_facts(self):
+        """Test that a node cut short by a cycle through an ancestor is not recorded as a dead end"""
+        graph = make_graph({
+            "n_1": ["n_2"],
+            "n_2": ["n_3", "n_4", "n_9"],
+            "n_3": ["n_2"],
+            "n_4": ["n_5"]
+        })
+        memo = ReachabilityMemo()
+        search = self.create_search(DepthFirstSearch, graph, 1, 9, memo)
+        
+        assert list(search.iter_paths()) == [["n_1", "n_2", "n_9"]]
+        
+        assert memo.get("n_2", "n_9") is True
+        assert memo.get("n_1", "n_9") is True
+        assert memo.get("n_4", "n_9") is False
+        assert memo.get("n_5", "n_9") is False
+        # n_3 reaches n_9 through n_2, which was on the path when n_3 was explored
+        assert memo.get("n_3", "n_9") is None
+    
+    def test_max_depth_prevents_dead_end_facts(self):
+        """Test that subtrees cut by the depth limit are not recorded as unreachable"""
+        graph = make_graph({"n_1": ["n_2"], "n_2": ["n_3"], "n_3": ["n_9"]})
+        memo = ReachabilityMemo()
+        search = self.create_search(DepthFirstSearch, graph, 1, 9, memo, max_depth=2)
+        
+        assert list(search.iter_paths()) == []
+        assert len(memo) == 0
+    
+    def test_later_searches_skip_dead_ends(self):
+        """Test that a second source reuses what the first learned about a shared helper region"""
+        edges = {
+            "n_1": ["n_50", "n_9"],
+            "n_2": ["n_50", "n_9"],
+            "n_50": ["n_51", "n_52"],
+            "n_51": ["n_53"],
+            "n_52": ["n_53"],
+            "n_53": []
+        }
+        graph = make_graph(edges)
+        memo = ReachabilityMemo()
+        
+        for strategy in (DepthFirstSearch, BreadthFirstSearch):
+            first = self.create_search(strategy, graph, 1, 9, memo)
+            assert list(first.iter_paths()) == [["n_1", "n_9"]]
+            
+            graph.calls.clear()
+            second = self.create_search(strategy, graph, 2, 9, memo)
+            assert list(second.iter_paths()) == [["n_2", "n_9"]]
+            assert graph.calls == ["n_2"]
+    
+    def test_chop_populates_memo(self):
+        """Test that the chop settles every forward reachable node for its target"""
+        graph = make_graph({"n_1": ["n_2", "n_3"], "n_2": ["n_9"], "n_3": ["n_4"]})
+        memo = ReachabilityMemo()
+        
+        list(self.create_search(ChopSearch, graph, 1, 9, memo).iter_paths())
+        
+        assert {node: memo.get(node, "n_9") for node in ("n_1", "n_2", "n_3", "n_4", "n_9")} == {
+            "n_1": True, "n_2": True, "n_3": False, "n_4": False, "n_9": True
+        }
+    
+    def test_unsanitized_only_ignores_memo(self):
+        """Test that searches with sanitizer barriers neither read nor write the memo"""
+        graph = make_graph({"n_1": ["n_2"], "n_2": []})
+        memo = ReachabilityMemo()
+        search = self.create_search(DepthFirstSearch, graph, 1, 9, memo, unsanitized_only=True)
+        
+        assert search.reach_memo is None
+        list(search.iter_paths())
+        assert len(memo) == 0
+
+
+if __name__ == "__main__":
+    # Ensure parent directory (project root) is on sys.path for imports like `from Detectors ...`
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    
+    # Run just this test module when executed directly
+    raise SystemExit(pytest.main([os.path.abspath(__file__)]))
@@ -0,0 +1,98 @@
+import pytest
+import sys
+import os
+import pickle
+import asyncio
+from unittest.mock import MagicMock
+
+
+# Ensure parent directory is on sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Here you can do imports for local files
+from Paths.SanitizerLog import SanitizerLog, SanitizerView
+from Paths.DepthFirstSearch import DepthFirstSearch
+
+
+class TestSanitizerLog:
+    """Test suite for the append-only sanitizer log"""
+    
+    @pytest.fixture
+    def log(self):
+        """Log with two resolved sanitizers and one outside the graph"""
+        log = SanitizerLog()
+        log.append({"line_number": 30, "file": "test.py"}, "node_3")
+        log.append({"line_number": 99, "file": "test.py"}, None)
+        log.append({"line_number": 40, "file": "test.py"}, "node_4")
+        return log
+    
+    def test_view_pinned_at_version(self, log):
+        """Test that a view only sees the sanitizers known when it was taken"""
+        early = log.view(1)
+        current = log.view()
+        
+        assert current.version == 3
+        assert "node_3" in early and "node_3" in current
+        assert "node_4" not in early and "node_4" in current
+        assert None not in current
+        
+        # Appending later does not change existing views
+        log.append({"line_number": 50, "file": "test.py"}, "node_5")
+        assert "node_5" not in current
+        assert "node_5" in log.view()
+        assert [san["line_number"] for san in early] == [30]
+        assert len(current) == 3
+    
+    def test_repeated_node_keeps_first_version(self, log):
+        """Test that a node reported twice belongs to views from its first report on"""
+        log.append({"line_number": 30, "file": "other.py"}, "node_3")
+        assert "node_3" in log.view(1)
+        assert log.first_seen["node_3"] == 0
+    
+    def test_pickled_view_keeps_visible_entries_only(self, log):
+        """Test that a view sent to a worker process carries only what it can see"""
+        view = pickle.loads(pickle.dumps(log.view(1)))
+        
+        assert isinstance(view, SanitizerView)
+        assert len(view.log) == 1
+        assert "node_3" in view
+        assert "node_4" not in view
+    
+    def test_search_uses_view_without_resolving(self, log):
+        """Test that a search given a view checks membership against it directly"""
+        graph = MagicMock()
+        graph.nodes = {
+            "node_1": {"line": 10},
+            "node_3": {"line": 30},
+            "node_4": {"line": 40},
+            "node_5": {"line": 50},
+        }
+        connections = {"node_1": ["node_3"], "node_3": ["node_4"], "node_4": ["node_5"], "node_5": []}
+        graph.get_neighbors = lambda node_id: connections.get(node_id, [])
+        
+        view = log.view(1)
+        dfs = DepthFirstSearch(
+            source={"line_number": 10},
+            sink={"line_number": 50},
+            sanitizers=view,
+            graph=graph,
+            path_analysis_queue=asyncio.Queue()
+        )
+        
+        assert dfs.sanitizer_nodes is view
+        path = list(dfs.iter_paths())[0]
+        assert dfs._build_path_info(path)["sanitizers_crossed"] == ["node_3"]
+
+
+if __name__ == "__main__":
+    # Ensure parent directory (project root) is on sys.path for imports like `from Detectors ...`
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    
+    # Run just this test module when executed directly
+    raise SystemExit(pytest.main([os.path.abspath(__file__)]))
@@ -0,0 +1,73 @@
+import pytest
+import sys
+import os
+
+
+# Ensure parent directory is on sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Here you can do imports for local files
+from Paths.StrategyRegistry import STRATEGIES, StrategyConfig, register_strategy, get_strategy
+from Paths.DepthFirstSearch import DepthFirstSearch
+from Paths.BreadthFirstSearch import BreadthFirstSearch
+
+
+class TestStrategyRegistry:
+    """Test suite for the strategy registry and strategy configurations"""
+    
+    def test_builtin_strategies(self):
+        """Test that the built-in strategies are registered under their command line keys"""
+        assert get_strategy("dfs") is DepthFirstSearch
+        assert get_strategy("bfs") is BreadthFirstSearch
+        assert {"bidirectional", "multi-source", "dominators", "chop", "context", "best-first"} <= set(STRATEGIES)
+        
+        with pytest.raises(ValueError):
+            get_strategy("unknown")
+    
+    def test_register_strategy(self):
+        """Test that new engines can be registered once per key"""
+        class CustomSearch(DepthFirstSearch):
+            name = "CUSTOM"
+        
+        try:
+            register_strategy("custom", CustomSearch)
+            register_strategy("custom", CustomSearch)
+            assert StrategyConfig.parse("custom").strategy is CustomSearch
+            
+            with pytest.raises(ValueError):
+                register_strategy("custom", BreadthFirstSearch)
+            with pytest.raises(TypeError):
+                register_strategy("other", object)
+        finally:
+            STRATEGIES.pop("custom", None)
+    
+    def test_parse_budgets(self):
+        """Test that configuration strings give each strategy its own budgets"""
+        config = StrategyConfig.parse("dfs:time=2.5, paths=10,depth=40")
+        assert config.strategy is DepthFirstSearch
+        assert config.options == {"time_budget": 2.5, "max_paths": 10, "max_depth": 40}
+        assert config.name == "DFS(max_depth=40, max_paths=10, time_budget=2.5)"
+        
+        plain = StrategyConfig.parse("bfs")
+        assert plain.options == {}
+        assert plain.name == "BFS"
+    
+    @pytest.mark.parametrize("spec", ["dfs:speed=2", "dfs:paths=many", "dfs:time=0", "dfs:depth=-1", "nope:time=1"])
+    def test_parse_invalid(self, spec):
+        """Test that unknown strategies, unknown budgets and bad values are rejected"""
+        with pytest.raises(ValueError):
+            StrategyConfig.parse(spec)
+
+
+if __name__ == "__main__":
+    # Ensure parent directory (project root) is on sys.path for imports like `from Detectors ...`
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    
+    # Run just this test module when executed directly
+    raise SystemExit(pytest.main([os.path.abspath(__file__)]))